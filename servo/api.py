@@ -1,16 +1,29 @@
 from __future__ import annotations
 
 import abc
+import contextlib
 import copy
 from datetime import datetime, timedelta
 import enum
-from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+import gzip
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
 
 import backoff
 import curlify2
 import devtools
 import httpx
+import orjson
 import pydantic
+import pydantic.json
 
 import servo
 import servo.errors
@@ -165,6 +178,41 @@ class CommandResponse(pydantic.BaseModel):
         }
 
 
+GZIP_MIN_BYTES = 16 * 1024
+"""The minimum size in bytes of a request body for gzip compression to be applied."""
+
+
+def encode_request(
+    event: Union[Events, str],
+    param: Optional[Dict[str, Any]],
+    *,
+    compress: bool = False,
+) -> Tuple[bytes, Dict[str, str]]:
+    """Serialize an event request for posting to the Opsani API.
+
+    The request is serialized directly via orjson rather than through a `Request` model
+    to avoid validating and copying large params such as measurement readings again.
+    Measurements are still represented as plain dicts and lists of readings before encoding.
+
+    Args:
+        event: The event being posted.
+        param: The parameters of the event.
+        compress: Whether to gzip compress bodies of at least `GZIP_MIN_BYTES`.
+
+    Returns:
+        A tuple of the request body and the additional headers to send with it.
+    """
+    content = orjson.dumps(
+        {"event": event, "param": param},
+        default=pydantic.json.pydantic_encoder,
+        option=orjson.OPT_NON_STR_KEYS,
+    )
+    if compress and len(content) >= GZIP_MIN_BYTES:
+        return gzip.compress(content, compresslevel=6), {"Content-Encoding": "gzip"}
+
+    return content, {}
+
+
 class Mixin(abc.ABC):
     """Provides functionality for interacting with the Opsani API via httpx.
 
@@ -197,6 +245,33 @@ class Mixin(abc.ABC):
         """Return a synchronous client for interacting with the Opsani API."""
         return httpx.Client(**{**self.api_client_options, **kwargs})
 
+    @property
+    def api_compression(self) -> bool:
+        """Return True if large request bodies sent to the Opsani API are gzip compressed."""
+        return False
+
+    @property
+    def shared_api_client(self) -> Optional[httpx.AsyncClient]:
+        """Return a long-lived asynchronous client shared across API requests.
+
+        Subclasses that manage a pooled client return it here to reuse connections
+        across requests. When None is returned, a client is opened per request.
+        """
+        return None
+
+    @contextlib.asynccontextmanager
+    async def api_client_session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared API client if one is open or a short-lived client otherwise.
+
+        The shared client is not closed on exit as its lifecycle is owned elsewhere.
+        """
+        client = self.shared_api_client
+        if client is not None and not client.is_closed:
+            yield client
+        else:
+            async with self.api_client() as client:
+                yield client
+
     async def report_progress(self, **kwargs) -> None:
         """Post a progress report to the Opsani API."""
         request = self.progress_request(**kwargs)
@@ -281,14 +356,24 @@ class Mixin(abc.ABC):
         giveup=_is_fatal_status_code,
     )
     async def _post_event(self, event: Events, param) -> Union[CommandResponse, Status]:
-        async with self.api_client() as client:
-            event_request = Request(event=event, param=param)
-            self.logger.trace(
-                f"POST event request: {devtools.pformat(event_request.json())}"
+        async with self.api_client_session() as client:
+            content, headers = encode_request(
+                event, param, compress=self.api_compression
             )
+            self.logger.trace(f"POST event request: {event} ({len(content)} bytes)")
 
             try:
-                response = await client.post("servo", data=event_request.json())
+                response = await client.post("servo", content=content, headers=headers)
+                if (
+                    response.status_code == httpx.codes.UNSUPPORTED_MEDIA_TYPE
+                    and "Content-Encoding" in headers
+                ):
+                    self.logger.warning(
+                        f'Opsani API rejected gzip compressed "{event}" event: retrying uncompressed'
+                    )
+                    content, _ = encode_request(event, param)
+                    response = await client.post("servo", content=content)
+
                 response.raise_for_status()
                 response_json = response.json()
                 self.logger.trace(
@@ -345,15 +430,24 @@ def user_agent() -> str:
 
 
 def _redacted_to_curl(request: httpx.Request) -> str:
-    """Pass through to curlify2.to_curl that redacts the authorization in the headers"""
-    if (auth_header := request.headers.get("authorization")) is None:
+    """Pass through to curlify2.to_curl that redacts the authorization in the headers
+
+    Gzip compressed bodies are rendered decompressed.
+    """
+    auth_header = request.headers.get("authorization")
+    compressed = request.headers.get("content-encoding") == "gzip"
+    if auth_header is None and not compressed:
         return curlify2.to_curl(request)
 
     req_copy = copy.copy(request)
     req_copy.headers = copy.deepcopy(request.headers)
-    if "Bearer" in auth_header:
-        req_copy.headers["authorization"] = "Bearer [REDACTED]"
-    else:
-        req_copy.headers["authorization"] = "[REDACTED]"
+    if auth_header is not None:
+        req_copy.headers["authorization"] = (
+            "Bearer [REDACTED]" if "Bearer" in auth_header else "[REDACTED]"
+        )
+
+    if compressed:
+        del req_copy.headers["content-encoding"]
+        req_copy._content = gzip.decompress(request.read())
 
     return curlify2.to_curl(req_copy)
@@ -42,6 +42,7 @@ from timeago import format as timeago
 
 import servo
 import servo.runner
+import servo.tracing
 import servo.utilities.yaml
 import servo.utilities.strings
 
@@ -85,6 +86,15 @@ class VersionOutputFormat(servo.AbstractOutputFormat):
     json = servo.JSON_FORMAT
 
 
+class TraceableEvent(str, enum.Enum):
+    """Events that can be traced from the CLI without changing the state of the optimized application."""
+
+    check = servo.Events.check.value
+    describe = servo.Events.describe.value
+    metrics = servo.Events.metrics.value
+    components = servo.Events.components.value
+
+
 # FIXME: Eliminate the mixin and put our context object onto the Click.obj instance
 class Context(typer.Context):
     """
@@ -1206,6 +1216,12 @@ class ServoCLI(CLI):
                 help="Prevent exception handling on running event loop to allow error propogation",
                 envvar="SERVO_RUN_DEBUG",
             ),
+            processes: bool = typer.Option(
+                False,
+                "--processes",
+                help="Run each servo of a multi-servo assembly in a separate worker process",
+                envvar="SERVO_RUN_PROCESSES",
+            ),
         ) -> None:
             """
             Run the servo
@@ -1217,6 +1233,7 @@ class ServoCLI(CLI):
                     poll=poll,
                     interactive=bool(interactive),
                     debug=debug,
+                    processes=processes,
                 )
 
             if check or dry_run:
@@ -1719,6 +1736,42 @@ class ServoCLI(CLI):
                         typer.echo(f"{servo_.name}")
                     typer.echo(tabulate(table, headers, tablefmt="plain") + "\n")
 
+        @self.command(section=section)
+        def trace(
+            context: Context,
+            event: TraceableEvent = typer.Argument(
+                TraceableEvent.describe,
+                help="The read-only event to dispatch and trace",
+            ),
+            format: servo.tracing.TraceFormat = typer.Option(
+                servo.tracing.TraceFormat.chrome,
+                "--format",
+                "-f",
+                help="Select output format",
+            ),
+            output: typer.FileTextWrite = typer.Option(
+                None, "--output", "-o", help="Output trace to [FILE]"
+            ),
+        ) -> None:
+            """
+            Trace the handling of an event by connectors
+
+            Events that change the optimized application (such as measure and adjust) are not
+            traceable as they would be dispatched outside of the running servo.
+            """
+            servo.tracing.tracer.clear()
+            for servo_ in context.assembly.servos:
+                if context.servo_ and context.servo_ != servo_:
+                    continue
+
+                run_async(servo_.dispatch_event(event.value, return_exceptions=True))
+
+            data = json.dumps(servo.tracing.tracer.export(format), indent=2)
+            if output:
+                output.write(data)
+            else:
+                typer.echo(data)
+
     def add_config_commands(self, section=Section.config) -> None:
         @self.command(section=section)
         def config(
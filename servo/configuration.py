@@ -13,6 +13,8 @@ import yaml
 
 import servo.logging
 import servo.types
+import servo.tracing
+import servo.utilities.executor
 from servo import types
 
 __all__ = [
@@ -407,6 +409,129 @@ class BackoffConfigurations(pydantic.BaseModel):
         return (self.get(context, None) or self.get(BackoffContexts.default)).max_tries
 
 
+class DownsamplingMode(str, enum.Enum):
+    """DownsamplingMode is an enumeration of the methods for reducing the number of data points
+    in a time series.
+
+    Members:
+        lttb: Data points are selected with the Largest-Triangle-Three-Buckets algorithm, preserving
+            the visual shape of the series including its peaks and troughs.
+        mean: Data points are aggregated into evenly sized buckets reported as the mean value at the
+            mean time of each bucket.
+        max: Data points are aggregated into evenly sized buckets reported as the maximum data point
+            of each bucket.
+    """
+
+    lttb = "lttb"
+    mean = "mean"
+    max = "max"
+
+
+class DownsamplingConfiguration(AbstractBaseConfiguration):
+    """
+    DownsamplingConfiguration objects model the reduction of time series measured by connectors
+    to a target number of data points before they are reported to the optimizer.
+    """
+
+    mode: DownsamplingMode = DownsamplingMode.lttb
+    """
+    The method of selecting or aggregating data points.
+    """
+
+    target_points: pydantic.conint(ge=3) = 500
+    """
+    The maximum number of data points to retain in each time series.
+    """
+
+    metrics: Optional[List[str]] = None
+    """
+    The names of the metrics to downsample. When None, all metrics are downsampled.
+    """
+
+
+class ExecutorConfiguration(AbstractBaseConfiguration):
+    """
+    ExecutorConfiguration objects model the shared thread pool that CPU heavy work on large payloads
+    is offloaded to from the event loop.
+    """
+
+    max_workers: Optional[pydantic.conint(ge=1)] = None
+    """
+    The maximum number of worker threads. Defaults to the number of processors plus four, at most 32.
+    """
+
+    threshold: pydantic.ByteSize = pydantic.ByteSize(
+        servo.utilities.executor.DEFAULT_OFFLOAD_THRESHOLD
+    )
+    """
+    The payload size at or above which work is offloaded. Smaller payloads are processed inline.
+    """
+
+
+class MonitorConfiguration(AbstractBaseConfiguration):
+    """
+    MonitorConfiguration objects model the monitoring of the event loop for stalls and leaked tasks.
+    """
+
+    interval: servo.types.Duration = "100ms"
+    """
+    The interval between heartbeats used to measure the lag of the event loop.
+    """
+
+    threshold: servo.types.Duration = "100ms"
+    """
+    The lag at or above which the event loop is considered stalled and the blocking stack is recorded.
+    """
+
+    report_interval: servo.types.Duration = "1m"
+    """
+    The interval between counts of the live tasks and summaries of the event loop lag in the logs.
+    """
+
+    max_stalls: pydantic.conint(ge=1) = 10
+    """
+    The number of slowest stalls to retain for diagnostics.
+    """
+
+
+class TracingConfiguration(AbstractBaseConfiguration):
+    """
+    TracingConfiguration objects model the recording of timing spans of event handling and connector I/O.
+    """
+
+    enabled: bool = True
+    """
+    Whether spans are recorded.
+    """
+
+    max_spans: pydantic.conint(ge=1) = servo.tracing.DEFAULT_MAX_SPANS
+    """
+    The number of most recently completed spans to retain for export.
+    """
+
+
+class SpoolConfiguration(AbstractBaseConfiguration):
+    """
+    SpoolConfiguration objects model the durable local storage of measurement results until they have
+    been acknowledged by the Opsani API.
+    """
+
+    path: pathlib.Path
+    """
+    The path of the SQLite database file backing the spool.
+    """
+
+    max_entries: pydantic.conint(ge=1) = 100
+    """
+    The maximum number of unacknowledged results to retain. The oldest results are evicted first.
+    """
+
+    max_size: pydantic.ByteSize = 256 * 1024 * 1024
+    """
+    The maximum total size of the unacknowledged results to retain. The oldest results are evicted first.
+    """
+
+
 class CommonConfiguration(AbstractBaseConfiguration):
     """CommonConfiguration models configuration for the Servo connector and establishes default
     settings for shared services such as networking and logging.
@@ -451,6 +576,88 @@ class CommonConfiguration(AbstractBaseConfiguration):
     See https://www.python-httpx.org/advanced/#ssl-certificates
     """
 
+    http2: Optional[bool] = None
+    """Enable HTTP/2 on the long-lived client used to communicate with the Opsani API, multiplexing
+    concurrent requests over a single connection.
+
+    Requires the optional `h2` package (installed via `httpx[http2]`). The servo falls back to HTTP/1.1
+    when it is not available.
+
+    See https://www.python-httpx.org/http2/
+    """
+
+    compression: Optional[bool] = None
+    """Gzip compress large request bodies such as measurements sent to the Opsani API.
+
+    Requests rejected by the API with a 415 Unsupported Media Type status are retried uncompressed.
+    """
+
+    downsampling: Optional[List[DownsamplingConfiguration]] = None
+    """Downsampling of the time series measured by connectors before they are aggregated and reported
+    to the Opsani API. The first configuration with `metrics` including a metric, or with `metrics` unset,
+    applies to the time series of that metric.
+    """
+
+    spool: Optional[SpoolConfiguration] = None
+    """Durable local storage of measurement results before they are reported to the Opsani API.
+
+    Results that could not be delivered are replayed once connectivity is restored, including across
+    restarts of the servo. Disabled when not configured.
+    """
+
+    normalization: Optional[servo.types.NormalizationPolicy] = None
+    """The policy for aligning the time series readings of measurements onto a common time grid before
+    they are reported to the Opsani API. Defaults to passing measurements through as is.
+    """
+
+    concurrent_before_handlers: Optional[bool] = None
+    """Run the before event handlers of different connectors concurrently rather than one after another.
+
+    Connectors declare ordering constraints via the `depends_on` argument of `before_event`. Disabled
+    when not configured.
+    """
+
+    deadlines: Optional[Dict[str, servo.types.Duration]] = None
+    """A mapping of event names to the maximum duration to allow connectors to handle the event.
+
+    Handlers still running at the deadline are cancelled and the event fails. The deadline of measure
+    events is extended by the warmup, duration, and delay of the measurement. Events without a configured
+    deadline are not limited.
+    """
+
+    progress_interval: Optional[servo.types.Duration] = None
+    """The minimum interval between progress reports sent to the Opsani API for an operation of a connector.
+
+    Progress logged more frequently is coalesced so that only the latest value is reported. Completed and
+    failed progress is always reported immediately. When not configured, progress is reported as it is logged.
+    """
+
+    executor: Optional[ExecutorConfiguration] = None
+    """The shared thread pool that parsing, serialization, and hashing of large payloads are offloaded to.
+
+    Defaults to the default thread pool size and a 64KiB threshold when not configured.
+    """
+
+    monitor: Optional[MonitorConfiguration] = None
+    """Monitoring of the event loop for stalls and steadily growing numbers of live tasks.
+
+    Measurements are logged and included in diagnostics. Disabled when not configured.
+    """
+
+    tracing: Optional[TracingConfiguration] = None
+    """The recording of timing spans of event handling and connector I/O into a ring buffer for export.
+
+    Enabled with a buffer of 4096 spans when not configured.
+    """
+
+    description_ttl: Optional[servo.types.Duration] = None
+    """The maximum duration to reuse the description of the servo in response to describe commands.
+
+    Cached descriptions are invalidated early on adjustment, on changes to the configuration, and when
+    a connector notifies that the state it describes has changed. Descriptions are not cached when
+    not configured.
+    """
+
     @pydantic.validator("timeouts", pre=True)
     def parse_timeouts(cls, v):
         if isinstance(v, (str, int, float)):
@@ -633,6 +840,16 @@ class BaseServoConfiguration(AbstractBaseConfiguration, abc.ABC):
         env_prefix = "SERVO_"
 
 
+class FastFailMode(str, enum.Enum):
+    """An enumeration of strategies for gathering SLO metrics during fast fail observation."""
+
+    poll = "poll"
+    """SLO metrics are queried from the metrics provider every `period`."""
+
+    push = "push"
+    """SLO metrics are evaluated as they are published to pub/sub channels."""
+
+
 class FastFailConfiguration(pydantic.BaseSettings):
     """Configuration providing support for fast fail behavior which returns early
     from long running connector operations when SLO violations are observed"""
@@ -640,6 +857,9 @@ class FastFailConfiguration(pydantic.BaseSettings):
     disabled: pydantic.conint(ge=0, le=1, multiple_of=1) = 0
     """Toggle fast-fail behavior on or off"""
 
+    mode: FastFailMode = FastFailMode.poll
+    """Whether SLO metrics are polled every period or pushed via pub/sub as they are published"""
+
     period: servo.types.Duration = "60s"
     """How often to check the SLO metrics"""
 
@@ -660,3 +880,32 @@ class FastFailConfiguration(pydantic.BaseSettings):
         if v is None:
             return values["period"]
         return v
+
+
+class ConvergenceConfiguration(pydantic.BaseSettings):
+    """Configuration providing support for completing measurements early once the
+    measured metrics have converged to a steady state"""
+
+    enabled: bool = False
+    """Toggle early completion of measurements on convergence on or off"""
+
+    metrics: Optional[List[str]] = None
+    """The names of the metrics that must converge. When None, all measured metrics are considered"""
+
+    confidence: pydantic.confloat(gt=0, lt=1) = 0.95
+    """The confidence level of the interval estimated around the mean of each metric"""
+
+    relative_width: pydantic.confloat(gt=0) = 0.05
+    """The maximum width of the confidence interval relative to the mean for a metric to be considered converged"""
+
+    min_samples: pydantic.conint(ge=2) = 10
+    """The minimum number of samples of a metric required before evaluating convergence"""
+
+    stable_for: servo.types.Duration = "1m"
+    """How long the metrics must remain converged before the measurement is completed"""
+
+    period: servo.types.Duration = "15s"
+    """How often to check the metrics for convergence when polling the metrics provider"""
+
+    class Config:
+        extra = pydantic.Extra.forbid
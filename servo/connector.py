@@ -39,6 +39,7 @@ from servo.types import *
 
 __all__ = [
     "BaseConnector",
+    "DESCRIPTION_CHANGED_CHANNEL",
     "current_connector",
     "metadata",
 ]
@@ -57,6 +58,9 @@ def current_connector() -> Optional["BaseConnector"]:
 
 _connector_subclasses: Set[Type["BaseConnector"]] = set()
 
+DESCRIPTION_CHANGED_CHANNEL = "servo.description.changed"
+"""The name of the pub/sub channel notified when the state described by a connector has changed."""
+
 
 # NOTE: Initialize mixins first to control initialization graph
 class BaseConnector(
@@ -240,6 +244,32 @@ class BaseConnector(
             "verify": self._global_config.ssl_verify,
         }
 
+    @property
+    def api_compression(self) -> bool:  # noqa: D105
+        return bool(self._global_config.compression)
+
+    async def notify_description_changed(self, reason: Optional[str] = None) -> None:
+        """Notify the servo that the state described by the connector has changed.
+
+        Connectors call this method after applying adjustments or on observing changes made
+        outside of them (such as a watch seeing a spec change on a resource under optimization)
+        to invalidate cached descriptions. Nothing is published while the pub/sub exchange is
+        stopped as there is no servo listening.
+
+        Args:
+            reason: An optional description of the change.
+        """
+        if not self.pubsub_exchange.running:
+            return
+
+        channel = self.pubsub_exchange.get_channel(
+            DESCRIPTION_CHANGED_CHANNEL
+        ) or self.pubsub_exchange.create_channel(DESCRIPTION_CHANGED_CHANNEL)
+        await self.pubsub_exchange.publish(
+            servo.pubsub.Message(json={"connector": self.name, "reason": reason}),
+            channel,
+        )
+
     @property
     def logger(self) -> "loguru.Logger":
         """Return a logger object bound to the connector."""
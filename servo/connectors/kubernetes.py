@@ -51,6 +51,7 @@ import kubernetes_asyncio.watch
 import pydantic
 
 import servo
+import servo.tracing
 from servo.telemetry import ONE_MiB
 from servo.types.kubernetes import *
 
@@ -163,7 +164,8 @@ async def wait_for_condition(
 
     task = asyncio.create_task(_wait_for_condition())
     try:
-        await task
+        # Bound the wait by the deadline of the event being handled, if any
+        await asyncio.wait_for(task, servo.events.deadline_timeout())
     except asyncio.CancelledError:
         task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
@@ -337,10 +339,11 @@ class KubernetesModel(abc.ABC, servo.logging.Mixin):
                     f"defined for resource ({self.api_version})"
                 )
         # If we did find it, initialize that client version.
-        async with kubernetes_asyncio.client.api_client.ApiClient() as api:
-            for k, v in default_headers.items():
-                api.set_default_header(k, v)
-            yield c(api)
+        with servo.tracing.span(f"{self.__class__.__name__} API", "kubernetes"):
+            async with kubernetes_asyncio.client.api_client.ApiClient() as api:
+                for k, v in default_headers.items():
+                    api.set_default_header(k, v)
+                yield c(api)
 
     @classmethod
     @contextlib.asynccontextmanager
@@ -356,8 +359,9 @@ class KubernetesModel(abc.ABC, servo.logging.Mixin):
             raise ValueError(
                 f"no preferred api client defined for object {cls.__name__}",
             )
-        async with kubernetes_asyncio.client.api_client.ApiClient() as api:
-            yield c(api)
+        with servo.tracing.span(f"{cls.__name__} API", "kubernetes"):
+            async with kubernetes_asyncio.client.api_client.ApiClient() as api:
+                yield c(api)
 
     @abc.abstractclassmethod
     async def read(cls, name: str, namespace: str) -> "KubernetesModel":
@@ -2168,9 +2172,11 @@ class Deployment(KubernetesModel):
     ) -> None:
         """Asynchronously wait for changes to a deployment to roll out to the cluster."""
         # NOTE: The timeout_seconds argument must be an int or the request will fail
-        timeout_seconds = (
-            int(servo.Duration(timeout).total_seconds()) if timeout else None
+        timeout_seconds = servo.events.deadline_timeout(
+            servo.Duration(timeout).total_seconds() if timeout else None
         )
+        if timeout_seconds is not None:
+            timeout_seconds = max(int(timeout_seconds), 1)
 
         # Resource version lets us track any change. Observed generation only increments
         # when the deployment controller sees a significant change that requires rollout
@@ -2707,6 +2713,20 @@ ROLLOUT_GROUP = "argoproj.io"
 ROLLOUT_VERSION = "v1alpha1"
 ROLLOUT_PURAL = "rollouts"
 
+# NOTE: Pod specs are hashed through their string representation of roughly 4KiB
+_ESTIMATED_POD_SPEC_SIZE = 4096
+
+
+def _estimated_size_of_object(obj: Dict[str, Any]) -> int:
+    """Return the approximate size in bytes of a Kubernetes object decoded from JSON.
+
+    The size is estimated from the number of containers in the pod template, which dominate
+    the size of workload objects, rather than by encoding the object on the event loop.
+    """
+    template = (obj.get("spec") or {}).get("template") or {}
+    containers = (template.get("spec") or {}).get("containers") or []
+    return _ESTIMATED_POD_SPEC_SIZE * (1 + len(containers))
+
 
 class Rollout(KubernetesModel):
     """Wrapper around an ArgoCD Kubernetes `Rollout` Object.
@@ -2744,12 +2764,13 @@ class Rollout(KubernetesModel):
         self.logger.debug(f"rollout: {self.obj}")
 
         async with self.api_client() as api_client:
-            self.obj = RolloutObj.parse_obj(
-                await api_client.create_namespaced_custom_object(
-                    namespace=namespace,
-                    body=self.obj.dict(by_alias=True, exclude_none=True),
-                    **self._rollout_const_args,
-                )
+            obj = await api_client.create_namespaced_custom_object(
+                namespace=namespace,
+                body=self.obj.dict(by_alias=True, exclude_none=True),
+                **self._rollout_const_args,
+            )
+            self.obj = await servo.utilities.executor.offload(
+                RolloutObj.parse_obj, obj, size=_estimated_size_of_object(obj)
             )
 
     @classmethod
@@ -2766,7 +2787,11 @@ class Rollout(KubernetesModel):
                 name=name,
                 **cls._rollout_const_args,
             )
-            rollout = Rollout(RolloutObj.parse_obj(obj))
+            rollout = Rollout(
+                await servo.utilities.executor.offload(
+                    RolloutObj.parse_obj, obj, size=_estimated_size_of_object(obj)
+                )
+            )
             if rollout.obj.spec.workload_ref:
                 await rollout.read_workfload_ref(namespace=namespace)
             return rollout
@@ -2791,13 +2816,14 @@ class Rollout(KubernetesModel):
         async with self.api_client(
             {"content-type": "application/merge-patch+json"}
         ) as api_client:
-            self.obj = RolloutObj.parse_obj(
-                await api_client.patch_namespaced_custom_object(
-                    namespace=self.namespace,
-                    name=self.name,
-                    body=self.obj.dict(by_alias=True, exclude_none=True),
-                    **self._rollout_const_args,
-                )
+            obj = await api_client.patch_namespaced_custom_object(
+                namespace=self.namespace,
+                name=self.name,
+                body=self.obj.dict(by_alias=True, exclude_none=True),
+                **self._rollout_const_args,
+            )
+            self.obj = await servo.utilities.executor.offload(
+                RolloutObj.parse_obj, obj, size=_estimated_size_of_object(obj)
             )
 
     async def delete(
@@ -2828,10 +2854,11 @@ class Rollout(KubernetesModel):
     async def refresh(self) -> None:
         """Refresh the underlying Kubernetes Rollout resource."""
         async with self.api_client() as api_client:
-            self.obj = RolloutObj.parse_obj(
-                await api_client.get_namespaced_custom_object_status(
-                    namespace=self.namespace, name=self.name, **self._rollout_const_args
-                )
+            obj = await api_client.get_namespaced_custom_object_status(
+                namespace=self.namespace, name=self.name, **self._rollout_const_args
+            )
+            self.obj = await servo.utilities.executor.offload(
+                RolloutObj.parse_obj, obj, size=_estimated_size_of_object(obj)
             )
 
         if self.workload_ref_controller:
@@ -4702,8 +4729,10 @@ class KubernetesOptimizations(pydantic.BaseModel, servo.logging.Mixin):
             images[container.name] = container.image
 
         # Compute checksums for change detection
-        spec_id = servo.utilities.hashing.get_hash(
-            [pod_tmpl_specs[k] for k in sorted(pod_tmpl_specs.keys())]
+        spec_id = await servo.utilities.executor.offload(
+            servo.utilities.hashing.get_hash,
+            [pod_tmpl_specs[k] for k in sorted(pod_tmpl_specs.keys())],
+            size=_ESTIMATED_POD_SPEC_SIZE * len(pod_tmpl_specs),
         )
         runtime_id = servo.utilities.hashing.get_hash(runtime_ids)
         version_id = servo.utilities.hashing.get_hash(
@@ -5434,6 +5463,15 @@ class KubernetesConnector(servo.BaseConnector):
         self,
         adjustments: List[servo.Adjustment],
         control: servo.Control = servo.Control(),
+    ) -> servo.Description:
+        try:
+            return await self._adjust(adjustments, control)
+        finally:
+            # Adjustments change the described state even when they fail or are rolled back
+            await self.notify_description_changed("adjusted")
+
+    async def _adjust(
+        self, adjustments: List[servo.Adjustment], control: servo.Control
     ) -> servo.Description:
         state = await self._create_optimizations()
 
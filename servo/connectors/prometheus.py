@@ -1,5 +1,6 @@
 import abc
 import asyncio
+import collections
 import datetime
 import enum
 import functools
@@ -7,8 +8,11 @@ import itertools
 import math
 import operator
 import re
+import time
 from typing import (
     Any,
+    Awaitable,
+    Deque,
     Dict,
     Iterable,
     List,
@@ -27,10 +31,15 @@ import pytz
 import servo
 import servo.cli
 import servo.configuration
+import servo.convergence
 import servo.fast_fail
+import servo.tracing
+import servo.utilities.executor
 
 DEFAULT_BASE_URL = "http://prometheus:9090"
 API_PATH = "/api/v1"
+DEFAULT_REQUEST_TIMEOUT = 5.0
+"""The timeout in seconds of requests to Prometheus, shortened to the deadline of the event being handled."""
 CHANNEL = "metrics.prometheus"
 
 
@@ -54,6 +63,33 @@ class AbsentMetricPolicy(str, enum.Enum):
     fail = "fail"
 
 
+class SummaryFunction(str, enum.Enum):
+    """An enumeration of PromQL `*_over_time` functions for summarizing metrics.
+
+    Summarized metrics are aggregated by Prometheus across the measurement window
+    and reported as a single value per series rather than as a time series.
+
+    ### Members:
+        avg: The average value across the window.
+        min: The minimum value across the window.
+        max: The maximum value across the window.
+        sum: The sum of all values across the window.
+        count: The count of all values across the window.
+        stddev: The population standard deviation of the values across the window.
+        stdvar: The population standard variance of the values across the window.
+        last: The most recent value in the window.
+    """
+
+    avg = "avg"
+    min = "min"
+    max = "max"
+    sum = "sum"
+    count = "count"
+    stddev = "stddev"
+    stdvar = "stdvar"
+    last = "last"
+
+
 class PrometheusMetric(servo.Metric):
     """A metric that can be measured by querying Prometheus.
 
@@ -64,11 +100,14 @@ class PrometheusMetric(servo.Metric):
             The number of data points within the query result is equal to the duration between the
             start and end times divided by the step. May be a numeric value or Golang duration string.
         absent: The behavior to apply when the queried metric is absent.
+        summary: An optional function to summarize the metric with across the measurement window.
+            When set, the metric is measured as a single value per series via an instant query.
     """
 
     query: str = None
     step: servo.Duration = "1m"
     absent: AbsentMetricPolicy = AbsentMetricPolicy.ignore
+    summary: Optional[SummaryFunction] = None
 
     def build_query(self) -> str:
         """Build and return a complete Prometheus query string.
@@ -79,6 +118,23 @@ class PrometheusMetric(servo.Metric):
             return self.query + " or on() vector(0)"
         return self.query
 
+    def build_summary_query(
+        self, duration: servo.Duration, summary: Optional[SummaryFunction] = None
+    ) -> str:
+        """Build and return a Prometheus query string that summarizes the metric across a duration.
+
+        The query is evaluated as a subquery at the resolution of the step and aggregated
+        with the `*_over_time` function of the summary, defaulting to the summary of the metric.
+        """
+        summary_ = summary or self.summary
+        if summary_ is None:
+            raise ValueError(f"no summary function configured for metric '{self.name}'")
+
+        query = f"{summary_.value}_over_time(({self.query})[{_promql_duration(duration)}:{_promql_duration(self.step)}])"
+        if self.absent == AbsentMetricPolicy.zero:
+            return query + " or on() vector(0)"
+        return query
+
     @property
     def escaped_query(self) -> str:
         return re.sub(r"\{(.*?)\}", r"{{\1}}", self.query)
@@ -539,6 +595,34 @@ class MetricResponse(BaseResponse):
 
         return results_
 
+    def data_points(self) -> Optional[List[servo.DataPoint]]:
+        """Return `DataPoint` representations of the query results.
+
+        Every value of every vector in the response data is serialized into a `DataPoint`,
+        making this suitable for instant queries that return a single value per series.
+        Data points do not carry the labels of their series so results spanning several
+        series should be read with `results` instead.
+        """
+        if self.status == Status.error:
+            return None
+        elif not self.data:
+            return []
+
+        data_points = []
+        for result in self.data:
+            if self.data.is_vector:
+                data_points.extend(
+                    map(lambda v: servo.DataPoint(self.metric, *v), iter(result))
+                )
+            elif self.data.is_value:
+                data_points.append(servo.DataPoint(self.metric, *result))
+            else:
+                raise TypeError(
+                    f"unknown Result type '{result.__class__.name}' encountered"
+                )
+
+        return data_points
+
     def _time_series_from_vector(self, vector: BaseVector) -> servo.TimeSeries:
         instance = vector.metric.get("instance")
         job = vector.metric.get("job")
@@ -560,6 +644,82 @@ def _rstrip_slash(cls, base_url):
     return base_url.rstrip("/")
 
 
+def _promql_duration(duration: servo.Duration) -> str:
+    """Return a duration as a PromQL duration string of whole seconds."""
+    return f"{max(1, int(duration.total_seconds()))}s"
+
+
+class _Endpoint:
+    """A Prometheus API endpoint tracking the latency and health of requests sent to it."""
+
+    __slots__ = ("url", "latencies", "cancelled_latencies", "unhealthy_until")
+
+    # The number of latency samples to retain and the minimum required to hedge requests
+    max_samples = 100
+    min_samples = 10
+
+    # How long to route requests away from an endpoint after it has failed
+    cooldown = 30.0
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.latencies: Deque[float] = collections.deque(maxlen=self.max_samples)
+        self.cancelled_latencies: Deque[float] = collections.deque(
+            maxlen=self.max_samples
+        )
+        self.unhealthy_until = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.unhealthy_until
+
+    def record_success(self, latency: float) -> None:
+        self.latencies.append(latency)
+        self.unhealthy_until = 0.0
+
+    def record_failure(self) -> None:
+        self.unhealthy_until = time.monotonic() + self.cooldown
+
+    def record_cancellation(self, elapsed: float) -> None:
+        """Record a request that was cancelled before completing, such as one that lost a hedge.
+
+        The latency of the request is unknown beyond having exceeded the elapsed time.
+        """
+        self.cancelled_latencies.append(elapsed)
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Return the latency at the given percentile of recent requests, if enough have been observed.
+
+        Cancelled requests are censored samples: ignoring them would bias the estimate toward
+        the requests that were fast enough to complete, so the percentile is taken from a
+        Kaplan-Meier estimate of the latency distribution. When the percentile lies beyond
+        every completed request, the longest latency observed is returned.
+        """
+        samples = sorted(
+            [
+                *((latency, False) for latency in self.latencies),
+                *((latency, True) for latency in self.cancelled_latencies),
+            ]
+        )
+        if len(samples) < self.min_samples:
+            return None
+
+        threshold = percentile / 100
+        at_risk, survival = len(samples), 1.0
+        for latency, cancelled in samples:
+            if not cancelled:
+                survival *= 1 - 1 / at_risk
+                failed = 1 - survival
+                if failed > threshold and not math.isclose(failed, threshold):
+                    return latency
+            at_risk -= 1
+
+        return samples[-1][0]
+
+    def __repr__(self) -> str:
+        return f"_Endpoint({self.url}, healthy={self.healthy}, samples={len(self.latencies)}, cancelled={len(self.cancelled_latencies)})"
+
+
 class Client(pydantic.BaseModel):
     """A high level interface for interacting with the Prometheus HTTP API.
 
@@ -567,16 +727,38 @@ class Client(pydantic.BaseModel):
     Requests and responses are serialized through an object model to make working
     with Prometheus fast and ergonomic.
 
+    When additional endpoints are configured, requests are distributed round robin
+    across the healthy endpoints and fail over to the next endpoint on transport errors
+    and server errors. Requests that are slower than the hedge percentile of the recent
+    latency of an endpoint are duplicated to the next endpoint and the first response wins.
+
     For details about the Prometheus HTTP API see: https://prometheus.io/docs/prometheus/latest/querying/api/
 
     ### Attributes:
         base_url: The base URL for connecting to Prometheus.
+        endpoints: Base URLs of additional Prometheus instances serving equivalent data.
+        hedge_percentile: The latency percentile after which requests are hedged. When None,
+            requests are not hedged.
     """
 
     base_url: pydantic.AnyHttpUrl
+    endpoints: List[pydantic.AnyHttpUrl] = []
+    hedge_percentile: Optional[pydantic.confloat(gt=0, lt=100)] = None
     _normalize_base_url = pydantic.validator("base_url", allow_reuse=True)(
         _rstrip_slash
     )
+    _normalize_endpoints = pydantic.validator(
+        "endpoints", each_item=True, allow_reuse=True
+    )(_rstrip_slash)
+    _endpoints: List[_Endpoint] = pydantic.PrivateAttr(default_factory=list)
+    _rotation: int = pydantic.PrivateAttr(0)
+
+    def __init__(self, **kwargs) -> None:  # noqa: D107
+        super().__init__(**kwargs)
+        self._endpoints = [
+            _Endpoint(f"{base_url}{API_PATH}")
+            for base_url in dict.fromkeys([self.base_url, *self.endpoints])
+        ]
 
     @property
     def url(self) -> str:
@@ -617,6 +799,30 @@ class Client(pydantic.BaseModel):
         )
         return await self.send_request(method, query, response_type)
 
+    async def query_summary(
+        self,
+        metric: PrometheusMetric,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        summary: Optional[SummaryFunction] = None,
+        *,
+        timeout: Optional[servo.DurationDescriptor] = None,
+        method: Literal["GET", "POST"] = "GET",
+    ) -> BaseResponse:
+        """Send an instant query summarizing a metric across a time range to Prometheus and return the response.
+
+        The metric is aggregated by Prometheus with a `*_over_time` function evaluated at `end`,
+        returning a single value per series rather than a matrix of data points.
+        """
+        query = InstantQuery(
+            query=metric.build_summary_query(servo.Duration(end - start), summary),
+            time=end,
+            timeout=timeout,
+        )
+        return await self.send_request(
+            method, query, functools.partial(MetricResponse, metric=metric)
+        )
+
     async def query_range(
         self,
         promql: Union[str, PrometheusMetric],
@@ -708,26 +914,128 @@ class Client(pydantic.BaseModel):
         servo.logger.trace(
             f"Sending request to Prometheus HTTP API (`{request}`): {method} {request.endpoint}"
         )
-        async with httpx.AsyncClient(base_url=self.url) as client:
+        if len(self._endpoints) == 1:
+            return await self._send_request_to_endpoint(
+                self._endpoints[0], method, request, response_type
+            )
+
+        endpoints = self._rotate_endpoints()
+        error: Optional[Exception] = None
+        index = 0
+        while index < len(endpoints):
+            tasks = {
+                asyncio.create_task(
+                    self._send_request_to_endpoint(
+                        endpoints[index], method, request, response_type
+                    )
+                )
+            }
             try:
-                kwargs = (
-                    dict(params=request.params)
-                    if method == "GET"
-                    else dict(data=request.params)
+                # Hedge to the next endpoint if the response is slow
+                hedge_delay = (
+                    endpoints[index].latency_percentile(self.hedge_percentile)
+                    if self.hedge_percentile and index + 1 < len(endpoints)
+                    else None
                 )
-                http_request = client.build_request(method, request.endpoint, **kwargs)
-                http_response = await client.send(http_request)
-                http_response.raise_for_status()
-                return response_type(request=request, **http_response.json())
-            except (
-                httpx.HTTPError,
-                httpx.ReadTimeout,
-                httpx.ConnectError,
-            ) as error:
-                servo.logger.trace(
-                    f"HTTP error encountered during GET {request.url}: {error}"
+                if hedge_delay is not None:
+                    done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+                    if not done:
+                        index += 1
+                        servo.logger.debug(
+                            f"Hedging Prometheus request to {endpoints[index].url} after {hedge_delay:.3f}s"
+                        )
+                        tasks.add(
+                            asyncio.create_task(
+                                self._send_request_to_endpoint(
+                                    endpoints[index], method, request, response_type
+                                )
+                            )
+                        )
+
+                while tasks:
+                    done, tasks = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        if task.exception() is None:
+                            return task.result()
+                        elif not _is_retryable_error(task.exception()):
+                            raise task.exception()
+                        error = task.exception()
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            index += 1
+            if index < len(endpoints):
+                servo.logger.warning(
+                    f"Prometheus request failed, failing over to {endpoints[index].url}: {error}"
                 )
-                raise
+
+        raise error
+
+    def _rotate_endpoints(self) -> List[_Endpoint]:
+        """Return the endpoints in round robin order with unhealthy endpoints last."""
+        self._rotation = (self._rotation + 1) % len(self._endpoints)
+        endpoints = (
+            self._endpoints[self._rotation :] + self._endpoints[: self._rotation]
+        )
+        return sorted(endpoints, key=lambda e: not e.healthy)
+
+    async def _send_request_to_endpoint(
+        self,
+        endpoint: _Endpoint,
+        method: Literal["GET", "POST"],
+        request: QueryRequest,
+        response_type: Type[BaseResponse],
+    ) -> BaseResponse:
+        with servo.tracing.span(
+            f"{method} {request.endpoint}", "prometheus", url=str(endpoint.url)
+        ):
+            async with httpx.AsyncClient(
+                base_url=endpoint.url,
+                timeout=servo.events.deadline_timeout(DEFAULT_REQUEST_TIMEOUT),
+            ) as client:
+                try:
+                    kwargs = (
+                        dict(params=request.params)
+                        if method == "GET"
+                        else dict(data=request.params)
+                    )
+                    started_at = time.monotonic()
+                    http_request = client.build_request(
+                        method, request.endpoint, **kwargs
+                    )
+                    try:
+                        http_response = await client.send(http_request)
+                    except asyncio.CancelledError:
+                        endpoint.record_cancellation(time.monotonic() - started_at)
+                        raise
+                    http_response.raise_for_status()
+                    endpoint.record_success(time.monotonic() - started_at)
+                    return await servo.utilities.executor.offload(
+                        lambda: response_type(request=request, **http_response.json()),
+                        size=len(http_response.content),
+                    )
+                except (
+                    httpx.HTTPError,
+                    httpx.ReadTimeout,
+                    httpx.ConnectError,
+                ) as error:
+                    servo.logger.trace(
+                        f"HTTP error encountered during GET {request.url}: {error}"
+                    )
+                    if _is_retryable_error(error):
+                        endpoint.record_failure()
+                    raise
+
+
+def _is_retryable_error(error: BaseException) -> bool:
+    """Return True if a request failing with the error can be retried on another endpoint."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
 
 
 class PrometheusConfiguration(servo.BaseConfiguration):
@@ -745,6 +1053,23 @@ class PrometheusConfiguration(servo.BaseConfiguration):
     are computed as necessary for API requests.
     """
 
+    endpoints: List[pydantic.AnyHttpUrl] = []
+    """Base URLs of additional Prometheus instances serving data equivalent to `base_url`
+    (e.g., HA replicas or Thanos queriers).
+
+    Queries are load balanced across the healthy endpoints and fail over between them.
+    """
+
+    _normalize_endpoints = pydantic.validator(
+        "endpoints", each_item=True, allow_reuse=True
+    )(_rstrip_slash)
+
+    hedge_percentile: Optional[pydantic.confloat(gt=0, lt=100)] = 95
+    """The percentile of recently observed latency of an endpoint after which a query is
+    duplicated to a second endpoint. Only applies when additional endpoints are configured.
+    When None, queries are not hedged.
+    """
+
     streaming_interval: Optional[servo.Duration] = None
 
     metrics: List[PrometheusMetric]
@@ -758,11 +1083,77 @@ class PrometheusConfiguration(servo.BaseConfiguration):
     scraped by the Prometheus instance being queried.
     """
 
+    summary: Optional[SummaryFunction] = None
+    """An optional function to summarize metrics with across the measurement window.
+
+    When set, metrics are measured as a single value per series via instant queries
+    evaluated by Prometheus rather than as time series. Metrics can override the function.
+    """
+
     fast_fail: servo.configuration.FastFailConfiguration = pydantic.Field(
         default_factory=servo.configuration.FastFailConfiguration
     )
     """Configuration sub section for fast fail behavior. Defines toggle and timing of SLO observation"""
 
+    convergence: servo.configuration.ConvergenceConfiguration = pydantic.Field(
+        default_factory=servo.configuration.ConvergenceConfiguration
+    )
+    """Configuration sub section for completing measurements early once the metrics have converged"""
+
+    _client: Optional[Client] = pydantic.PrivateAttr(None)
+
+    @property
+    def client(self) -> Client:
+        """Return a client for querying the configured Prometheus endpoints.
+
+        The client is retained across queries so that the health and latency of
+        the endpoints are tracked over time.
+        """
+        if (
+            self._client is None
+            or self._client.base_url != self.base_url
+            or self._client.endpoints != self.endpoints
+            or self._client.hedge_percentile != self.hedge_percentile
+        ):
+            self._client = Client(
+                base_url=self.base_url,
+                endpoints=self.endpoints,
+                hedge_percentile=self.hedge_percentile,
+            )
+        return self._client
+
+    @pydantic.root_validator(skip_on_failure=True)
+    @classmethod
+    def _summary_applies_to_all_metrics(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        if values["summary"] is None:
+            unsummarized = list(filter(lambda m: m.summary is None, values["metrics"]))
+            if unsummarized and len(unsummarized) != len(values["metrics"]):
+                raise ValueError(
+                    "summary must be configured for all metrics or none: "
+                    f"set a summary for {', '.join(map(lambda m: m.name, unsummarized))} or a default summary for the connector"
+                )
+
+        return values
+
+    @pydantic.root_validator(skip_on_failure=True)
+    @classmethod
+    def _push_fast_fail_requires_streaming(
+        cls, values: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        fast_fail, streaming_interval = (
+            values["fast_fail"],
+            values["streaming_interval"],
+        )
+        if (
+            fast_fail.mode == servo.configuration.FastFailMode.push
+            and streaming_interval is None
+        ):
+            raise ValueError(
+                "fast_fail mode 'push' requires a streaming_interval to be configured"
+            )
+
+        return values
+
     @classmethod
     def generate(cls, **kwargs) -> "PrometheusConfiguration":
         """Generate a default configuration for capturing measurements from the
@@ -808,7 +1199,7 @@ class PrometheusChecks(servo.BaseChecks):
 
     @property
     def _client(self) -> Client:
-        return Client(base_url=self.config.base_url)
+        return self.config.client
 
     @servo.require('Connect to "{self.config.base_url}"')
     async def check_base_url(self) -> None:
@@ -866,7 +1257,7 @@ class PrometheusConnector(servo.BaseConnector):
             @self.publish(CHANNEL, every=streaming_interval)
             async def _publish_metrics(publisher: servo.pubsub.Publisher) -> None:
                 report = []
-                client = Client(base_url=self.config.base_url)
+                client = self.config.client
                 responses = await asyncio.gather(
                     *list(map(client.query, self.config.metrics)),
                     return_exceptions=True,
@@ -961,6 +1352,27 @@ class PrometheusConnector(servo.BaseConnector):
         )
 
         progress = servo.EventProgress(timeout=measurement_duration, settlement=None)
+        watchers: List[Awaitable[None]] = []
+
+        # Handle early completion on convergence
+        convergence_observer = None
+        if self.config.convergence.enabled:
+            self.logger.info(
+                f"Convergence enabled, the measurement will complete early once metrics have converged for {self.config.convergence.stable_for}"
+            )
+            convergence_observer = servo.convergence.ConvergenceObserver(
+                config=self.config.convergence,
+                measurement_start=start,
+                metrics_getter=functools.partial(
+                    self._query_slo_metrics, metrics=metrics__
+                ),
+            )
+            watchers.append(
+                progress.watch(
+                    convergence_observer.observe,
+                    every=self.config.convergence.period,
+                )
+            )
 
         # Handle fast fail metrics
         if (
@@ -979,38 +1391,53 @@ class PrometheusConnector(servo.BaseConnector):
                     self._query_slo_metrics, metrics=metrics__
                 ),
             )
-            fast_fail_progress = servo.EventProgress(timeout=measurement_duration)
-            gather_tasks = [
-                asyncio.create_task(progress.watch(self.observe)),
-                asyncio.create_task(
+            if self.config.fast_fail.mode == servo.configuration.FastFailMode.push:
+                # Evaluate the SLOs as metrics are streamed rather than polling
+                await fast_fail_observer.guard(
+                    _watch_progress(progress.watch(self.observe), *watchers),
+                    exchange=self.pubsub_exchange,
+                    selector=CHANNEL,
+                    decoder=functools.partial(_readings_from_stream_message, metrics__),
+                )
+            else:
+                fast_fail_progress = servo.EventProgress(timeout=measurement_duration)
+                watchers.append(
                     fast_fail_progress.watch(
-                        fast_fail_observer.observe, every=self.config.fast_fail.period
+                        fast_fail_observer.observe,
+                        every=self.config.fast_fail.period,
                     )
-                ),
-            ]
-            try:
-                await asyncio.gather(*gather_tasks)
-            except:
-                [task.cancel() for task in gather_tasks]
-                await asyncio.gather(*gather_tasks, return_exceptions=True)
-                raise
+                )
+                await _watch_progress(progress.watch(self.observe), *watchers)
         else:
-            await progress.watch(self.observe)
+            await _watch_progress(progress.watch(self.observe), *watchers)
+
+        # Capture the measurements over the actual window
+        annotations = {}
+        if convergence_observer:
+            end = convergence_observer.converged_at or end
+            annotations = convergence_observer.annotations(start, end)
+
+        if self.config.summary or any(map(lambda m: m.summary, metrics__)):
+            self.logger.info(
+                f"Querying Prometheus for summaries of {len(metrics__)} metrics..."
+            )
+            query_prometheus = self._query_prometheus_summary
+        else:
+            self.logger.info(f"Querying Prometheus for {len(metrics__)} metrics...")
+            query_prometheus = self._query_prometheus
 
-        # Capture the measurements
-        self.logger.info(f"Querying Prometheus for {len(metrics__)} metrics...")
         readings = await asyncio.gather(
-            *list(map(lambda m: self._query_prometheus(m, start, end), metrics__))
+            *list(map(lambda m: query_prometheus(m, start, end), metrics__))
         )
         all_readings = (
             functools.reduce(lambda x, y: x + y, readings) if readings else []
         )
-        measurement = servo.Measurement(readings=all_readings)
+        measurement = servo.Measurement(readings=all_readings, annotations=annotations)
         return measurement
 
     async def targets(self) -> List[TargetsResponse]:
         """Return the targets discovered by Prometheus."""
-        client = Client(base_url=self.config.base_url)
+        client = self.config.client
         response = await client.list_targets()
         return response
 
@@ -1026,7 +1453,7 @@ class PrometheusConnector(servo.BaseConnector):
     async def _query_prometheus(
         self, metric: PrometheusMetric, start: datetime, end: datetime
     ) -> List[servo.TimeSeries]:
-        client = Client(base_url=self.config.base_url)
+        client = self.config.client
         response: MetricResponse = await client.query_range(metric, start, end)
         self.logger.trace(
             f"Got response data type {response.__class__} for metric {metric}: {response}"
@@ -1036,30 +1463,51 @@ class PrometheusConnector(servo.BaseConnector):
         if response.data:
             return response.results()
         else:
-            # Handle absent metric cases
-            if metric.absent in {AbsentMetricPolicy.ignore, AbsentMetricPolicy.zero}:
-                # NOTE: metric zeroing is handled at the query level
-                pass
-            else:
-                if await client.check_is_metric_absent(metric):
-                    if metric.absent == AbsentMetricPolicy.warn:
-                        servo.logger.warning(
-                            f"Found absent metric for query (`{metric.query}`)"
-                        )
-                    elif metric.absent == AbsentMetricPolicy.fail:
-                        servo.logger.error(
-                            f"Required metric '{metric.name}' is absent from Prometheus (query='{metric.query}')"
-                        )
-                        raise RuntimeError(
-                            f"Required metric '{metric.name}' is absent from Prometheus"
-                        )
-                    else:
-                        raise ValueError(
-                            f"unknown metric absent value: {metric.absent}"
-                        )
+            await self._handle_absent_metric(client, metric)
+            return []
 
+    async def _query_prometheus_summary(
+        self, metric: PrometheusMetric, start: datetime, end: datetime
+    ) -> List[servo.Reading]:
+        client = self.config.client
+        response: MetricResponse = await client.query_summary(
+            metric, start, end, metric.summary or self.config.summary
+        )
+        self.logger.trace(
+            f"Got response data type {response.__class__} for metric summary {metric}: {response}"
+        )
+        response.raise_for_error()
+
+        if not response.data:
+            await self._handle_absent_metric(client, metric)
             return []
 
+        # NOTE: Summaries are always single point time series, whatever the number of series,
+        # so that the labels identifying each series are kept and all readings share one type
+        return response.results()
+
+    async def _handle_absent_metric(
+        self, client: Client, metric: PrometheusMetric
+    ) -> None:
+        if metric.absent in {AbsentMetricPolicy.ignore, AbsentMetricPolicy.zero}:
+            # NOTE: metric zeroing is handled at the query level
+            return
+
+        if await client.check_is_metric_absent(metric):
+            if metric.absent == AbsentMetricPolicy.warn:
+                servo.logger.warning(
+                    f"Found absent metric for query (`{metric.query}`)"
+                )
+            elif metric.absent == AbsentMetricPolicy.fail:
+                servo.logger.error(
+                    f"Required metric '{metric.name}' is absent from Prometheus (query='{metric.query}')"
+                )
+                raise RuntimeError(
+                    f"Required metric '{metric.name}' is absent from Prometheus"
+                )
+            else:
+                raise ValueError(f"unknown metric absent value: {metric.absent}")
+
     async def _query_slo_metrics(
         self, start: datetime, end: datetime, metrics: List[PrometheusMetric]
     ) -> Dict[str, List[servo.TimeSeries]]:
@@ -1070,6 +1518,49 @@ class PrometheusConnector(servo.BaseConnector):
         return dict(map(lambda tup: (tup[0].name, tup[1]), zip(metrics, readings)))
 
 
+async def _watch_progress(
+    progress_watcher: Awaitable[None], *watchers: Awaitable[None]
+) -> None:
+    """Await a progress watcher alongside auxiliary watchers.
+
+    The auxiliary watchers are cancelled once the progress watcher returns. An exception
+    raised by any watcher (e.g., an SLO violation) cancels the others and is propagated.
+    """
+    main_task = asyncio.create_task(progress_watcher)
+    pending = {main_task, *map(asyncio.create_task, watchers)}
+    try:
+        while not main_task.done():
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _readings_from_stream_message(
+    metrics: List[PrometheusMetric],
+    message: servo.pubsub.Message,
+    channel: Optional[servo.pubsub.Channel] = None,
+) -> Dict[str, List[servo.DataPoint]]:
+    """Decode a streamed metrics report into a mapping of metric names to data points.
+
+    Metrics that are not in the given list are ignored.
+    """
+    metrics_by_name = {metric.name: metric for metric in metrics}
+    readings: Dict[str, List[servo.DataPoint]] = {}
+    for name, timestamp, value in await message.decode_json():
+        if metric := metrics_by_name.get(name):
+            readings.setdefault(name, []).append(
+                servo.DataPoint(metric, timestamp, value)
+            )
+
+    return readings
+
+
 app = servo.cli.ConnectorCLI(PrometheusConnector, help="Metrics from Prometheus")
 
 
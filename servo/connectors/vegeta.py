@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import datetime
 import enum
 import io
@@ -11,6 +13,11 @@ import jsonschema
 import pydantic
 
 import servo
+import servo.configuration
+import servo.convergence
+import servo.fast_fail
+
+CHANNEL = "loadgen.vegeta"
 
 METRICS = [
     servo.Metric("throughput", servo.Unit.requests_per_minute),
@@ -137,6 +144,14 @@ class VegetaConfiguration(servo.BaseConfiguration):
         "15s",
         description="How often to report metrics during a measurement cycle.",
     )
+    fast_fail: servo.configuration.FastFailConfiguration = pydantic.Field(
+        default_factory=servo.configuration.FastFailConfiguration,
+        description="Configuration of fast fail behavior. SLOs are evaluated against each Vegeta report as it is published.",
+    )
+    convergence: servo.configuration.ConvergenceConfiguration = pydantic.Field(
+        default_factory=servo.configuration.ConvergenceConfiguration,
+        description="Configuration of early completion behavior. Load generation is stopped once the metrics of the published Vegeta reports have converged.",
+    )
     _duration: servo.Duration = pydantic.PrivateAttr(None)
 
     @property
@@ -340,11 +355,57 @@ class VegetaConnector(servo.BaseConnector):
         summary = f"Loading {number_of_urls} URL(s) for {self.config._duration} (delay of {control.delay}, warmup of {control.warmup}) at a rate of {self.config.rate} (reporting every {self.config.reporting_interval})"
         self.logger.info(summary)
 
+        # Observe the published reports for convergence if enabled
+        progress = servo.EventProgress()
+        convergence_observer = None
+        convergence_subscription = contextlib.nullcontext()
+        if self.config.convergence.enabled:
+            self.logger.info(
+                f"Convergence enabled, load generation will stop early once metrics have converged for {self.config.convergence.stable_for}"
+            )
+            if cumulative_metrics := [
+                metric
+                for metric in self.config.convergence.metrics or []
+                if metric not in INTERVAL_METRICS
+            ]:
+                self.logger.warning(
+                    f"Convergence cannot be evaluated for cumulative Vegeta metrics, load generation will not stop early: {', '.join(cumulative_metrics)}"
+                )
+            convergence_observer = servo.convergence.ConvergenceObserver(
+                config=self.config.convergence
+            )
+            convergence_subscription = convergence_observer.subscribe(
+                progress,
+                exchange=self.pubsub_exchange,
+                selector=CHANNEL,
+                decoder=_interval_readings_decoder(),
+            )
+
         # Run the load generator, publishing metrics for interested subscribers
-        async with self.publish("loadgen.vegeta") as publisher:
-            _, vegeta_reports = await _run_vegeta(
-                config=self.config, warmup_until=warmup_until, publisher=publisher
+        async with self.publish(CHANNEL) as publisher:
+            run_vegeta = _run_vegeta(
+                config=self.config,
+                warmup_until=warmup_until,
+                publisher=publisher,
+                until=progress,
             )
+            with convergence_subscription:
+                if slo_input := self._fast_fail_input(control):
+                    self.logger.info(
+                        "Fast Fail enabled, the following SLO Conditions will be monitored during load generation: "
+                        f"{', '.join(map(str, slo_input.conditions))}"
+                    )
+                    fast_fail_observer = servo.fast_fail.FastFailObserver(
+                        config=self.config.fast_fail, input=slo_input
+                    )
+                    _, vegeta_reports = await fast_fail_observer.guard(
+                        run_vegeta,
+                        exchange=self.pubsub_exchange,
+                        selector=CHANNEL,
+                        decoder=_readings_from_vegeta_message,
+                    )
+                else:
+                    _, vegeta_reports = await run_vegeta
 
         self.logger.info(
             f"Producing time series readings from {len(vegeta_reports)} Vegeta reports"
@@ -354,11 +415,16 @@ class VegetaConnector(servo.BaseConnector):
             if vegeta_reports
             else []
         )
+        annotations = {
+            "load_profile": summary,
+        }
+        if convergence_observer:
+            annotations.update(
+                convergence_observer.annotations(warmup_until, datetime.datetime.now())
+            )
         measurement = servo.Measurement(
             readings=readings,
-            annotations={
-                "load_profile": summary,
-            },
+            annotations=annotations,
         )
         self.logger.trace(
             f"Reporting time series metrics {devtools.pformat(measurement)}"
@@ -366,11 +432,27 @@ class VegetaConnector(servo.BaseConnector):
 
         return measurement
 
+    def _fast_fail_input(self, control: servo.Control) -> Optional[servo.SloInput]:
+        """Return the SLO conditions that can be evaluated against Vegeta metrics, if any."""
+        if (
+            self.config.fast_fail.disabled
+            or not control.userdata
+            or not control.userdata.slo
+        ):
+            return None
+
+        metric_names = set(map(lambda m: m.name, METRICS))
+        conditions = list(
+            filter(lambda c: c.metric in metric_names, control.userdata.slo.conditions)
+        )
+        return servo.SloInput(conditions=conditions) if conditions else None
+
 
 async def _run_vegeta(
     config: VegetaConfiguration,
     warmup_until: Optional[datetime.datetime] = None,
     publisher: Optional[servo.Publisher] = None,
+    until: Optional[servo.EventProgress] = None,
 ) -> Tuple[int, List[VegetaReport]]:
     vegeta_reports: List[VegetaReport] = []
     vegeta_cmd = _build_vegeta_command(config)
@@ -397,11 +479,34 @@ async def _run_vegeta(
             )
 
     servo.logger.debug(f"Vegeta started: `{vegeta_cmd}`")
-    exit_code = await servo.stream_subprocess_shell(
-        vegeta_cmd,
-        stdout_callback=process_stdout,
-        stderr_callback=lambda m: servo.logger.error(f"Vegeta stderr: {m}"),
+    vegeta_task = asyncio.create_task(
+        servo.stream_subprocess_shell(
+            vegeta_cmd,
+            stdout_callback=process_stdout,
+            stderr_callback=lambda m: servo.logger.error(f"Vegeta stderr: {m}"),
+        )
     )
+    if until is not None:
+        # Stop load generation if progress is completed early (e.g., on convergence)
+        until_task = asyncio.create_task(until.wait())
+        try:
+            await asyncio.wait(
+                {vegeta_task, until_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+        except BaseException:
+            vegeta_task.cancel()
+            raise
+        finally:
+            until_task.cancel()
+
+        if not vegeta_task.done():
+            servo.logger.info("Stopping Vegeta early: measurement progress completed")
+            vegeta_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await vegeta_task
+            return 0, vegeta_reports
+
+    exit_code = await vegeta_task
 
     servo.logger.debug(f"Vegeta exited with exit code: {exit_code}")
     if exit_code != 0:
@@ -495,6 +600,91 @@ def _time_series_readings_from_vegeta_reports(
     return readings
 
 
+# Maps latency percentile aliases (e.g. "50th") to the field names used in serialized reports
+_LATENCY_FIELD_NAMES = {
+    field.alias: name for name, field in Latencies.__fields__.items()
+}
+
+
+async def _readings_from_vegeta_message(
+    message: servo.Message, channel: Optional[servo.Channel] = None
+) -> Dict[str, List[servo.DataPoint]]:
+    """Decode a published Vegeta report into a mapping of metric names to data points."""
+    report = await message.decode_json()
+    readings = {}
+    for metric in METRICS:
+        if metric.name.startswith("latency_"):
+            latency_field = _LATENCY_FIELD_NAMES[metric.name.replace("latency_", "")]
+            value = report["latencies"][latency_field]
+        else:
+            value = report[metric.name]
+
+        readings[metric.name] = [servo.DataPoint(metric, report["end"], value)]
+
+    return readings
+
+
+# Metrics that can be recovered for each reporting interval from the cumulative Vegeta reports
+INTERVAL_METRICS = ["throughput", "error_rate", "latency_mean"]
+
+
+def _interval_readings_decoder() -> servo.fast_fail.ReadingsDecoder:
+    """Return a decoder of published Vegeta reports into readings of each reporting interval.
+
+    Vegeta reports summarize the attack since it began, so successive reports are strongly
+    autocorrelated and estimating a confidence interval from them overstates convergence. The
+    decoder differences each report against the one before it to recover the requests made
+    within the interval. Only the `INTERVAL_METRICS` can be recovered this way: percentiles
+    and extremes of the latencies are omitted.
+    """
+    previous: Optional[Dict[str, Any]] = None
+
+    async def _decode(
+        message: servo.Message, channel: Optional[servo.Channel] = None
+    ) -> Dict[str, List[servo.DataPoint]]:
+        nonlocal previous
+        report = await message.decode_json()
+        if previous is None:
+            requests = report["requests"]
+            successes = requests * report["success"]
+            elapsed = report["duration"] + report["wait"]
+            total_latency = report["latencies"]["mean"] * requests
+        else:
+            if report["duration"] <= previous["duration"]:
+                # Reports delivered out of order carry no new interval
+                return {}
+
+            requests = report["requests"] - previous["requests"]
+            successes = (
+                report["requests"] * report["success"]
+                - previous["requests"] * previous["success"]
+            )
+            elapsed = (report["duration"] + report["wait"]) - (
+                previous["duration"] + previous["wait"]
+            )
+            total_latency = (
+                report["latencies"]["mean"] * report["requests"]
+                - previous["latencies"]["mean"] * previous["requests"]
+            )
+
+        previous = report
+        if requests <= 0 or elapsed <= 0:
+            return {}
+
+        values = {
+            "throughput": successes / elapsed * 60,
+            "error_rate": 100 - (successes / requests * 100),
+            "latency_mean": total_latency / requests,
+        }
+        return {
+            metric.name: [servo.DataPoint(metric, report["end"], values[metric.name])]
+            for metric in METRICS
+            if metric.name in values
+        }
+
+    return _decode
+
+
 def _summarize_report(report: VegetaReport, config: VegetaConfiguration) -> str:
     def format_metric(value: servo.Numeric, unit: servo.Unit) -> str:
         return f"{value:.2f}{unit.value}"
@@ -0,0 +1,205 @@
+import contextlib
+import datetime
+import math
+import statistics
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional
+
+import pydantic
+
+import servo
+import servo.configuration
+import servo.fast_fail
+import servo.pubsub
+import servo.types
+
+
+class ConvergenceObserver(pydantic.BaseModel):
+    """Observes metric readings during a measurement and completes progress early once
+    the metrics have converged to a steady state.
+
+    A metric is converged when the confidence interval estimated around the mean of its
+    samples is narrower than the configured width relative to the mean. All monitored
+    metrics must remain converged for the configured `stable_for` duration before
+    progress is completed.
+    """
+
+    config: servo.configuration.ConvergenceConfiguration
+    measurement_start: Optional[datetime.datetime] = None
+    metrics_getter: Optional[
+        Callable[
+            [datetime.datetime, datetime.datetime],
+            Awaitable[Dict[str, List[servo.types.Reading]]],
+        ]
+    ] = None
+
+    _z_score: float = pydantic.PrivateAttr()
+    _pushed_samples: Dict[str, List[float]] = pydantic.PrivateAttr(default_factory=dict)
+    _converged_since: Optional[datetime.datetime] = pydantic.PrivateAttr(None)
+    _converged_at: Optional[datetime.datetime] = pydantic.PrivateAttr(None)
+
+    def __init__(self, **kwargs) -> None:  # noqa: D107
+        super().__init__(**kwargs)
+        self._z_score = statistics.NormalDist().inv_cdf(
+            0.5 + self.config.confidence / 2
+        )
+
+    @property
+    def converged_at(self) -> Optional[datetime.datetime]:
+        """Return the time at which convergence was observed or None if it has not been."""
+        return self._converged_at
+
+    async def observe(self, progress: servo.EventProgress) -> None:
+        """Query the metrics measured since the measurement started and complete progress on convergence."""
+        checked_at = datetime.datetime.now()
+        if self.measurement_start is None or checked_at <= self.measurement_start:
+            return
+
+        readings = await self.metrics_getter(self.measurement_start, checked_at)
+        samples = {
+            metric_name: [
+                [data_point.value for data_point in reading.data_points]
+                if isinstance(reading, servo.types.TimeSeries)
+                else [reading.value]
+                for reading in metric_readings
+            ]
+            for metric_name, metric_readings in readings.items()
+        }
+        if self.check_samples(samples, checked_at=checked_at):
+            progress.complete()
+
+    @contextlib.contextmanager
+    def subscribe(
+        self,
+        progress: servo.EventProgress,
+        *,
+        exchange: servo.pubsub.Exchange,
+        selector: servo.pubsub.Selector,
+        decoder: servo.fast_fail.ReadingsDecoder,
+    ) -> Iterator[servo.pubsub.Subscriber]:
+        """Observe readings published through pub/sub while the context is active, completing
+        progress on convergence.
+
+        Args:
+            progress: The progress to complete once the metrics have converged.
+            exchange: The pub/sub Exchange to subscribe to.
+            selector: A string or regular expression pattern matching Channels of interest.
+            decoder: A callable that decodes Messages into a mapping of metric names to readings.
+        """
+
+        async def _message_received(
+            message: servo.pubsub.Message, channel: servo.pubsub.Channel
+        ) -> None:
+            if progress.completed:
+                return
+
+            readings = await servo.fast_fail.decode_readings(decoder, message, channel)
+            if progress.completed:
+                return
+
+            if self.observe_readings(readings, received_at=datetime.datetime.now()):
+                progress.complete()
+
+        subscriber = exchange.create_subscriber(selector, callback=_message_received)
+        try:
+            yield subscriber
+        finally:
+            exchange.remove_subscriber(subscriber)
+
+    def observe_readings(
+        self,
+        readings: Dict[str, List[servo.types.Reading]],
+        received_at: datetime.datetime,
+    ) -> bool:
+        """Accumulate pushed readings as samples and return True if the metrics have converged.
+
+        Each reading contributes one sample per data point to the metric it was taken of.
+        """
+        for metric_name, metric_readings in readings.items():
+            samples = self._pushed_samples.setdefault(metric_name, [])
+            for reading in metric_readings:
+                if isinstance(reading, servo.types.TimeSeries):
+                    samples.extend(data_point.value for data_point in reading)
+                else:
+                    samples.append(reading.value)
+
+        return self.check_samples(
+            {
+                metric_name: [samples]
+                for metric_name, samples in self._pushed_samples.items()
+            },
+            checked_at=received_at,
+        )
+
+    def check_samples(
+        self,
+        samples: Dict[str, List[List[float]]],
+        checked_at: datetime.datetime,
+    ) -> bool:
+        """Evaluate convergence of the sampled series of each metric.
+
+        Returns True once all monitored metrics have been converged for the configured
+        `stable_for` duration.
+        """
+        if self._converged_at is not None:
+            return True
+
+        metric_names = self.config.metrics or list(samples.keys())
+        widths: Dict[str, float] = {}
+        for metric_name in metric_names:
+            series = samples.get(metric_name)
+            widths[metric_name] = (
+                max(map(self._relative_width, series)) if series else math.inf
+            )
+
+        unconverged = [
+            metric_name
+            for metric_name, width in widths.items()
+            if not width <= self.config.relative_width
+        ]
+        if not metric_names or unconverged:
+            if self._converged_since is not None:
+                servo.logger.debug(
+                    f"Metrics diverged after converging at {self._converged_since}: {', '.join(unconverged)}"
+                )
+            self._converged_since = None
+            return False
+
+        if self._converged_since is None:
+            self._converged_since = checked_at
+            servo.logger.debug(
+                f"Metrics converged, waiting {self.config.stable_for} for stability: "
+                + ", ".join(f"{k}={v:.2%}" for k, v in widths.items())
+            )
+
+        if checked_at - self._converged_since >= self.config.stable_for:
+            self._converged_at = checked_at
+            servo.logger.info(
+                f"Metrics have been converged since {self._converged_since}, completing measurement early"
+            )
+            return True
+
+        return False
+
+    def annotations(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> Dict[str, str]:
+        """Return annotations describing the convergence status and actual measurement window."""
+        return {
+            "convergence": "converged" if self._converged_at else "not converged",
+            "measurement_window": f"{start.isoformat()}/{end.isoformat()}",
+            "measurement_duration": str(servo.types.Duration(end - start)),
+        }
+
+    def _relative_width(self, values: List[float]) -> float:
+        """Return the width of the confidence interval on the mean relative to the mean."""
+        values = [value for value in values if not math.isnan(value)]
+        if len(values) < self.config.min_samples:
+            return math.inf
+
+        mean = math.fsum(values) / len(values)
+        stdev = statistics.stdev(values, mean)
+        if mean == 0:
+            return 0.0 if stdev == 0 else math.inf
+
+        width = 2 * self._z_score * stdev / math.sqrt(len(values))
+        return width / abs(mean)
@@ -0,0 +1,184 @@
+"""The `servo.downsampling` module reduces the time series readings of measurements to a
+target number of data points before they are reported to the optimizer.
+
+Bucketed aggregation is fully vectorized via NumPy reductions. Largest-Triangle-Three-Buckets
+(LTTB) selection is sequential across buckets by design but vectorized within each bucket.
+"""
+from __future__ import annotations
+
+import datetime
+from typing import List, Optional, Sequence
+
+import numpy
+
+from servo.configuration import DownsamplingConfiguration, DownsamplingMode
+from servo.types import DataPoint, Measurement, TimeSeries
+
+__all__ = (
+    "downsample_measurement",
+    "downsample_time_series",
+    "lttb_indices",
+)
+
+
+def downsample_measurement(
+    measurement: Measurement,
+    configurations: Optional[Sequence[DownsamplingConfiguration]],
+) -> Measurement:
+    """Return a measurement with its time series readings downsampled.
+
+    Each time series is downsampled by the first configuration that applies to its metric.
+    Time series without an applicable configuration and scalar data points are left as is.
+
+    Args:
+        measurement: The measurement to downsample.
+        configurations: The downsampling configurations to apply.
+
+    Returns:
+        A copy of the measurement with downsampled readings or the measurement if no
+        time series required downsampling.
+    """
+    if not configurations:
+        return measurement
+
+    readings = []
+    downsampled = False
+    for reading in measurement.readings:
+        if isinstance(reading, TimeSeries):
+            configuration = next(
+                (
+                    configuration
+                    for configuration in configurations
+                    if configuration.metrics is None
+                    or reading.metric.name in configuration.metrics
+                ),
+                None,
+            )
+            if configuration and len(reading) > configuration.target_points:
+                reading = downsample_time_series(
+                    reading, configuration.mode, configuration.target_points
+                )
+                downsampled = True
+
+        readings.append(reading)
+
+    if not downsampled:
+        return measurement
+
+    return measurement.copy(update={"readings": readings})
+
+
+def downsample_time_series(
+    time_series: TimeSeries, mode: DownsamplingMode, target_points: int
+) -> TimeSeries:
+    """Return a copy of a time series reduced to at most the target number of data points.
+
+    Args:
+        time_series: The time series to downsample.
+        mode: The method of selecting or aggregating data points.
+        target_points: The maximum number of data points to retain.
+
+    Returns:
+        A downsampled copy of the time series or the time series if it does not exceed the
+        target number of data points.
+    """
+    data_points = time_series.data_points
+    if len(data_points) <= target_points:
+        return time_series
+
+    timestamps = numpy.fromiter(
+        (data_point.time.timestamp() for data_point in data_points),
+        dtype=float,
+        count=len(data_points),
+    )
+    values = numpy.fromiter(
+        (data_point.value for data_point in data_points),
+        dtype=float,
+        count=len(data_points),
+    )
+
+    if mode == DownsamplingMode.lttb:
+        indices = lttb_indices(timestamps, values, target_points)
+        downsampled = [data_points[i] for i in indices.tolist()]
+
+    else:
+        # Split into buckets of (nearly) equal size, reducing each with a single ufunc call
+        edges = numpy.linspace(0, len(data_points), target_points + 1).astype(int)
+        starts = edges[:-1]
+        if mode == DownsamplingMode.mean:
+            sizes = numpy.diff(edges)
+            mean_timestamps = numpy.add.reduceat(timestamps, starts) / sizes
+            mean_values = numpy.add.reduceat(values, starts) / sizes
+            tzinfo = data_points[0].time.tzinfo
+            downsampled = [
+                DataPoint.construct(
+                    metric=time_series.metric,
+                    time=datetime.datetime.fromtimestamp(timestamp, tz=tzinfo),
+                    value=value,
+                )
+                for timestamp, value in zip(
+                    mean_timestamps.tolist(), mean_values.tolist()
+                )
+            ]
+
+        elif mode == DownsamplingMode.max:
+            # Select the first maximum of each bucket via a stable sort on (bucket, -value)
+            buckets = numpy.repeat(numpy.arange(target_points), numpy.diff(edges))
+            order = numpy.lexsort((-values, buckets))
+            indices = order[starts]
+            downsampled = [data_points[i] for i in indices.tolist()]
+
+        else:
+            raise ValueError(f"unknown downsampling mode: {mode}")
+
+    return time_series.copy(update={"data_points": downsampled})
+
+
+def lttb_indices(
+    timestamps: numpy.ndarray, values: numpy.ndarray, target_points: int
+) -> numpy.ndarray:
+    """Return the indices of the data points selected by the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last data points are always selected. The remaining data points are split
+    into `target_points - 2` buckets and the data point of each bucket forming the largest
+    triangle with the previously selected data point and the average of the next bucket is
+    selected.
+
+    See https://skemman.is/bitstream/1946/15343/3/SS_MSthesis.pdf
+
+    Args:
+        timestamps: The times of the data points in ascending order.
+        values: The values of the data points.
+        target_points: The number of data points to select.
+
+    Returns:
+        An array of the indices of the selected data points in ascending order.
+    """
+    count = len(timestamps)
+    if count <= target_points:
+        return numpy.arange(count)
+
+    edges = numpy.linspace(1, count - 1, target_points - 1).astype(int)
+    indices = numpy.empty(target_points, dtype=int)
+    indices[0], indices[-1] = 0, count - 1
+
+    selected = 0
+    for bucket in range(target_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_end = end, edges[bucket + 2]
+            average_timestamp = timestamps[next_start:next_end].mean()
+            average_value = values[next_start:next_end].mean()
+        else:
+            average_timestamp, average_value = timestamps[-1], values[-1]
+
+        areas = numpy.abs(
+            (timestamps[selected] - average_timestamp)
+            * (values[start:end] - values[selected])
+            - (timestamps[selected] - timestamps[start:end])
+            * (average_value - values[selected])
+        )
+        selected = start + int(numpy.argmax(areas))
+        indices[bucket + 1] = selected
+
+    return indices
@@ -13,6 +13,7 @@ __all__ = (
     "ConnectorNotFoundError",
     "EventAbortedError",
     "EventCancelledError",
+    "EventDeadlineExceededError",
     "EventHandlersNotFoundError",
     "EventError",
     "MeasurementFailedError",
@@ -121,6 +122,10 @@ class EventCancelledError(EventError):
     """The event was cancelled and processing was halted."""
 
 
+class EventDeadlineExceededError(EventError):
+    """The event was not handled before its deadline and processing was halted."""
+
+
 class MeasurementFailedError(EventError):
     """A failure occurred while attempting to perform a measurement.
 
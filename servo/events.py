@@ -6,19 +6,23 @@ import contextvars
 import datetime
 import enum
 import functools
+import graphlib
 import inspect
 import sys
+import time
 import types
 import weakref
 from typing import (
     Any,
     AsyncContextManager,
+    AsyncIterator,
     Awaitable,
     Callable,
     Dict,
     List,
     Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -29,6 +33,7 @@ import pydantic.typing
 
 import servo.errors
 import servo.pubsub
+import servo.tracing
 import servo.utilities.inspect
 import servo.utilities.strings
 
@@ -39,6 +44,8 @@ __all__ = [
     "Preposition",
     "create_event",
     "current_event",
+    "current_deadline",
+    "deadline_timeout",
     "event",
     "before_event",
     "on_event",
@@ -63,10 +70,46 @@ def current_event() -> Optional[EventContext]:
     return _current_context_var.get()
 
 
+# The deadline of the actively executing event dispatch as a `time.monotonic()` timestamp
+_current_deadline_var = contextvars.ContextVar("servox.current_deadline", default=None)
+
+
+def current_deadline() -> Optional[float]:
+    """
+    Returns the deadline of the actively executing event dispatch as a `time.monotonic()`
+    timestamp, if any.
+
+    Handlers of events dispatched with a deadline are cancelled once it passes. Connectors
+    performing I/O should derive their timeouts from the deadline via `deadline_timeout` so
+    that requests are not left outstanding beyond it.
+    """
+    return _current_deadline_var.get()
+
+
+def deadline_timeout(timeout: Optional[float] = None) -> Optional[float]:
+    """
+    Returns the lesser of the given timeout in seconds and the time remaining until the
+    deadline of the actively executing event dispatch.
+
+    Returns the timeout unchanged when there is no deadline and never returns a negative value.
+    """
+    deadline = _current_deadline_var.get()
+    if deadline is None:
+        return timeout
+
+    remaining = max(deadline - time.monotonic(), 0.0)
+    return remaining if timeout is None else min(timeout, remaining)
+
+
 _connector_event_bus = weakref.WeakKeyDictionary()
 
 _signature_cache: Dict[str, inspect.Signature] = {}
 
+# Compiled event handler tables keyed by connector class, see `Mixin.event_handler_table`
+_event_handler_tables = weakref.WeakKeyDictionary()
+
+EventHandlerTable = Dict[Tuple[str, "Preposition"], Tuple["EventHandler", ...]]
+
 
 class Event(pydantic.BaseModel):
     """
@@ -289,6 +332,8 @@ class EventHandler(pydantic.BaseModel):
     kwargs: Dict[str, Any]
     connector_type: Optional[Type["Mixin"]] = None  # NOTE: Optional due to decorator
     handler: EventCallable
+    depends_on: List[str] = []
+    """Names of connectors whose before handlers must complete before this handler runs concurrently."""
 
     def __str__(self):
         return f"{self.connector_type}({self.preposition}:{self.event}->{self.handler})"
@@ -454,7 +499,10 @@ def event(
 
 
 def before_event(
-    event: Optional[str] = None, **kwargs
+    event: Optional[str] = None,
+    *,
+    depends_on: Optional[List[str]] = None,
+    **kwargs,
 ) -> Callable[[EventCallable], EventCallable]:
     """Register a decorated function as an event handler to be run before the specified event.
 
@@ -463,10 +511,14 @@ def before_event(
     can cancel event propagation by raising `servo.errors.EventCancelledError`. Cancelled events are reported to the
     event originator by attaching the `servo.errors.EventCancelledError` instance to the `EventResult`.
 
+    When before handlers are dispatched concurrently, the handler is run once the before handlers of the
+    connectors named in `depends_on` have completed. Dependencies are ignored when dispatching sequentially.
+
     :param event: The event or name of the event to run the handler before.
+    :param depends_on: Names of connectors whose before handlers must complete before the handler runs.
     :param kwargs: An optional dictionary of supplemental arguments to be passed when the handler is called.
     """
-    return event_handler(event, Preposition.before, **kwargs)
+    return event_handler(event, Preposition.before, depends_on=depends_on, **kwargs)
 
 
 def on_event(
@@ -497,6 +549,8 @@ def after_event(
 def event_handler(
     event_name: Optional[str] = None,
     preposition: Preposition = Preposition.on,
+    *,
+    depends_on: Optional[List[str]] = None,
     **kwargs,
 ) -> Callable[[EventCallable], EventCallable]:
     """Register a decorated function as an event handler.
@@ -508,8 +562,12 @@ def event_handler(
 
     :param event: Specifies the event name. If not given, inferred from the name of the decorated handler function.
     :param preposition: Specifies the sequencing of a handler in relation to the event.
+    :param depends_on: Names of connectors whose before handlers must complete before a before handler
+        runs concurrently.
     :param kwargs: An optional dictionary of supplemental arguments to be passed when the handler is called.
     """
+    if depends_on and preposition != Preposition.before:
+        raise ValueError("dependencies can only be declared by before event handlers")
 
     def decorator(fn: EventCallable) -> EventCallable:
         name = event_name if event_name else fn.__name__
@@ -577,7 +635,11 @@ def event_handler(
 
         # Annotate the function for processing later, see Connector.__init_subclass__
         fn.__event_handler__ = EventHandler(
-            event=event, preposition=preposition, handler=fn, kwargs=kwargs
+            event=event,
+            preposition=preposition,
+            handler=fn,
+            kwargs=kwargs,
+            depends_on=depends_on or [],
         )
         return fn
 
@@ -661,18 +723,46 @@ class Mixin:
 
         return value
 
+    @classmethod
+    def event_handler_table(cls) -> EventHandlerTable:
+        """
+        Returns a table of the event handlers of the class keyed by event name and individual preposition.
+
+        The table is compiled on first use and recompiled when event handlers are added.
+        """
+        event_handlers = cls.__event_handlers__
+        version = (id(event_handlers), len(event_handlers))
+        if compiled := _event_handler_tables.get(cls):
+            compiled_version, table = compiled
+            if compiled_version == version:
+                return table
+
+        table: Dict[Tuple[str, Preposition], List[EventHandler]] = {}
+        for handler in event_handlers:
+            table.setdefault((handler.event.name, handler.preposition), []).append(
+                handler
+            )
+        table = {key: tuple(handlers) for key, handlers in table.items()}
+        _event_handler_tables[cls] = (version, table)
+        return table
+
     @classmethod
     def responds_to_event(cls, event: Union[Event, str]) -> bool:
         """
         Returns True if the Connector processes the specified event (before, on, or after).
         """
-        if isinstance(event, str):
-            event = get_event(event)
-
-        handlers = list(
-            filter(lambda handler: handler.event == event, cls.__event_handlers__)
+        name = event if isinstance(event, str) else event.name
+        return any(
+            (name, preposition) in cls.event_handler_table()
+            for preposition in (Preposition.before, Preposition.on, Preposition.after)
         )
-        return len(handlers) > 0
+
+    @classmethod
+    def has_event_handlers(cls, event: Event, preposition: Preposition) -> bool:
+        """
+        Returns True if the Connector has event handlers for the given event and individual preposition.
+        """
+        return (event.name, preposition) in cls.event_handler_table()
 
     @classmethod
     def get_event_handlers(
@@ -684,6 +774,9 @@ class Mixin:
         if isinstance(event, str):
             event = get_event(event, None)
 
+        if event is not None and preposition.flag:
+            return list(cls.event_handler_table().get((event.name, preposition), ()))
+
         return list(
             filter(
                 lambda handler: handler.event == event
@@ -721,6 +814,8 @@ class Mixin:
         include: Optional[List[Union[str, Mixin]]] = None,
         exclude: Optional[List[Union[str, Mixin]]] = None,
         return_exceptions: bool = False,
+        concurrent_before: bool = False,
+        deadline: Union[None, float, datetime.timedelta] = None,
         _prepositions: Preposition = (
             Preposition.before | Preposition.on | Preposition.after
         ),
@@ -761,6 +856,14 @@ class Mixin:
                 dispatch.
             return_exceptions: When True, exceptions raised by on event handlers
                 are returned as event results.
+            concurrent_before: When True, before event handlers of different
+                connectors are run concurrently, respecting the dependencies they
+                declare. Cancellation by any before handler cancels the others.
+            deadline: The time by which the event must be handled, as a
+                `time.monotonic()` timestamp or a duration from now. Handlers
+                still running at the deadline are cancelled and fail with an
+                `EventDeadlineExceededError`. Events dispatched while handling
+                an event with an earlier deadline inherit it.
 
         Returns:
             A list of event result objects detailing the results returned.
@@ -768,6 +871,30 @@ class Mixin:
         connectors: List[Mixin] = self.__connectors__
         event = get_event(event) if isinstance(event, str) else event
 
+        if isinstance(deadline, datetime.timedelta):
+            deadline = time.monotonic() + deadline.total_seconds()
+        if (inherited_deadline := _current_deadline_var.get()) is not None:
+            deadline = (
+                inherited_deadline
+                if deadline is None
+                else min(deadline, inherited_deadline)
+            )
+
+        if include is None and exclude is None:
+            # Fast path: dispatching to the entire graph requires no filtering or validation
+            return _DispatchEvent(
+                connectors=connectors,
+                event=event,
+                parent=self,
+                args=args,
+                first=first,
+                return_exceptions=return_exceptions,
+                concurrent_before=concurrent_before,
+                deadline=deadline,
+                _prepositions=_prepositions,
+                kwargs=kwargs,
+            )
+
         if include is not None:
             included_names = list(
                 map(lambda c: c if isinstance(c, str) else c.name, include)
@@ -797,10 +924,31 @@ class Mixin:
             include=include,
             exclude=exclude,
             return_exceptions=return_exceptions,
+            concurrent_before=concurrent_before,
+            deadline=deadline,
             _prepositions=_prepositions,
             kwargs=kwargs,
         )
 
+    async def _invoke_event_handler(
+        self,
+        event: Event,
+        event_handler: EventHandler,
+        method: Callable[..., Any],
+        args: Sequence[Any],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        async with event.on_handler_context_manager(self):
+            # NOTE: Coroutines run in a task of their own so that context variables
+            # set by a handler do not leak into the dispatcher or later handlers
+            if asyncio.iscoroutinefunction(event_handler.handler):
+                return await asyncio.create_task(
+                    method(*args, **kwargs),
+                    name=f"{event_handler.preposition}:{event}",
+                )
+            else:
+                return method(*args, **kwargs)
+
     async def run_event_handlers(
         self,
         event: Event,
@@ -834,14 +982,30 @@ class Mixin:
                     merged_kwargs.update(kwargs)
                     try:
                         method = types.MethodType(event_handler.handler, self)
-                        async with event.on_handler_context_manager(self):
-                            if asyncio.iscoroutinefunction(method):
-                                value = await asyncio.create_task(
-                                    method(*args, **merged_kwargs),
-                                    name=f"{preposition}:{event}",
-                                )
+                        with servo.tracing.span(
+                            f"{preposition}:{event}",
+                            "event",
+                            connector=self.name,
+                            event=event.name,
+                            preposition=preposition.name,
+                        ):
+                            invocation = self._invoke_event_handler(
+                                event, event_handler, method, args, merged_kwargs
+                            )
+                            if (timeout := deadline_timeout()) is None:
+                                value = await invocation
                             else:
-                                value = method(*args, **merged_kwargs)
+                                try:
+                                    value = await asyncio.wait_for(invocation, timeout)
+                                except asyncio.TimeoutError:
+                                    self.logger.warning(
+                                        f"{preposition}:{event} handler cancelled: deadline exceeded"
+                                    )
+                                    raise servo.errors.EventDeadlineExceededError(
+                                        f"{preposition}:{event} handler did not complete before the deadline",
+                                        connector=self,
+                                        event=event,
+                                    ) from None
 
                         result = EventResult(
                             connector=self,
@@ -899,6 +1063,8 @@ class _DispatchEvent:
         include: Optional[List[Union[str, Mixin]]] = None,
         exclude: Optional[List[Union[str, Mixin]]] = None,
         return_exceptions: bool = False,
+        concurrent_before: bool = False,
+        deadline: Optional[float] = None,
         _prepositions: Preposition = (
             Preposition.before | Preposition.on | Preposition.after
         ),
@@ -912,6 +1078,8 @@ class _DispatchEvent:
         self._include = include
         self._exclude = exclude
         self._return_exceptions = return_exceptions
+        self._concurrent_before = concurrent_before
+        self._deadline = deadline
         self._prepositions = _prepositions
         self._parent = parent
         self._kwargs = kwargs
@@ -982,38 +1150,199 @@ class _DispatchEvent:
         # Iterate through the channel
         return self._channel.__aiter__()
 
+    def _connectors_with_handlers(self, preposition: Preposition) -> List[Mixin]:
+        """Return the target connectors that have handlers for the event and preposition."""
+        return [
+            connector
+            for connector in self._connectors
+            if connector.has_event_handlers(self.event, preposition)
+        ]
+
+    async def _run_before_handlers(self, connector: Mixin) -> None:
+        await connector.run_event_handlers(
+            self.event,
+            Preposition.before,
+            *self._args,
+            return_exceptions=False,
+            **self._kwargs,
+        )
+
+    async def _run_before_handlers_concurrently(self, connectors: List[Mixin]) -> None:
+        """Run the before handlers of the connectors concurrently in dependency order.
+
+        Dependencies on connectors that are not targeted or have no before handlers are
+        ignored. The first exception raised cancels the handlers still running.
+        """
+        connectors_by_name = {connector.name: connector for connector in connectors}
+        sorter = graphlib.TopologicalSorter(
+            {
+                connector.name: {
+                    dependency
+                    for handler in connector.event_handler_table()[
+                        (self.event.name, Preposition.before)
+                    ]
+                    for dependency in handler.depends_on
+                    if dependency in connectors_by_name
+                }
+                for connector in connectors
+            }
+        )
+        sorter.prepare()  # Raises `graphlib.CycleError` on circular dependencies
+
+        tasks: Dict[asyncio.Task, str] = {}
+        try:
+            while sorter.is_active():
+                for name in sorter.get_ready():
+                    task = asyncio.create_task(
+                        self._run_before_handlers(connectors_by_name[name]),
+                        name=f"before:{self.event} ({name})",
+                    )
+                    tasks[task] = name
+
+                done, _ = await asyncio.wait(
+                    tasks.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    name = tasks.pop(task)
+                    task.result()
+                    sorter.done(name)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run_all_before_handlers(self) -> bool:
+        """Run the before handlers of the target connectors.
+
+        Returns False if a before handler cancelled the event.
+        """
+        if not self._prepositions & Preposition.before:
+            return True
+
+        connectors = self._connectors_with_handlers(Preposition.before)
+        try:
+            if self._concurrent_before:
+                await self._run_before_handlers_concurrently(connectors)
+            else:
+                for connector in connectors:
+                    await self._run_before_handlers(connector)
+
+        except servo.errors.EventCancelledError as error:
+            servo.logger.warning(
+                f'event cancelled by before event handler on connector "{error.__event_result__.connector.name}": {error}'
+            )
+            return False
+
+        return True
+
+    async def _run_after_handlers(self, results: List[EventResult]) -> None:
+        """Run the after handlers of the target connectors with the results and close the channel."""
+        if self._prepositions & Preposition.after:
+            await asyncio.gather(
+                *list(
+                    map(
+                        lambda c: c.run_event_handlers(
+                            self.event, Preposition.after, results
+                        ),
+                        self._connectors_with_handlers(Preposition.after),
+                    )
+                )
+            )
+
+        if self.channel:
+            await self.channel.close()
+
+    async def _with_deadline(self, awaitable: Awaitable[Any]) -> Any:
+        """Await an awaitable with the deadline of the dispatch as the current deadline."""
+        token = _current_deadline_var.set(self._deadline)
+        try:
+            return await awaitable
+        finally:
+            _current_deadline_var.reset(token)
+
+    async def as_completed(self) -> AsyncIterator[EventResult]:
+        """Run the Event dispatch operation, yielding the results of on event handlers as they complete.
+
+        Results are yielded in the order that connectors finish handling the event rather than
+        the order of the connectors, allowing callers to process fast connectors while slow
+        ones are still running. Before handlers run ahead of any on handler and after handlers
+        are invoked with all of the results once iteration is exhausted. Handlers still running
+        when iteration is abandoned are cancelled.
+        """
+        if self.done:
+            raise RuntimeError(f"Event dispatch has already run")
+        if self._first:
+            raise ValueError(
+                "cannot dispatch as completed when a single responder is requested"
+            )
+
+        self._run = True
+        results: List[EventResult] = []
+        # NOTE: The deadline is propagated explicitly rather than set across yields, which
+        # would leak it into the context of the caller
+        if not await self._with_deadline(self._run_all_before_handlers()):
+            self._results = results
+            return
+
+        if self._prepositions & Preposition.on:
+            tasks = [
+                asyncio.create_task(
+                    self._with_deadline(
+                        connector.run_event_handlers(
+                            self.event,
+                            Preposition.on,
+                            *self._args,
+                            return_exceptions=self._return_exceptions,
+                            **self._kwargs,
+                        )
+                    ),
+                    name=f"{self.event} ({connector.name})",
+                )
+                for connector in self._connectors_with_handlers(Preposition.on)
+            ]
+            try:
+                for next_completed in asyncio.as_completed(tasks):
+                    for result in await next_completed or []:
+                        results.append(result)
+                        yield result
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        await self._with_deadline(self._run_after_handlers(results))
+        self._results = results
+
     async def run(self) -> List[EventResult]:
         """Run the Event dispatch operation to completion and return results."""
         if self.done:
             raise RuntimeError(f"Event dispatch has already run")
 
         self._run = True
+        token = _current_deadline_var.set(self._deadline)
+        try:
+            with servo.tracing.span(
+                f"dispatch:{self.event}",
+                "dispatch",
+                event=self.event.name,
+                connectors=len(self._connectors),
+            ):
+                return await self._run_to_completion()
+        finally:
+            _current_deadline_var.reset(token)
+
+    async def _run_to_completion(self) -> List[EventResult]:
         results: List[EventResult] = []
 
         # Invoke the before event handlers
-        if self._prepositions & Preposition.before:
-            for connector in self._connectors:
-                try:
-                    results = await connector.run_event_handlers(
-                        self.event,
-                        Preposition.before,
-                        *self._args,
-                        return_exceptions=False,
-                        **self._kwargs,
-                    )
-
-                except servo.errors.EventCancelledError as error:
-                    # Return an empty result set
-                    servo.logger.warning(
-                        f'event cancelled by before event handler on connector "{connector.name}": {error}'
-                    )
-                    return []
+        if not await self._run_all_before_handlers():
+            return []
 
         # Invoke the on event handlers and gather results
         if self._prepositions & Preposition.on:
             if self._first:
                 # A single responder has been requested
-                for connector in self._connectors:
+                for connector in self._connectors_with_handlers(Preposition.on):
                     results = await connector.run_event_handlers(
                         self.event,
                         Preposition.on,
@@ -1034,7 +1363,7 @@ class _DispatchEvent:
                                 *self._args,
                                 **self._kwargs,
                             ),
-                            self._connectors,
+                            self._connectors_with_handlers(Preposition.on),
                         )
                     ),
                 )
@@ -1043,20 +1372,7 @@ class _DispatchEvent:
                 results = functools.reduce(lambda x, y: x + y, results, [])
 
         # Invoke the after event handlers
-        if self._prepositions & Preposition.after:
-            await asyncio.gather(
-                *list(
-                    map(
-                        lambda c: c.run_event_handlers(
-                            self.event, Preposition.after, results
-                        ),
-                        self._connectors,
-                    )
-                )
-            )
-
-        if self.channel:
-            await self.channel.close()
+        await self._run_after_handlers(results)
 
         return next(iter(results), None) if self._first else results
 
@@ -1,21 +1,59 @@
+import asyncio
 import collections
+import inspect
 import decimal
 import enum
 import datetime
+import math
 import operator
 import pydantic
-import statistics
-from typing import Awaitable, Callable, Dict, List, Optional
+from typing import (
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import devtools
 
 import servo
 import servo.errors
 import servo.configuration
+import servo.pubsub
 import servo.types
 
 SLO_FAILED_REASON = "slo-violation"
 
+# Decodes a pub/sub Message into a mapping of metric names to readings (optionally awaitable)
+ReadingsDecoder = Callable[
+    [servo.pubsub.Message, servo.pubsub.Channel],
+    Union[
+        Dict[str, List[servo.types.Reading]],
+        Awaitable[Dict[str, List[servo.types.Reading]]],
+    ],
+]
+
+
+async def decode_readings(
+    decoder: ReadingsDecoder,
+    message: servo.pubsub.Message,
+    channel: servo.pubsub.Channel,
+) -> Dict[str, List[servo.types.Reading]]:
+    """Decode a pub/sub Message into readings with a synchronous or asynchronous decoder."""
+    readings = decoder(message, channel)
+    if inspect.isawaitable(readings):
+        readings = await readings
+    return readings
+
+
+T = TypeVar("T")
+
 
 class SloOutcomeStatus(str, enum.Enum):
     passed = "passed"
@@ -52,17 +90,106 @@ class SloOutcome(pydantic.BaseModel):
         return f"{self.checked_at} {message}"
 
 
+class _SloCheck(NamedTuple):
+    """A compact record of a single SLO check retained in a condition window."""
+
+    status: SloOutcomeStatus
+    checked_at: datetime.datetime
+    metric_value: Optional[float] = None
+    threshold_value: Optional[float] = None
+    metric_readings: Optional[List[servo.types.Reading]] = None
+    threshold_readings: Optional[List[servo.types.Reading]] = None
+
+    def to_outcome(self) -> SloOutcome:
+        return SloOutcome(
+            status=self.status,
+            checked_at=self.checked_at,
+            metric_readings=self.metric_readings,
+            threshold_readings=self.threshold_readings,
+            metric_value=_to_decimal(self.metric_value),
+            threshold_value=_to_decimal(self.threshold_value),
+        )
+
+
+class _SloWindow:
+    """A fixed capacity ring buffer of SLO checks for a single condition.
+
+    A running count of failed checks is maintained as checks are appended and
+    evicted so that evaluating the trigger window does not require a scan.
+    """
+
+    __slots__ = (
+        "condition",
+        "threshold",
+        "keep_op",
+        "failures",
+        "_checks",
+        "_index",
+        "_size",
+    )
+
+    def __init__(self, condition: servo.types.SloCondition) -> None:
+        self.condition = condition
+        self.threshold: Optional[float] = (
+            float(condition.threshold * condition.threshold_multiplier)
+            if condition.threshold is not None
+            else None
+        )
+        self.keep_op = _get_keep_operator(condition.keep)
+        self.failures = 0
+        self._checks: List[Optional[_SloCheck]] = [None] * condition.trigger_window
+        self._index = 0
+        self._size = 0
+
+    def append(self, check: _SloCheck) -> None:
+        capacity = len(self._checks)
+        if self._size == capacity:
+            evicted = self._checks[self._index]
+            if evicted.status == SloOutcomeStatus.failed:
+                self.failures -= 1
+        else:
+            self._size += 1
+
+        self._checks[self._index] = check
+        self._index = (self._index + 1) % capacity
+        if check.status == SloOutcomeStatus.failed:
+            self.failures += 1
+
+    @property
+    def last(self) -> Optional[_SloCheck]:
+        if self._size == 0:
+            return None
+        return self._checks[self._index - 1]
+
+    @property
+    def triggered(self) -> bool:
+        return self.failures >= self.condition.trigger_count
+
+    def outcomes(self) -> List[SloOutcome]:
+        """Return the checks in the window as SloOutcome models, oldest first."""
+        capacity = len(self._checks)
+        start = (self._index - self._size) % capacity
+        return [
+            self._checks[(start + offset) % capacity].to_outcome()
+            for offset in range(self._size)
+        ]
+
+
 class FastFailObserver(pydantic.BaseModel):
     config: servo.configuration.FastFailConfiguration
     input: servo.types.SloInput
-    metrics_getter: Callable[
-        [datetime.datetime, datetime.datetime],
-        Awaitable[Dict[str, List[servo.types.Reading]]],
-    ]
-
-    _results: Dict[servo.types.SloCondition, List[SloOutcome]] = pydantic.PrivateAttr(
-        default=collections.defaultdict(list)
-    )
+    metrics_getter: Optional[
+        Callable[
+            [datetime.datetime, datetime.datetime],
+            Awaitable[Dict[str, List[servo.types.Reading]]],
+        ]
+    ] = None
+
+    _windows: List[_SloWindow] = pydantic.PrivateAttr(default_factory=list)
+    _pushed_readings: Dict[
+        str, Deque[Tuple[datetime.datetime, servo.types.Reading]]
+    ] = pydantic.PrivateAttr(default_factory=dict)
+    _started_at: Optional[datetime.datetime] = pydantic.PrivateAttr(None)
 
     async def observe(self, progress: servo.EventProgress) -> None:
         if progress.elapsed < self.config.skip:
@@ -72,126 +199,215 @@ class FastFailObserver(pydantic.BaseModel):
         metrics = await self.metrics_getter(checked_at - self.config.span, checked_at)
         self.check_readings(metrics=metrics, checked_at=checked_at)
 
+    async def guard(
+        self,
+        operation: Awaitable[T],
+        *,
+        exchange: servo.pubsub.Exchange,
+        selector: servo.pubsub.Selector,
+        decoder: ReadingsDecoder,
+    ) -> T:
+        """Await an operation while evaluating SLOs against readings pushed through pub/sub.
+
+        Messages published to Channels matching the selector are decoded into readings
+        and checked as they arrive. When an SLO violation is observed, the operation is
+        cancelled and the violation is raised in its place.
+
+        Args:
+            operation: The awaitable to guard (typically the body of a measurement).
+            exchange: The pub/sub Exchange to subscribe to.
+            selector: A string or regular expression pattern matching Channels of interest.
+            decoder: A callable that decodes Messages into a mapping of metric names to readings.
+
+        Raises:
+            EventAbortedError: Raised if an SLO violation is observed before the operation completes.
+
+        Returns:
+            The result of the operation.
+        """
+        task = asyncio.ensure_future(operation)
+        violation: Optional[servo.errors.EventAbortedError] = None
+        self._started_at = datetime.datetime.now()
+
+        async def _message_received(
+            message: servo.pubsub.Message, channel: servo.pubsub.Channel
+        ) -> None:
+            nonlocal violation
+            if violation is not None or task.done():
+                return
+
+            readings = await decode_readings(decoder, message, channel)
+            if violation is not None or task.done():
+                return
+
+            try:
+                self.observe_readings(readings, received_at=datetime.datetime.now())
+            except servo.errors.EventAbortedError as error:
+                violation = error
+                task.cancel()
+
+        subscriber = exchange.create_subscriber(selector, callback=_message_received)
+        try:
+            return await task
+        except asyncio.CancelledError:
+            if violation is not None:
+                raise violation from None
+            raise
+        finally:
+            exchange.remove_subscriber(subscriber)
+
+    def observe_readings(
+        self,
+        readings: Dict[str, List[servo.types.Reading]],
+        received_at: datetime.datetime,
+    ) -> None:
+        """Buffer readings pushed to the observer and check the SLOs against the current span.
+
+        Readings older than the configured span are evicted. Checks are not performed
+        until the configured skip duration has elapsed since observation started.
+        """
+        for metric_name, metric_readings in readings.items():
+            buffer = self._pushed_readings.setdefault(metric_name, collections.deque())
+            buffer.extend((received_at, reading) for reading in metric_readings)
+
+        horizon = received_at - self.config.span
+        for buffer in self._pushed_readings.values():
+            while buffer and buffer[0][0] < horizon:
+                buffer.popleft()
+
+        if (
+            self._started_at is not None
+            and received_at - self._started_at < self.config.skip
+        ):
+            return
+
+        metrics = {
+            metric_name: [reading for _, reading in buffer]
+            for metric_name, buffer in self._pushed_readings.items()
+            if buffer
+        }
+        self.check_readings(metrics=metrics, checked_at=received_at)
+
     def check_readings(
         self,
         metrics: Dict[str, List[servo.types.Reading]],
         checked_at: datetime.datetime,
     ) -> None:
-        failures: Dict[servo.types.SloCondition, List[SloOutcome]] = {}
-        for condition in self.input.conditions:
-            result_args = dict(checked_at=checked_at)
-            # Evaluate target metric
-            metric_readings = metrics.get(condition.metric)
-            if not metric_readings:
-                self._results[condition].append(
-                    SloOutcome(**result_args, status=SloOutcomeStatus.missing_metric)
+        if not self._windows:
+            self._windows = list(map(_SloWindow, self.input.conditions))
+
+        # Aggregate each referenced metric at most once per check
+        scalars: Dict[str, Optional[float]] = {}
+
+        def _scalar(metric_name: str) -> Optional[float]:
+            if metric_name not in scalars:
+                readings = metrics.get(metric_name)
+                scalars[metric_name] = (
+                    _get_scalar_from_readings(readings) if readings else None
                 )
-                continue
+            return scalars[metric_name]
 
-            metric_value = _get_scalar_from_readings(metric_readings)
-            result_args.update(
-                metric_value=metric_value, metric_readings=metric_readings
-            )
+        failed_windows: List[_SloWindow] = []
+        for window in self._windows:
+            condition = window.condition
+            # Evaluate target metric
+            metric_value = _scalar(condition.metric)
+            if metric_value is None:
+                window.append(_SloCheck(SloOutcomeStatus.missing_metric, checked_at))
+                continue
 
-            if self.config.treat_zero_as_missing and float(metric_value) == 0:
-                self._results[condition].append(
-                    SloOutcome(**result_args, status=SloOutcomeStatus.missing_metric)
+            # NOTE: Checks reference the readings of the span rather than copying them
+            readings = dict(metric_readings=metrics[condition.metric])
+            if self.config.treat_zero_as_missing and metric_value == 0:
+                window.append(
+                    _SloCheck(
+                        SloOutcomeStatus.missing_metric,
+                        checked_at,
+                        metric_value,
+                        **readings,
+                    )
                 )
                 continue
 
             # Evaluate threshold
-            threshold_readings = None
-            if condition.threshold is not None:
-                threshold_value = condition.threshold * condition.threshold_multiplier
-
-                result_args.update(
-                    threshold_value=threshold_value,
-                    threshold_readings=threshold_readings,
-                )
-            elif condition.threshold_metric is not None:
-                threshold_readings = metrics.get(condition.threshold_metric)
-                if not threshold_readings:
-                    self._results[condition].append(
-                        SloOutcome(
-                            **result_args, status=SloOutcomeStatus.missing_threshold
+            if window.threshold is not None:
+                threshold_value = window.threshold
+            else:
+                threshold_scalar = _scalar(condition.threshold_metric)
+                if threshold_scalar is None:
+                    window.append(
+                        _SloCheck(
+                            SloOutcomeStatus.missing_threshold,
+                            checked_at,
+                            metric_value,
+                            **readings,
                         )
                     )
                     continue
 
-                threshold_scalar = _get_scalar_from_readings(threshold_readings)
-                threshold_value = threshold_scalar * condition.threshold_multiplier
-
-                result_args.update(
-                    threshold_value=threshold_value,
-                    threshold_readings=threshold_readings,
+                threshold_value = threshold_scalar * float(
+                    condition.threshold_multiplier
                 )
+                check_args = (checked_at, metric_value, threshold_value)
+                readings.update(threshold_readings=metrics[condition.threshold_metric])
 
-                if self.config.treat_zero_as_missing and float(threshold_value) == 0:
-                    self._results[condition].append(
-                        SloOutcome(
-                            **result_args, status=SloOutcomeStatus.missing_threshold
+                if self.config.treat_zero_as_missing and threshold_value == 0:
+                    window.append(
+                        _SloCheck(
+                            SloOutcomeStatus.missing_threshold, *check_args, **readings
                         )
                     )
                     continue
 
                 elif 0 <= metric_value <= condition.slo_metric_minimum:
-                    self._results[condition].append(
-                        SloOutcome(**result_args, status=SloOutcomeStatus.zero_metric)
+                    window.append(
+                        _SloCheck(SloOutcomeStatus.zero_metric, *check_args, **readings)
                     )
                     continue
 
                 elif 0 <= threshold_value <= condition.slo_threshold_minimum:
-                    self._results[condition].append(
-                        SloOutcome(
-                            **result_args, status=SloOutcomeStatus.zero_threshold
+                    window.append(
+                        _SloCheck(
+                            SloOutcomeStatus.zero_threshold, *check_args, **readings
                         )
                     )
                     continue
 
-            if metric_value.is_nan() or threshold_value.is_nan():
-                self._results[condition].append(
-                    SloOutcome(**result_args, status=SloOutcomeStatus.missing_threshold)
+            check_args = (checked_at, metric_value, threshold_value)
+            if math.isnan(metric_value) or math.isnan(threshold_value):
+                window.append(
+                    _SloCheck(
+                        SloOutcomeStatus.missing_threshold, *check_args, **readings
+                    )
                 )
                 continue
 
             # Check target against threshold
-            check_passed_op = _get_keep_operator(condition.keep)
-            if check_passed_op(metric_value, threshold_value):
-                self._results[condition].append(
-                    SloOutcome(**result_args, status=SloOutcomeStatus.passed)
+            if window.keep_op(metric_value, threshold_value):
+                window.append(
+                    _SloCheck(SloOutcomeStatus.passed, *check_args, **readings)
                 )
             else:
-                self._results[condition].append(
-                    SloOutcome(**result_args, status=SloOutcomeStatus.failed)
+                window.append(
+                    _SloCheck(SloOutcomeStatus.failed, *check_args, **readings)
                 )
 
-            # Update window by slicing last n items from list where n is trigger_window
-            self._results[condition] = self._results[condition][
-                -condition.trigger_window :
-            ]
-
-            if (
-                len(
-                    list(
-                        filter(
-                            lambda res: res.status == SloOutcomeStatus.failed,
-                            self._results[condition],
-                        )
-                    )
-                )
-                >= condition.trigger_count
-            ):
-                failures[condition] = self._results[condition]
+            if window.triggered:
+                failed_windows.append(window)
 
-        servo.logger.debug(f"SLO results: {devtools.pformat(self._results)}")
+        servo.logger.opt(lazy=True).debug(
+            "SLO results: {}",
+            lambda: devtools.pformat(
+                {str(w.condition): w.outcomes() for w in self._windows}
+            ),
+        )
 
         # Log the latest results
         last_results_buckets: Dict[
             SloOutcomeStatus, List[str]
         ] = collections.defaultdict(list)
-        for condition, results_list in self._results.items():
-            last_result = results_list[-1]
-            last_results_buckets[last_result.status].append(str(condition))
+        for window in self._windows:
+            last_results_buckets[window.last.status].append(str(window.condition))
 
         last_results_messages: List[str] = []
         for status, condition_str_list in last_results_buckets.items():
@@ -203,7 +419,8 @@ class FastFailObserver(pydantic.BaseModel):
             f"SLO statuses from last check: {', '.join(last_results_messages)}"
         )
 
-        if failures:
+        if failed_windows:
+            failures = {w.condition: w.outcomes() for w in failed_windows}
             raise servo.errors.EventAbortedError(
                 f"SLO violation(s) observed: {_get_results_str(failures)}",
                 reason=SLO_FAILED_REASON,
@@ -222,28 +439,37 @@ def _get_keep_operator(keep: servo.types.SloKeep):
 
 def _get_scalar_from_readings(
     metric_readings: List[servo.types.Reading],
-) -> decimal.Decimal:
+) -> float:
     instance_values = []
     for reading in metric_readings:
         # TODO: NewRelic APM returns 0 for missing metrics. Will need optional config to ignore 0 values
         #   when implementing fast fail for eventual servox newrelic connector
         if isinstance(reading, servo.types.DataPoint):
-            instance_values.append(decimal.Decimal(reading.value))
+            instance_values.append(float(reading.value))
         elif isinstance(reading, servo.types.TimeSeries):
-            timeseries_values = list(
-                map(lambda dp: decimal.Decimal(dp.value), reading.data_points)
-            )
-            if len(timeseries_values) > 1:
-                instance_values.append(statistics.mean(timeseries_values))
+            data_points = reading.data_points
+            if len(data_points) > 1:
+                instance_values.append(
+                    math.fsum(dp.value for dp in data_points) / len(data_points)
+                )
             else:
-                instance_values.append(timeseries_values[0])
+                instance_values.append(float(data_points[0].value))
         else:
             raise ValueError(f"Unknown metric reading type {type(reading)}")
 
     if len(instance_values) > 1:
-        return statistics.mean(instance_values)
+        return math.fsum(instance_values) / len(instance_values)
     else:
-        return decimal.Decimal(instance_values[0])
+        return instance_values[0]
+
+
+def _to_decimal(value: Optional[float]) -> Optional[decimal.Decimal]:
+    """Convert a float to a Decimal using its shortest round-tripping representation."""
+    if value is None:
+        return None
+    elif value.is_integer():
+        return decimal.Decimal(int(value))
+    return decimal.Decimal(repr(value))
 
 
 def _get_results_str(results: Dict[servo.types.SloCondition, List[SloOutcome]]) -> str:
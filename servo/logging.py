@@ -6,13 +6,14 @@ Logging is implemented on top of the
 from __future__ import annotations
 
 import asyncio
+import datetime
 import functools
 import logging
 import pathlib
 import sys
 import time
 import traceback
-from typing import Any, Awaitable, Callable, Optional
+from typing import Any, Awaitable, Callable, Optional, Tuple, Union
 
 import loguru
 
@@ -62,6 +63,10 @@ class Filter:
         return record["level"].no >= levelno
 
 
+# Progress is coalesced per optimizer ID, operation, and connector name
+_ProgressKey = Tuple[Optional[str], str, str]
+
+
 class ProgressHandler:
     """A logging handler that provides automatic progress reporting to the Opsani API.
 
@@ -69,6 +74,12 @@ class ProgressHandler:
     reporting to Opsani. Log messages annotated with a "progress" attribute are
     automatically picked up by the handler and reported back to the API via a callback.
 
+    When a minimum interval is given, progress is coalesced: only the latest progress for
+    each operation of a connector within a servo is retained and reported at most once per
+    interval. Without one, every progress update is reported as it is logged.
+    Terminal (100%) and failed (logged at error level or above) progress bypasses coalescing
+    and is reported immediately.
+
     NOTE: We call the logger re-entrantly for misconfigured progress logging attempts. The
         `progress` must be excluded on logger calls to avoid recursion.
     """
@@ -80,12 +91,21 @@ class ProgressHandler:
         exception_handler: Optional[
             Callable[[dict[str, Any], Exception], Optional[Awaitable[None]]]
         ] = None,
+        min_interval: Union[None, float, datetime.timedelta] = None,
     ) -> None:  # noqa: D107
         self._progress_reporter = progress_reporter
         self._error_reporter = error_reporter
         self._exception_handler = exception_handler
+        self._min_interval = (
+            min_interval.total_seconds()
+            if isinstance(min_interval, datetime.timedelta)
+            else min_interval
+        )
         self._queue: asyncio.Queue[Any] = asyncio.Queue()
         self._queue_processor: Optional[asyncio.Task[Any]] = None
+        self._pending: dict[_ProgressKey, dict[str, Any]] = {}
+        self._last_reported_at: dict[_ProgressKey, float] = {}
+        self._flush_handles: dict[_ProgressKey, asyncio.TimerHandle] = {}
 
     async def sink(self, message: loguru.Message) -> None:
         """Enqueue asynchronous tasks for reporting status of operations in progress.
@@ -133,19 +153,67 @@ class ProgressHandler:
 
         connector_name = connector.name if hasattr(connector, "name") else connector
 
-        self._queue.put_nowait(
-            dict(
-                operation=operation,
-                progress=progress,
-                connector=connector_name,
-                event_context=event_context,
-                started_at=started_at,
-                message=message,
-            )
+        progress_report = dict(
+            operation=operation,
+            progress=progress,
+            connector=connector_name,
+            event_context=event_context,
+            started_at=started_at,
+            message=message,
+        )
+        # NOTE: Servos of an assembly share the handler so progress is keyed by optimizer
+        servo_ = servo.current_servo()
+        optimizer_id = (
+            servo_.config.optimizer.id if servo_ and servo_.config.optimizer else None
         )
+        key = (optimizer_id, operation, connector_name)
+        if self._min_interval is None:
+            self._queue.put_nowait(progress_report)
+        elif progress >= 100 or record["level"].no >= logging.ERROR:
+            # Terminal and failed states supersede anything pending and go out immediately
+            self._discard_pending(key)
+            self._last_reported_at.pop(key, None)
+            self._queue.put_nowait(progress_report)
+        else:
+            self._coalesce(key, progress_report)
+
+    def _coalesce(self, key: _ProgressKey, progress: dict[str, Any]) -> None:
+        """Retain the latest progress for the key, scheduling a flush no sooner than the minimum interval
+        after the last report."""
+        self._pending[key] = progress
+        if key in self._flush_handles:
+            return
+
+        loop = asyncio.get_event_loop()
+        last_reported_at = self._last_reported_at.get(key)
+        delay = (
+            0
+            if last_reported_at is None
+            else last_reported_at + self._min_interval - loop.time()
+        )
+        if delay <= 0:
+            self._flush(key)
+        else:
+            self._flush_handles[key] = loop.call_later(delay, self._flush, key)
+
+    def _flush(self, key: _ProgressKey) -> None:
+        """Enqueue the pending progress for the key for reporting."""
+        if handle := self._flush_handles.pop(key, None):
+            handle.cancel()
+        if progress := self._pending.pop(key, None):
+            self._last_reported_at[key] = asyncio.get_event_loop().time()
+            self._queue.put_nowait(progress)
+
+    def _discard_pending(self, key: _ProgressKey) -> None:
+        if handle := self._flush_handles.pop(key, None):
+            handle.cancel()
+        self._pending.pop(key, None)
 
     async def shutdown(self) -> None:
-        """Shutdown the progress handler by emptying the queue and releasing the queue processor."""
+        """Shutdown the progress handler by flushing pending progress, emptying the queue, and releasing the queue processor."""
+        for key in list(self._pending.keys()):
+            self._flush(key)
+
         await self._queue.join()
 
         if self._queue_processor:
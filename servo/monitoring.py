@@ -0,0 +1,253 @@
+"""The `servo.monitoring` module provides visibility into the health of the event loop.
+
+The `LoopMonitor` measures the lag of the event loop with a high frequency heartbeat. A
+watchdog thread samples the stack of the loop thread while the heartbeat is overdue, so
+that stalls are attributed to the code that blocked the loop rather than to whatever
+happened to run next. Live tasks are periodically counted by name to expose leaks of
+fire-and-forget tasks.
+"""
+from __future__ import annotations
+
+import asyncio
+import collections
+import heapq
+import re
+import sys
+import threading
+import time
+import traceback
+from typing import Counter, Deque, Dict, List, Optional, Tuple
+
+import pydantic
+
+import servo.logging
+
+__all__ = (
+    "LoopMonitor",
+    "LoopMonitorSnapshot",
+    "Stall",
+    "TaskSample",
+)
+
+
+class Stall(pydantic.BaseModel):
+    """A period during which the event loop was blocked for at least the stall threshold."""
+
+    lag: float
+    """The duration in seconds that the heartbeat was delayed by."""
+
+    at: float
+    """The wall clock time at which the stall was detected, in seconds since the epoch."""
+
+    task: Optional[str] = None
+    """The name of the task that was running on the loop while it was blocked, if any."""
+
+    stack: Optional[List[str]] = None
+    """The stack of the loop thread captured while it was blocked, outermost frame first."""
+
+
+class TaskSample(pydantic.BaseModel):
+    """A count of the live tasks of the event loop grouped by name."""
+
+    at: float
+    counts: Dict[str, int]
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+class LoopMonitorSnapshot(pydantic.BaseModel):
+    """A point in time summary of the measurements of a loop monitor."""
+
+    heartbeats: int
+    max_lag: float
+    mean_lag: float
+    stalls: List[Stall]
+    """The slowest stalls observed, slowest first."""
+
+    tasks: List[TaskSample]
+    """The counts of live tasks over time, oldest first."""
+
+
+_TASK_NAME_SUFFIX = re.compile(r"[-_ ]?\d+$")
+
+
+def _task_group_name(task: asyncio.Task) -> str:
+    # Default task names are numbered (e.g. `Task-42`); group them under a common name
+    return _TASK_NAME_SUFFIX.sub("", task.get_name()) or task.get_name()
+
+
+class LoopMonitor(servo.logging.Mixin):
+    """A monitor of the lag and live tasks of an asyncio event loop.
+
+    Args:
+        interval: The interval in seconds between heartbeats.
+        threshold: The lag in seconds at or above which the loop is considered stalled.
+        report_interval: The interval in seconds between task counts and summary log messages.
+        max_stalls: The number of slowest stalls to retain.
+        history: The number of task counts to retain.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = 0.1,
+        threshold: float = 0.1,
+        report_interval: float = 60.0,
+        max_stalls: int = 10,
+        history: int = 60,
+    ) -> None:  # noqa: D107
+        self.interval = interval
+        self.threshold = threshold
+        self.report_interval = report_interval
+        self.max_stalls = max_stalls
+
+        self._heartbeats = 0
+        self._total_lag = 0.0
+        self._max_lag = 0.0
+        self._stalls: List[Tuple[float, int, Stall]] = []
+        self._task_samples: Deque[TaskSample] = collections.deque(maxlen=history)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._last_tick = 0.0
+        self._pending_stall: Optional[Tuple[Optional[str], List[str]]] = None
+        self._tasks: List[asyncio.Task] = []
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """Return True if the monitor is running."""
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Start monitoring the running event loop."""
+        if self.running:
+            raise RuntimeError("loop monitor is already running")
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._stopped.clear()
+        self._tasks = [
+            asyncio.create_task(self._heartbeat(), name="loop monitor heartbeat"),
+            asyncio.create_task(self._report(), name="loop monitor report"),
+        ]
+        self._watchdog = threading.Thread(
+            target=self._watch, name="servo-loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop monitoring the event loop."""
+        self._stopped.set()
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._watchdog:
+            self._watchdog.join(self.interval)
+            self._watchdog = None
+
+    def snapshot(self) -> LoopMonitorSnapshot:
+        """Return a summary of the measurements of the monitor."""
+        return LoopMonitorSnapshot(
+            heartbeats=self._heartbeats,
+            max_lag=self._max_lag,
+            mean_lag=(self._total_lag / self._heartbeats) if self._heartbeats else 0.0,
+            stalls=[stall for _, _, stall in sorted(self._stalls, reverse=True)],
+            tasks=list(self._task_samples),
+        )
+
+    def sample_tasks(self) -> TaskSample:
+        """Count the live tasks of the event loop by name and record the counts."""
+        counts: Counter[str] = collections.Counter(
+            _task_group_name(task) for task in asyncio.all_tasks(self._loop)
+        )
+        sample = TaskSample(at=time.time(), counts=dict(counts.most_common()))
+        self._task_samples.append(sample)
+        return sample
+
+    def growing_tasks(self, min_samples: int = 3) -> List[str]:
+        """Return the names of tasks whose live count increased in each of the recorded samples.
+
+        Steady growth across the retained history is a strong indication of leaked tasks.
+        """
+        if len(self._task_samples) < min_samples:
+            return []
+
+        names = self._task_samples[-1].counts.keys()
+        return [
+            name
+            for name in names
+            if all(
+                previous.counts.get(name, 0) < current.counts.get(name, 0)
+                for previous, current in zip(
+                    self._task_samples, list(self._task_samples)[1:]
+                )
+            )
+        ]
+
+    def _record_lag(self, lag: float) -> None:
+        self._heartbeats += 1
+        self._total_lag += lag
+        self._max_lag = max(self._max_lag, lag)
+
+        pending, self._pending_stall = self._pending_stall, None
+        if lag < self.threshold:
+            return
+
+        task, stack = pending or (None, None)
+        stall = Stall(lag=lag, at=time.time(), task=task, stack=stack)
+        entry = (lag, self._heartbeats, stall)
+        if len(self._stalls) < self.max_stalls:
+            heapq.heappush(self._stalls, entry)
+        else:
+            heapq.heappushpop(self._stalls, entry)
+
+        self.logger.warning(
+            f"Event loop stalled for {lag * 1000:.0f}ms"
+            + (f" while running task '{task}'" if task else "")
+        )
+        if stack:
+            self.logger.debug("Stack of stalled event loop:\n" + "".join(stack))
+
+    async def _heartbeat(self) -> None:
+        while True:
+            expected_at = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            self._last_tick = time.monotonic()
+            self._record_lag(max(0.0, self._last_tick - expected_at))
+
+    async def _report(self) -> None:
+        while True:
+            await asyncio.sleep(self.report_interval)
+            sample = self.sample_tasks()
+            snapshot = self.snapshot()
+            self.logger.debug(
+                f"Event loop lag: max {snapshot.max_lag * 1000:.1f}ms, mean {snapshot.mean_lag * 1000:.1f}ms, "
+                f"{len(snapshot.stalls)} stalls; {sample.total} live tasks: {sample.counts}"
+            )
+            if growing := self.growing_tasks():
+                self.logger.warning(
+                    f"Live task counts have grown steadily, possible task leak: {', '.join(growing)}"
+                )
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.interval):
+            overdue = time.monotonic() - self._last_tick - self.interval
+            if overdue < self.threshold or self._pending_stall is not None:
+                continue
+
+            # Capture the culprit while the loop is still blocked
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            task = asyncio.current_task(self._loop)
+            self._pending_stall = (
+                task.get_name() if task else None,
+                traceback.format_stack(frame),
+            )
@@ -0,0 +1,145 @@
+"""The `servo.normalization` module aligns the time series readings of measurements onto a
+common time grid before they are reported to the optimizer.
+
+Alignment is vectorized via NumPy: the data points of each series are read into arrays
+once and the grid is computed and sampled with array operations so that measurements
+containing thousands of series are normalized efficiently.
+"""
+from __future__ import annotations
+
+import datetime
+from typing import List, Sequence
+
+import numpy
+
+import servo
+from servo.types import DataPoint, Measurement, NormalizationPolicy, TimeSeries
+
+__all__ = (
+    "normalize_measurement",
+    "intersect_time_series",
+    "fill_time_series",
+)
+
+
+def normalize_measurement(
+    measurement: Measurement, policy: NormalizationPolicy
+) -> Measurement:
+    """Return a measurement with its time series readings normalized according to a policy.
+
+    Measurements of scalar data points and measurements with fewer than two time series
+    are returned as is.
+
+    Args:
+        measurement: The measurement to normalize.
+        policy: The normalization policy to apply.
+
+    Returns:
+        A copy of the measurement with normalized readings or the measurement if no
+        normalization was applied.
+    """
+    if policy == NormalizationPolicy.passthrough:
+        return measurement
+
+    time_series = [
+        reading for reading in measurement.readings if isinstance(reading, TimeSeries)
+    ]
+    if len(time_series) < 2 or len(time_series) != len(measurement.readings):
+        return measurement
+
+    if policy == NormalizationPolicy.intersect:
+        readings = intersect_time_series(time_series)
+    elif policy == NormalizationPolicy.fill:
+        readings = fill_time_series(time_series)
+    else:
+        raise ValueError(f"unknown normalization policy: {policy}")
+
+    return measurement.copy(update={"readings": readings})
+
+
+def intersect_time_series(time_series: Sequence[TimeSeries]) -> List[TimeSeries]:
+    """Reduce time series to the data points measured at times common to all of them.
+
+    Args:
+        time_series: The time series to intersect.
+
+    Returns:
+        A list of copies of the time series containing only the intersecting data points.
+    """
+    timestamps = list(map(_timestamps, time_series))
+    times, counts = numpy.unique(
+        numpy.concatenate([numpy.unique(t) for t in timestamps]), return_counts=True
+    )
+    grid = times[counts == len(time_series)]
+
+    intersected = []
+    for series, series_timestamps in zip(time_series, timestamps):
+        indices = numpy.searchsorted(series_timestamps, grid)
+        data_points = series.data_points
+        intersected.append(
+            series.copy(
+                update={"data_points": [data_points[i] for i in indices.tolist()]}
+            )
+        )
+
+    return intersected
+
+
+def fill_time_series(time_series: Sequence[TimeSeries]) -> List[TimeSeries]:
+    """Align time series onto the union of the times at which any of them was measured.
+
+    Missing values are linearly interpolated between the neighbouring data points of a
+    series. Before the first and after the last data point of a series, its nearest value
+    is carried backward and forward respectively. Empty time series are left empty.
+
+    Args:
+        time_series: The time series to fill.
+
+    Returns:
+        A list of copies of the time series with a data point at every time of the grid.
+    """
+    timestamps = list(map(_timestamps, time_series))
+    grid, first_indices = numpy.unique(numpy.concatenate(timestamps), return_index=True)
+    times: List[datetime.datetime] = [
+        data_point.time for series in time_series for data_point in series.data_points
+    ]
+    grid_times = [times[i] for i in first_indices.tolist()]
+
+    filled = []
+    for series, series_timestamps in zip(time_series, timestamps):
+        if not len(series_timestamps):
+            servo.logger.debug(
+                f'unable to fill empty TimeSeries id "{series.id}" of metric "{series.metric.name}"'
+            )
+            filled.append(series)
+            continue
+
+        values = numpy.fromiter(
+            (data_point.value for data_point in series.data_points),
+            dtype=float,
+            count=len(series_timestamps),
+        )
+        grid_values = numpy.interp(grid, series_timestamps, values)
+        filled.append(
+            series.copy(
+                update={
+                    "data_points": [
+                        DataPoint.construct(
+                            metric=series.metric, time=time, value=value
+                        )
+                        for time, value in zip(grid_times, grid_values.tolist())
+                    ]
+                }
+            )
+        )
+
+    return filled
+
+
+def _timestamps(series: TimeSeries) -> numpy.ndarray:
+    """Return a sorted array of the POSIX timestamps of the data points of a time series."""
+    return numpy.fromiter(
+        (data_point.time.timestamp() for data_point in series.data_points),
+        dtype=float,
+        count=len(series.data_points),
+    )
@@ -4,17 +4,23 @@ from __future__ import annotations
 import abc
 import asyncio
 import codecs
+import collections
 import contextlib
 import contextvars
 import datetime
 import enum
 import fnmatch
 import functools
+import heapq
 import inspect
 import json as json_
+import mmap
+import pathlib
 import random
 import re
 import string
+import struct
+import time
 import weakref
 from typing import (
     Any,
@@ -23,6 +29,7 @@ from typing import (
     AsyncIterator,
     Awaitable,
     Callable,
+    Deque,
     Dict,
     Iterable,
     List,
@@ -34,10 +41,14 @@ from typing import (
     no_type_check,
 )
 
+import orjson
 import pydantic
+import pydantic.error_wrappers
+import pydantic.errors
 import yaml as yaml_
 
 import servo.types
+import servo.utilities.executor
 
 __all__ = [
     "BaseSubscription",
@@ -47,6 +58,8 @@ __all__ = [
     "Message",
     "Metadata",
     "Mixin",
+    "OverflowPolicy",
+    "Retention",
     "Publisher",
     "Subscriber",
     "Subscription",
@@ -56,15 +69,42 @@ __all__ = [
     "Aggregator",
 ]
 
+DEFAULT_DELIVERY_WORKERS = 4
+DEFAULT_MAX_QUEUE_SIZE = 4096
+DEFAULT_BUFFER_SIZE = 1024
+DEFAULT_BATCH_INTERVAL = servo.types.Duration("50ms")
+DEFAULT_RETENTION_CAPACITY = 16 * 1024 * 1024
+
 Metadata = Dict[str, str]
 ByteStream = Union[Iterable[bytes], AsyncIterable[bytes]]
-MessageContent = Union[str, bytes, ByteStream]
+ContentBytes = Union[bytes, bytearray, memoryview]
+MessageContent = Union[str, ContentBytes, ByteStream]
 
 
 class MimeTypes(str, enum.Enum):
     text = "text/plain"
     json = "application/json"
     yaml = "application/x-yaml"
+    msgpack = "application/msgpack"
+
+
+class OverflowPolicy(str, enum.Enum):
+    """The policy applied when a Message is delivered to a full Subscriber buffer."""
+
+    block = "block"
+    """Wait for space in the buffer, applying backpressure to the Exchange and publishers."""
+
+    drop_oldest = "drop_oldest"
+    """Discard the oldest buffered Message to make room for the new one."""
+
+    drop_newest = "drop_newest"
+    """Discard the new Message."""
+
+    coalesce = "coalesce"
+    """Discard the latest buffered Message from the same Channel and buffer the new one.
+
+    Falls back to discarding the oldest buffered Message when none are from the Channel.
+    """
 
 
 class Message(pydantic.BaseModel):
@@ -74,6 +114,10 @@ class Message(pydantic.BaseModel):
     responds to `json()` or `yaml()` methods respectively they are called to perform
     serialization.
 
+    Content is serialized at construction so later changes to the input object are not
+    published. Every call to `json()`, `yaml()`, or `msgpack()` decodes the content
+    afresh, so Subscribers of the same Message never share a mutable decoded value.
+
     Attributes:
         content: The content of the message.
         content_type: A MIME Type describing the message content encoding.
@@ -81,16 +125,18 @@ class Message(pydantic.BaseModel):
         metadata: Arbitrary string key/value metadata about the message.
 
     Args:
-        content: Byte array of raw message content.
+        content: Raw message content. `bytes`, `bytearray`, and `memoryview` content is
+            retained without copying.
         content_type: MIME Type describing the message content encoding.
         text: String message content. Defaults content_type to `text/plain` if omitted.
         json: A JSON serializable object to set as message content. Defaults `content_type`
             to `application/json` if omitted.
         yaml: A YAML serializable object to set as message content. Defaults `content_type`
             to `application/x-yaml` if omitted.
+        msgpack: A MessagePack serializable object to set as message content. Defaults
+            `content_type` to `application/msgpack` if omitted. Requires the `msgpack` package.
     """
 
-    content: bytes
     content_type: str
     created_at: datetime.datetime = pydantic.Field(
         default_factory=datetime.datetime.now
@@ -98,6 +144,7 @@ class Message(pydantic.BaseModel):
     metadata: Metadata = {}
 
     # Private cache attributes
+    _content: Optional[ContentBytes] = pydantic.PrivateAttr(None)
     _text: Optional[str] = pydantic.PrivateAttr(None)
 
     def __init__(
@@ -108,11 +155,12 @@ class Message(pydantic.BaseModel):
         json: Optional[Any] = None,
         yaml: Optional[Any] = None,
         metadata: Metadata = {},
+        msgpack: Optional[Any] = None,
         **kwargs,
     ) -> None:
-        if len(list(filter(None, [content, text, json, yaml]))) > 1:
+        if len(list(filter(None, [content, text, json, yaml, msgpack]))) > 1:
             raise ValueError(
-                f"only one argument of content, text, json, or yaml can be given"
+                f"only one argument of content, text, json, yaml, or msgpack can be given"
             )
 
         if text is not None and not isinstance(text, str):
@@ -128,13 +176,17 @@ class Message(pydantic.BaseModel):
                     json.json()
                     if (hasattr(json, "json") and callable(json.json))
                     else json_.dumps(json)
-                )
+                ).encode()
             elif yaml is not None:
                 content = (
                     yaml.yaml()
                     if (hasattr(yaml, "yaml") and callable(yaml.yaml))
                     else yaml_.dump(yaml)
-                )
+                ).encode()
+            elif msgpack is not None:
+                content = _msgpack_dumps(msgpack)
+        elif isinstance(content, str):
+            content = content.encode()
 
         if content_type is None:
             if text is not None:
@@ -143,8 +195,40 @@ class Message(pydantic.BaseModel):
                 content_type = MimeTypes.json
             elif yaml is not None:
                 content_type = MimeTypes.yaml
+            elif msgpack is not None:
+                content_type = MimeTypes.msgpack
+
+        # NOTE: Content is validated by hand as it is not a field to retain buffers without copying
+        errors = []
+        if content is None:
+            errors.append(
+                pydantic.error_wrappers.ErrorWrapper(
+                    pydantic.errors.NoneIsNotAllowedError(), loc="content"
+                )
+            )
+        elif content is not None and not isinstance(
+            content, (bytes, bytearray, memoryview)
+        ):
+            errors.append(
+                pydantic.error_wrappers.ErrorWrapper(
+                    pydantic.errors.BytesError(), loc="content"
+                )
+            )
+        try:
+            super().__init__(content_type=content_type, metadata=metadata)
+        except pydantic.ValidationError as error:
+            errors = error.raw_errors + errors
+        if errors:
+            raise pydantic.ValidationError(errors, self.__class__)
+
+        self._content = content
+        if text is not None:
+            self._text = text
 
-        super().__init__(content=content, content_type=content_type, metadata=metadata)
+    @property
+    def content(self) -> ContentBytes:
+        """Return the content of the message."""
+        return self._content
 
     @property
     def text(self) -> str:
@@ -155,20 +239,227 @@ class Message(pydantic.BaseModel):
                 self._text = ""
             else:
                 decoder = codecs.getincrementaldecoder("utf-8")(errors="strict")
-                decoder.decode(content)
                 self._text = "".join(
-                    [decoder.decode(self.content), decoder.decode(b"", True)]
+                    [decoder.decode(content), decoder.decode(b"", True)]
                 )
 
         return self._text
 
     def json(self) -> Any:
         """Return a representation of the message content deserialized as JSON."""
-        return json_.loads(self.content)
+        return _json_loads(self.content)
 
     def yaml(self) -> Any:
         """Return a representation of the message content deserialized as YAML."""
-        return yaml_.load(self.content, Loader=yaml_.FullLoader)
+        return yaml_.load(bytes(self.content), Loader=yaml_.FullLoader)
+
+    def msgpack(self) -> Any:
+        """Return a representation of the message content deserialized as MessagePack."""
+        return _msgpack_loads(self.content)
+
+    async def decode_json(self) -> Any:
+        """Deserialize the message content as JSON, offloading large content from the event loop."""
+        return await servo.utilities.executor.offload(self.json, size=len(self.content))
+
+    async def decode_yaml(self) -> Any:
+        """Deserialize the message content as YAML, offloading large content from the event loop."""
+        return await servo.utilities.executor.offload(self.yaml, size=len(self.content))
+
+    def dict(self, **kwargs) -> Dict[str, Any]:
+        include, exclude = kwargs.get("include"), kwargs.get("exclude")
+        data = super().dict(**kwargs)
+        if (include is None or "content" in include) and (
+            exclude is None or "content" not in exclude
+        ):
+            data = {"content": self.content, **data}
+
+        return data
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Message):
+            return super().__eq__(other) and self.content == other.content
+
+        return super().__eq__(other)
+
+    def __repr_args__(self) -> pydantic.ReprArgs:
+        return [("content", self.content), *super().__repr_args__()]
+
+
+def _json_loads(content: ContentBytes) -> Any:
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        # NOTE: orjson is strict about non-standard values such as `NaN` emitted by `json`
+        return json_.loads(bytes(content))
+
+
+def _msgpack_dumps(obj: Any) -> bytes:
+    import msgpack
+
+    return msgpack.packb(obj)
+
+
+def _msgpack_loads(content: ContentBytes) -> Any:
+    import msgpack
+
+    return msgpack.unpackb(content)
+
+
+class Retention(pydantic.BaseModel):
+    """Retention describes the recent Messages of a Channel that are held for replay.
+
+    Subscribers created after a Message was published can request a replay of the
+    retained Messages rather than re-querying the source of the data.
+
+    Attributes:
+        size: The number of most recent Messages to retain.
+        period: The duration for which Messages are retained.
+        path: An optional file to back the retained Messages with a memory map rather
+            than holding them in memory. Messages are serialized into the file.
+        capacity: The size in bytes of the memory mapped file. The oldest Messages are
+            evicted as newer Messages wrap around the file.
+    """
+
+    size: Optional[pydantic.PositiveInt] = None
+    period: Optional[servo.types.Duration] = None
+    path: Optional[pathlib.Path] = None
+    capacity: pydantic.PositiveInt = DEFAULT_RETENTION_CAPACITY
+
+    @pydantic.root_validator(skip_on_failure=True)
+    def _bounded(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        if (
+            values["size"] is None
+            and values["period"] is None
+            and values["path"] is None
+        ):
+            raise ValueError("retention must be bounded by a size, period, or path")
+
+        return values
+
+
+class _RetentionBuffer:
+    """A ring buffer of the recent Messages of a Channel held in memory."""
+
+    def __init__(self, retention: Retention) -> None:
+        self.retention = retention
+        self._entries: Deque[Tuple[float, Message]] = collections.deque(
+            maxlen=retention.size
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def append(self, message: Message, at: float) -> None:
+        self._entries.append((at, message))
+        self._expire(at)
+
+    def since(self, at: float) -> List[Tuple[float, Message]]:
+        """Return the retained Messages delivered at or after a time, oldest first."""
+        self._expire(time.time())
+        return [(at_, message) for at_, message in self._entries if at_ >= at]
+
+    def close(self) -> None:
+        self._entries.clear()
+
+    def _expire(self, now: float) -> None:
+        if self.retention.period is not None:
+            expires_at = now - self.retention.period.total_seconds()
+            while self._entries and self._entries[0][0] < expires_at:
+                self._entries.popleft()
+
+
+# Records are the lengths of the header and content followed by the header and content
+_RECORD_PREFIX = struct.Struct("<II")
+
+
+class _MappedRetentionBuffer(_RetentionBuffer):
+    """A ring buffer of the recent Messages of a Channel serialized into a memory mapped file.
+
+    Records are written sequentially and wrap around to the start of the file when they
+    reach the end, evicting the oldest records that they overwrite. Only the timestamp and
+    location of each record are held in memory.
+    """
+
+    def __init__(self, retention: Retention) -> None:  # noqa: D107
+        super().__init__(retention)
+        self._entries: Deque[Tuple[float, int, int]] = collections.deque()
+        self._file = open(retention.path, "w+b")
+        self._file.truncate(retention.capacity)
+        self._map = mmap.mmap(self._file.fileno(), retention.capacity)
+        self._offset = 0
+
+    def append(self, message: Message, at: float) -> None:
+        header = orjson.dumps(
+            {
+                "content_type": message.content_type,
+                "created_at": message.created_at.isoformat(),
+                "metadata": message.metadata,
+            }
+        )
+        content = message.content
+        length = _RECORD_PREFIX.size + len(header) + len(content)
+        if length > self.retention.capacity:
+            servo.logger.warning(
+                f"Message of {length} bytes exceeds retention capacity of {self.retention.capacity} bytes: not retained"
+            )
+            return
+
+        start = self._offset
+        if start + length > self.retention.capacity:
+            # Wrap around, evicting the oldest records remaining at the end of the file
+            while self._entries and self._entries[0][1] >= start:
+                self._entries.popleft()
+            start = 0
+
+        end = start + length
+        while self._entries:
+            _, oldest_offset, oldest_length = self._entries[0]
+            if oldest_offset >= end or oldest_offset + oldest_length <= start:
+                break
+            self._entries.popleft()
+
+        _RECORD_PREFIX.pack_into(self._map, start, len(header), len(content))
+        header_start = start + _RECORD_PREFIX.size
+        self._map[header_start : header_start + len(header)] = header
+        self._map[header_start + len(header) : end] = content
+        self._entries.append((at, start, length))
+        self._offset = end
+
+        if self.retention.size is not None:
+            while len(self._entries) > self.retention.size:
+                self._entries.popleft()
+        self._expire(at)
+
+    def since(self, at: float) -> List[Tuple[float, Message]]:
+        self._expire(time.time())
+        return [
+            (at_, self._read(offset)) for at_, offset, _ in self._entries if at_ >= at
+        ]
+
+    def close(self) -> None:
+        super().close()
+        self._map.close()
+        self._file.close()
+
+    def _read(self, offset: int) -> Message:
+        header_length, content_length = _RECORD_PREFIX.unpack_from(self._map, offset)
+        header_start = offset + _RECORD_PREFIX.size
+        header = orjson.loads(self._map[header_start : header_start + header_length])
+        content_start = header_start + header_length
+        message = Message(
+            # NOTE: Content is copied out as the record will eventually be overwritten
+            content=self._map[content_start : content_start + content_length],
+            content_type=header["content_type"],
+            metadata=header["metadata"],
+        )
+        message.created_at = datetime.datetime.fromisoformat(header["created_at"])
+        return message
+
+
+def _retention_buffer(retention: Retention) -> _RetentionBuffer:
+    if retention.path is not None:
+        return _MappedRetentionBuffer(retention)
+    return _RetentionBuffer(retention)
 
 
 ChannelName = pydantic.constr(
@@ -207,6 +498,13 @@ class Channel(_ExchangeChildModel):
         description: An optional supplemental description of the Channel.
         created_at: The date and time that the Channel was created.
         exchange: The pub/sub Exchange that the Channel belongs to.
+        batch_size: When set, Messages published to the Channel are accumulated and
+            delivered in batches of up to this many Messages.
+        batch_interval: When set, the maximum duration that a published Message is
+            held for batching before delivery. Defaults to 50ms for Channels with a
+            `batch_size`.
+        retention: When set, recent Messages delivered to the Channel are retained for
+            replay to Subscribers created later.
     """
 
     name: ChannelName
@@ -214,6 +512,10 @@ class Channel(_ExchangeChildModel):
     created_at: datetime.datetime = pydantic.Field(
         default_factory=datetime.datetime.now
     )
+    # NOTE: Delivery options are local to the Exchange and excluded from serialization
+    batch_size: Optional[pydantic.PositiveInt] = pydantic.Field(None, exclude=True)
+    batch_interval: Optional[servo.types.Duration] = pydantic.Field(None, exclude=True)
+    retention: Optional[Retention] = pydantic.Field(None, exclude=True)
     _closed: bool = pydantic.PrivateAttr(False)
 
     async def publish(self, message: Message) -> None:
@@ -222,6 +524,17 @@ class Channel(_ExchangeChildModel):
             raise RuntimeError(f"Cannot publish messages to a closed Channel")
         await self.exchange.publish(message, self)
 
+    async def publish_batch(self, messages: List[Message]) -> None:
+        """Publish a batch of Messages into the Channel for delivery together."""
+        if self.closed:
+            raise RuntimeError(f"Cannot publish messages to a closed Channel")
+        await self.exchange.publish_batch(messages, self)
+
+    @property
+    def batched(self) -> bool:
+        """Return True if Messages published to the Channel are delivered in batches."""
+        return self.batch_size is not None or self.batch_interval is not None
+
     @property
     def closed(self) -> bool:
         """Return True if the channel has been closed and can no longer receive messages."""
@@ -283,6 +596,12 @@ _current_context_var = contextvars.ContextVar(
     "servo.pubsub.current_message", default=None
 )
 
+# The Exchange delivering in the current task. Inherited by the tasks that Subscribers
+# are invoked in so that publishing from within delivery is recognized
+_delivering_exchange_var = contextvars.ContextVar(
+    "servo.pubsub.delivering_exchange", default=None
+)
+
 
 def current_message() -> Optional[Tuple[Message, Channel]]:
     """Return the Message and Channel for the current execution context, if any.
@@ -300,36 +619,77 @@ class Exchange(pydantic.BaseModel):
     """An Exchange facilitates the publication and subscription of Messages in Channels.
 
     Exchange objects are asynchronously iterable and will yield every Message published.
+
+    Published Messages are enqueued and delivered by a fixed pool of worker tasks. When
+    the queue is full, publishers wait for the workers to catch up. Messages published by
+    the workers themselves (from Transformers or Subscriber callbacks) never block delivery.
+
+    Attributes:
+        workers: The number of tasks delivering Messages concurrently.
+        max_queue_size: The maximum number of Messages awaiting delivery. Zero is unbounded.
     """
 
+    workers: pydantic.PositiveInt = DEFAULT_DELIVERY_WORKERS
+    max_queue_size: pydantic.NonNegativeInt = DEFAULT_MAX_QUEUE_SIZE
     _channels: Set[Channel] = pydantic.PrivateAttr(set())
     _publishers: List[Publisher] = pydantic.PrivateAttr([])
     _subscribers: List[Subscriber] = pydantic.PrivateAttr([])
+    _routes: Dict[str, List[Subscriber]] = pydantic.PrivateAttr({})
+    _batches: Dict[Channel, List[Message]] = pydantic.PrivateAttr({})
+    _batch_timers: Dict[Channel, asyncio.TimerHandle] = pydantic.PrivateAttr({})
+    _retained: Dict[Channel, _RetentionBuffer] = pydantic.PrivateAttr({})
     _transformers: List[Transformer] = pydantic.PrivateAttr([])
-    _queue: asyncio.Queue = pydantic.PrivateAttr(default_factory=asyncio.Queue)
-    _queue_processor: Optional[asyncio.Task] = pydantic.PrivateAttr(None)
+    _queue: asyncio.Queue = pydantic.PrivateAttr(None)
+    _queue_processors: List[asyncio.Task] = pydantic.PrivateAttr([])
+    _spilled: Set[asyncio.Task] = pydantic.PrivateAttr(set())
     __slots__ = "__weakref__"  # NOTE: Pydantic and weakref both use __slots__
 
+    def __init__(self, *args, **kwargs) -> None:  # noqa: D107
+        super().__init__(*args, **kwargs)
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+
     def start(self) -> None:
         """Start exchanging Messages between Publishers and Subscribers."""
         if self.running:
             raise RuntimeError("the Exchange is already running")
-        self._queue_processor = asyncio.create_task(self._process_queue())
+        self._queue_processors = [
+            asyncio.create_task(
+                self._process_queue(), name=f"pubsub delivery worker {i + 1}"
+            )
+            for i in range(self.workers)
+        ]
 
     def clear(self) -> None:
         """Clear the Exchange by discarding all channels, publishers, subscribers, and transformers."""
         self._channels.clear()
         self._publishers.clear()
         self._subscribers.clear()
+        self._routes.clear()
         self._transformers.clear()
+        for timer in self._batch_timers.values():
+            timer.cancel()
+        self._batch_timers.clear()
+        self._batches.clear()
+        for buffer in self._retained.values():
+            buffer.close()
+        self._retained.clear()
+        for task in self._spilled:
+            task.cancel()
+        self._spilled.clear()
 
     async def shutdown(self) -> None:
         """Shutdown the Exchange by processing all Messages and clearing all child objects."""
         if not self.running:
             raise RuntimeError("the Exchange is not running")
+        for channel in list(self._batches):
+            await self._flush_batch(channel)
         await self._queue.join()
-        self._queue_processor.cancel()
-        await asyncio.gather(self._queue_processor, return_exceptions=True)
+        while self._spilled:
+            await asyncio.gather(*self._spilled, return_exceptions=True)
+            await self._queue.join()
+        for queue_processor in self._queue_processors:
+            queue_processor.cancel()
+        await asyncio.gather(*self._queue_processors, return_exceptions=True)
         for transformer in self._transformers:
             transformer.cancel()
         self.clear()
@@ -365,18 +725,27 @@ class Exchange(pydantic.BaseModel):
         return iterator
 
     async def _process_queue(self) -> None:
+        _delivering_exchange_var.set(self)
         while True:
             message, channel = await self._queue.get()
             if message is None:
                 # Exit condition
                 break
 
-            # Notify subscribers in a new task to avoid blocking the queue
-            asyncio.create_task(self._deliver_message(message, channel))
+            try:
+                # NOTE: Delivering on a fixed pool of workers bounds the number of tasks;
+                # slow Subscribers apply backpressure to publishers via the bounded queue
+                with servo.logger.catch(message="Failed delivering message"):
+                    await self._deliver_message(message, channel)
+            finally:
+                self._queue.task_done()
 
-            self._queue.task_done()
+    async def _deliver_message(
+        self, message: Union[Message, List[Message]], channel: Channel
+    ) -> None:
+        if isinstance(message, list):
+            return await self._deliver_batch(message, channel)
 
-    async def _deliver_message(self, message: Message, channel: Channel) -> None:
         try:
             reset_token = _current_context_var.set((message, channel))
 
@@ -395,13 +764,14 @@ class Exchange(pydantic.BaseModel):
                     )
                     return
 
-            # Broadcast to all subscribers
+            if channel.retention:
+                self._retain(message, channel)
+
+            # Broadcast to the subscribers routed to the channel
             results = await asyncio.gather(
-                *list(
-                    map(
-                        lambda subscriber: subscriber(message, channel),
-                        self._subscribers,
-                    )
+                *(
+                    subscriber._deliver(message, channel)
+                    for subscriber in self._route(channel)
                 ),
                 return_exceptions=True,
             )
@@ -415,10 +785,87 @@ class Exchange(pydantic.BaseModel):
         finally:
             _current_context_var.reset(reset_token)
 
+    async def _deliver_batch(self, messages: List[Message], channel: Channel) -> None:
+        # Each Transformer processes the batch in one call
+        for transformer in self._transformers:
+            messages = await transformer.transform_batch(messages, channel)
+            if not messages:
+                servo.logger.trace(
+                    f"Transfomer {transformer} cancelled delivery of message batch"
+                )
+                return
+
+        if channel.retention:
+            for message in messages:
+                self._retain(message, channel)
+
+        results = await asyncio.gather(
+            *(
+                subscriber._deliver_batch(messages, channel)
+                for subscriber in self._route(channel)
+            ),
+            return_exceptions=True,
+        )
+
+        # Log failures without aborting
+        with servo.logger.catch(message="Subscriber raised exception"):
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+
+    def _retain(self, message: Message, channel: Channel) -> None:
+        if (buffer := self._retained.get(channel)) is None:
+            buffer = self._retained[channel] = _retention_buffer(channel.retention)
+        buffer.append(message, time.time())
+
+    def replay(
+        self, selector: Selector, since: servo.types.DurationDescriptor
+    ) -> List[Tuple[Message, Channel]]:
+        """Return the retained Messages of Channels matching a selector, oldest first.
+
+        Only Channels created with a `retention` retain Messages for replay.
+
+        Args:
+            selector: A string or regular expression pattern matching Channels of interest.
+            since: How far back to replay Messages from, as a duration before now.
+        """
+        subscription = Subscription(selector=selector)
+        at = time.time() - servo.Duration(since).total_seconds()
+        replays = [
+            [(at_, message, channel) for at_, message in buffer.since(at)]
+            for channel, buffer in self._retained.items()
+            if subscription.matches(channel)
+        ]
+        return [
+            (message, channel)
+            for _, message, channel in heapq.merge(*replays, key=lambda r: r[0])
+        ]
+
+    async def _accumulate(self, message: Message, channel: Channel) -> None:
+        batch = self._batches.setdefault(channel, [])
+        batch.append(message)
+        if channel.batch_size is not None and len(batch) >= channel.batch_size:
+            await self._flush_batch(channel)
+        elif len(batch) == 1:
+            interval = channel.batch_interval or DEFAULT_BATCH_INTERVAL
+            self._batch_timers[channel] = asyncio.get_event_loop().call_later(
+                interval.total_seconds(), self._flush_batch_soon, channel
+            )
+
+    def _flush_batch_soon(self, channel: Channel) -> None:
+        task = asyncio.create_task(self._flush_batch(channel))
+        task.add_done_callback(_error_watcher)
+
+    async def _flush_batch(self, channel: Channel) -> None:
+        if timer := self._batch_timers.pop(channel, None):
+            timer.cancel()
+        if batch := self._batches.pop(channel, None):
+            await self._enqueue((batch, channel))
+
     @property
     def running(self) -> bool:
         """Return True if the Exchange is processing Messages."""
-        return self._queue_processor is not None and not self._queue_processor.done()
+        return any(not processor.done() for processor in self._queue_processors)
 
     @property
     def channels(self) -> Set[Channel]:
@@ -429,12 +876,23 @@ class Exchange(pydantic.BaseModel):
         """Return a Channel by name or `None` if no such Channel exists."""
         return next(filter(lambda m: m.name == name, self._channels), None)
 
-    def create_channel(self, name: str, description: Optional[str] = None) -> Channel:
+    def create_channel(
+        self,
+        name: str,
+        description: Optional[str] = None,
+        *,
+        batch_size: Optional[int] = None,
+        batch_interval: Optional[servo.types.DurationDescriptor] = None,
+        retention: Optional[Retention] = None,
+    ) -> Channel:
         """Create a new Channel in the Exchange.
 
         Args:
             name: A unique name for the Channel.
             description: An optional textual description about the Channel.
+            batch_size: The maximum number of Messages to accumulate into a batch.
+            batch_interval: The maximum duration to hold a Message for batching.
+            retention: The recent Messages to retain for replay to later Subscribers.
 
         Raises:
             ValueError: Raised if a Channel already exists with the name given.
@@ -444,7 +902,14 @@ class Exchange(pydantic.BaseModel):
         """
         if self.get_channel(name) is not None:
             raise ValueError(f"A Channel named '{name}' already exists")
-        channel = Channel(name=name, description=description, exchange=self)
+        channel = Channel(
+            name=name,
+            description=description,
+            batch_size=batch_size,
+            batch_interval=batch_interval,
+            retention=retention,
+            exchange=self,
+        )
         self._channels.add(channel)
         return channel
 
@@ -458,6 +923,12 @@ class Exchange(pydantic.BaseModel):
             ValueError: Raised if the given Channel is not in the Exchange.
         """
         self._channels.remove(channel)
+        self._routes.pop(channel.name, None)
+        if buffer := self._retained.pop(channel, None):
+            buffer.close()
+        self._batches.pop(channel, None)
+        if timer := self._batch_timers.pop(channel, None):
+            timer.cancel()
 
     async def publish(self, message: Message, channel: Union[Channel, str]) -> None:
         """Publish a Message to a Channel, notifying all Subscribers asynchronously.
@@ -476,7 +947,44 @@ class Exchange(pydantic.BaseModel):
         if channel_ is None:
             raise ValueError(f"no such Channel: {channel}")
 
-        await self._queue.put((message, channel_))
+        if channel_.batched:
+            await self._accumulate(message, channel_)
+        else:
+            await self._enqueue((message, channel_))
+
+    async def publish_batch(
+        self, messages: List[Message], channel: Union[Channel, str]
+    ) -> None:
+        """Publish a batch of Messages to a Channel for delivery together.
+
+        The batch is delivered in a single pass through the Transformers. Subscribers that
+        opted into batching receive the batch in one call while others receive each Message.
+
+        Args:
+            messages: The Messages to publish.
+            channel: The Channel or name of the Channel to publish the Messages to.
+
+        Raises:
+            ValueError: Raised if the Channel specified does not exist in the Exchange.
+        """
+        channel_ = self.get_channel(channel) if isinstance(channel, str) else channel
+        if channel_ is None:
+            raise ValueError(f"no such Channel: {channel}")
+
+        if messages:
+            await self._enqueue((list(messages), channel_))
+
+    async def _enqueue(
+        self, item: Tuple[Union[Message, List[Message]], Channel]
+    ) -> None:
+        if self._queue.full() and _delivering_exchange_var.get() is self:
+            # NOTE: Transformers and Subscriber callbacks publishing during delivery cannot wait
+            # for space that only the workers can free, so the item waits in a task of its own
+            task = asyncio.create_task(self._queue.put(item))
+            self._spilled.add(task)
+            task.add_done_callback(self._spilled.discard)
+        else:
+            await self._queue.put(item)
 
     def create_publisher(self, *channels: List[Union[Channel, str]]) -> Publisher:
         """Create a new Publisher bound to one or more Channels.
@@ -531,10 +1039,15 @@ class Exchange(pydantic.BaseModel):
         *,
         timeout: Optional[servo.types.DurationDescriptor] = None,
         until_done: Optional[servo.types.Futuristic] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        overflow: OverflowPolicy = OverflowPolicy.block,
+        replay: Optional[servo.types.DurationDescriptor] = None,
     ) -> AsyncContextManager[Subscriber]:
         """An async context manager for subscribing to Messages in the Exchange.
 
-        A Subscriber is created, yielded to the caller, and deleted upon return.
+        A Subscriber is created, yielded to the caller, and deleted upon return. When
+        `replay` is given, Messages retained by matching Channels within that duration
+        before now are delivered ahead of newly published Messages.
 
         Usage:
             ```
@@ -547,12 +1060,17 @@ class Exchange(pydantic.BaseModel):
             Subscriber: The block temporary subscriber.
         """
         subscriber = self.create_subscriber(
-            selector, timeout=timeout, until_done=until_done
+            selector,
+            timeout=timeout,
+            until_done=until_done,
+            buffer_size=buffer_size,
+            overflow=overflow,
+            replay=replay,
         )
         try:
             yield subscriber
         finally:
-            self._subscribers.remove(subscriber)
+            self.remove_subscriber(subscriber)
 
     def create_subscriber(
         self,
@@ -561,6 +1079,10 @@ class Exchange(pydantic.BaseModel):
         callback: Optional[Callback] = None,
         timeout: Optional[servo.types.DurationDescriptor] = None,
         until_done: Optional[servo.types.Futuristic] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        overflow: OverflowPolicy = OverflowPolicy.block,
+        batched: bool = False,
+        replay: Optional[servo.types.DurationDescriptor] = None,
     ) -> Subscriber:
         """Create and return a new Subscriber with the given selector.
 
@@ -569,15 +1091,28 @@ class Exchange(pydantic.BaseModel):
             callback: An optional callback for processing Messages received.
             timeout: An optional duration description for specifying when to cancel the request.
             until_done: An optional future to to tie the subscription lifetime to.
+            buffer_size: The maximum number of Messages buffered for each async iterator.
+            overflow: The policy applied when the buffer of an async iterator is full.
+            batched: When True, the callback is invoked with lists of Messages.
+            replay: How far back to replay retained Messages from, as a duration before now.
 
         Returns:
             A new Subscriber object listening for Messages.
         """
         subscription = Subscription(selector=selector)
         subscriber = Subscriber(
-            exchange=self, subscription=subscription, callback=callback
+            exchange=self,
+            subscription=subscription,
+            callback=callback,
+            buffer_size=buffer_size,
+            overflow=overflow,
+            batched=batched,
         )
         self._subscribers.append(subscriber)
+        self._invalidate_routes()
+
+        if replay is not None:
+            subscriber._replay(self.replay(selector, replay))
 
         # Handle async affordances
         def _cancelizer(*args, **kwargs) -> None:
@@ -605,6 +1140,7 @@ class Exchange(pydantic.BaseModel):
             ValueError: Raised if the given subscriber is not in the Exchange.
         """
         self._subscribers.remove(subscriber)
+        self._invalidate_routes()
 
     @property
     def transformers(self) -> List[Transformer]:
@@ -653,6 +1189,26 @@ class Exchange(pydantic.BaseModel):
                 filter(lambda s: s.subscription.matches(channel), self._subscribers)
             )
 
+    def _route(self, channel: Channel) -> List[Subscriber]:
+        """Return the active Subscribers whose subscriptions match a Channel.
+
+        Routes are indexed by Channel name so that delivering a Message costs a hash
+        lookup and scales with the number of matching Subscribers rather than with
+        all Subscribers. Selectors are only evaluated when a Channel is first routed
+        after the Subscribers of the Exchange have changed.
+        """
+        if (subscribers := self._routes.get(channel.name)) is None:
+            subscribers = self._routes[channel.name] = [
+                subscriber
+                for subscriber in self._subscribers
+                if not subscriber.cancelled and subscriber.subscription.matches(channel)
+            ]
+
+        return subscribers
+
+    def _invalidate_routes(self) -> None:
+        self._routes.clear()
+
     def __repr_args__(self) -> pydantic.ReprArgs:
         return [
             ("running", self.running),
@@ -723,6 +1279,7 @@ class Subscription(BaseSubscription):
     """
 
     selector: Selector
+    _pattern: Optional[Pattern] = pydantic.PrivateAttr(None)
 
     @pydantic.validator("selector", pre=True)
     def _expand_selector_regex(cls, v: str) -> Union[str, Pattern]:
@@ -751,11 +1308,117 @@ class Subscription(BaseSubscription):
         if isinstance(selector, re.Pattern):
             return bool(selector.fullmatch(channel.name))
         elif isinstance(selector, str):
-            return fnmatch.fnmatch(channel.name, selector)
+            if selector == channel.name:
+                return True
+            elif not _is_glob(selector):
+                return False
+
+            if self._pattern is None:
+                self._pattern = _compile_glob(selector)
+            return bool(self._pattern.match(channel.name))
 
         raise ValueError(f"unknown selector type: {selector.__class__.__name__}")
 
 
+_GLOB_CHARACTERS = frozenset("*?[")
+
+
+def _is_glob(selector: str) -> bool:
+    return not _GLOB_CHARACTERS.isdisjoint(selector)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_glob(selector: str) -> Pattern:
+    return re.compile(fnmatch.translate(selector))
+
+
+class _Buffer:
+    """A bounded FIFO buffer of Message contexts applying an overflow policy when full."""
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_BUFFER_SIZE,
+        overflow: OverflowPolicy = OverflowPolicy.block,
+    ) -> None:
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.dropped = 0
+        self._items: Deque[Tuple[Message, Channel]] = collections.deque()
+        self._closed = False
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._items)
+
+    def close(self) -> None:
+        """Close the buffer, releasing all waiting readers and writers."""
+        self._closed = True
+        self._not_empty.set()
+        self._not_full.set()
+
+    async def put(self, item: Tuple[Message, Channel]) -> None:
+        if self.full and self.overflow == OverflowPolicy.block:
+            while self.full and not self._closed:
+                self._not_full.clear()
+                await self._not_full.wait()
+
+        self.put_nowait(item)
+
+    def put_nowait(self, item: Tuple[Message, Channel]) -> None:
+        """Put an item into the buffer, discarding per the overflow policy when full.
+
+        The block policy discards the oldest item when the buffer is full.
+        """
+        if self._closed:
+            return
+
+        if self.full:
+            if self.overflow == OverflowPolicy.drop_newest:
+                self._drop()
+                return
+            elif self.overflow == OverflowPolicy.coalesce:
+                _, channel = item
+                for index in range(len(self._items) - 1, -1, -1):
+                    if self._items[index][1] == channel:
+                        # NOTE: Requeue at the tail to preserve ordering across Channels
+                        del self._items[index]
+                        break
+                else:
+                    self._items.popleft()
+                self._drop()
+            else:
+                self._items.popleft()
+                self._drop()
+
+        self._items.append(item)
+        self._not_empty.set()
+
+    async def get(self) -> Optional[Tuple[Message, Channel]]:
+        """Return the next item in the buffer or None once the buffer is closed and drained."""
+        while not self._items and not self._closed:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        if not self._items:
+            return None
+
+        item = self._items.popleft()
+        self._not_full.set()
+        return item
+
+    def _drop(self) -> None:
+        if not self.dropped:
+            servo.logger.warning(
+                f"Subscriber buffer overflowed ({self.maxsize} messages): discarding messages per {self.overflow.value} policy"
+            )
+        self.dropped += 1
+
+
 _current_iterator_var = contextvars.ContextVar(
     "servo.pubsub._Iterator.current", default=None
 )
@@ -764,7 +1427,7 @@ _current_iterator_var = contextvars.ContextVar(
 class _Iterator(pydantic.BaseModel):
     subscriber: Subscriber
     yield_channel: bool = True
-    _queue: asyncio.Queue = pydantic.PrivateAttr(default_factory=asyncio.Queue)
+    _buffer: _Buffer = pydantic.PrivateAttr(None)
     _stopped: bool = pydantic.PrivateAttr(False)
     _message_reset_token: Optional[contextvars.Token] = pydantic.PrivateAttr(None)
     _iterator_reset_token: Optional[contextvars.Token] = pydantic.PrivateAttr(None)
@@ -772,19 +1435,24 @@ class _Iterator(pydantic.BaseModel):
     def __init__(self, subscriber: Subscriber, **kwargs) -> None:
         super().__init__(**kwargs, subscriber=subscriber)
         self.subscriber = subscriber  # Pydantic copying
+        self._buffer = _Buffer(subscriber.buffer_size, subscriber.overflow)
         self._message_reset_token = _current_context_var.set(None)
         self._iterator_reset_token = _current_iterator_var.set(self)
 
     def stop(self) -> None:
         self._stopped = True
-        self._queue.put_nowait(None)
+        self._buffer.close()
+
+    def close(self) -> None:
+        """Stop iterating once the Messages already received have been yielded."""
+        self._buffer.close()
 
     @property
     def stopped(self) -> bool:
         return self._stopped
 
     async def __call__(self, message: Message, channel: Channel) -> None:
-        await self._queue.put((message, channel))
+        await self._buffer.put((message, channel))
 
     def _stop_iteration(self) -> None:
         _current_context_var.reset(self._message_reset_token)
@@ -795,7 +1463,7 @@ class _Iterator(pydantic.BaseModel):
         if self.stopped:
             self._stop_iteration()
 
-        message_context = await self._queue.get()
+        message_context = await self._buffer.get()
         if message_context is None:
             self._stop_iteration()
 
@@ -825,6 +1493,10 @@ class Subscriber(_ExchangeChildModel):
         exchange: The pub/sub exchange that the Subscriber belongs to.
         subscription: A descriptor of the types of Messages that the Subscriber is interested in.
         callback: An optional callable to be invoked whben the Subscriber is notified of new Messages.
+        buffer_size: The maximum number of Messages buffered for each async iterator. Zero is unbounded.
+        overflow: The policy applied when a Message is delivered to a full iterator buffer.
+        batched: When True, the callback is invoked with a list of Messages rather than
+            a single Message. Messages published in batches are delivered in one call.
 
      Usage:
             ```
@@ -847,8 +1519,22 @@ class Subscriber(_ExchangeChildModel):
 
     subscription: Subscription
     callback: Optional[Callback]
+    buffer_size: pydantic.NonNegativeInt = DEFAULT_BUFFER_SIZE
+    overflow: OverflowPolicy = OverflowPolicy.block
+    batched: bool = False
     _event: asyncio.Event = pydantic.PrivateAttr(default_factory=asyncio.Event)
     _iterators: List[_Iterator] = pydantic.PrivateAttr([])
+    _callback_spec: Optional[Tuple[Callback, int, bool]] = pydantic.PrivateAttr(None)
+    _replayed: Optional[Deque[Tuple[List[Message], Channel]]] = pydantic.PrivateAttr(
+        None
+    )
+
+    def __init__(self, *args, **kwargs) -> None:  # noqa: D107
+        super().__init__(*args, **kwargs)
+        if self.callback:
+            # Resolve the arity of the callback once at subscription time
+            with contextlib.suppress(ValueError, TypeError):
+                self._inspect_callback()
 
     def stop(self) -> None:
         """Stop the current async iterator.
@@ -871,7 +1557,8 @@ class Subscriber(_ExchangeChildModel):
     def cancel(self) -> None:
         """Cancel the subscriber from receiving any further Messages.
 
-        Any objects waiting on the Subscriber and any async iterators are released.
+        Any objects waiting on the Subscriber are released and any async iterators stop
+        once they have yielded the Messages already delivered to them.
 
         Raises:
             RuntimeError: Raised if the Subscriber has alreayd been cancelled.
@@ -879,10 +1566,12 @@ class Subscriber(_ExchangeChildModel):
         if self.cancelled:
             raise RuntimeError(f"Subscriber is already cancelled")
         self._event.set()
+        if exchange := self.exchange:
+            exchange._invalidate_routes()
 
-        # Stop any attached iterators
+        # Close any attached iterators
         for iterator in self._iterators:
-            iterator.stop()
+            iterator.close()
 
         self._iterators.clear()
 
@@ -898,33 +1587,116 @@ class Subscriber(_ExchangeChildModel):
         """
         await self._event.wait()
 
+    def _inspect_callback(self) -> Tuple[int, bool]:
+        # NOTE: The callback can be reassigned so the cached spec is keyed by identity
+        spec = self._callback_spec
+        if spec is None or spec[0] is not self.callback:
+            signature = inspect.Signature.from_callable(self.callback)
+            spec = self._callback_spec = (
+                self.callback,
+                len(signature.parameters),
+                asyncio.iscoroutinefunction(self.callback),
+            )
+
+        return spec[1], spec[2]
+
     async def __call__(self, message: Message, channel: Channel) -> None:
         if self.cancelled:
             servo.logger.warning(f"ignoring call to cancelled Subscriber: {self}")
             return
 
         if self.subscription.matches(channel, message):
+            await self._deliver(message, channel)
+
+    async def _deliver(self, message: Message, channel: Channel) -> None:
+        """Deliver a Message that has already been routed to the Subscriber by the Exchange."""
+        await self._deliver_batch([message], channel)
+
+    async def _deliver_batch(self, messages: List[Message], channel: Channel) -> None:
+        """Deliver a batch of Messages routed to the Subscriber by the Exchange."""
+        if self.cancelled:
+            return
+
+        if self._replayed is not None:
+            # Hold newly published Messages until the replay has been delivered
+            self._replayed.append((messages, channel))
+            return
+
+        await self._receive(messages, channel)
+
+    async def _receive(self, messages: List[Message], channel: Channel) -> None:
+        if self.batched:
             if self.callback:
-                # NOTE: Yield message or message, channel based on callable arity
-                signature = inspect.Signature.from_callable(self.callback)
-                if len(signature.parameters) == 1:
-                    if asyncio.iscoroutinefunction(self.callback):
-                        await self.callback(message)
-                    else:
-                        self.callback(message)
-                elif len(signature.parameters) == 2:
-                    if asyncio.iscoroutinefunction(self.callback):
-                        await self.callback(message, channel)
-                    else:
-                        self.callback(message, channel)
-                else:
-                    raise TypeError(f"Incorrect callback")
+                await self._invoke_callback(messages, channel)
 
-            for _, iterator in enumerate(self._iterators):
-                if iterator.stopped:
-                    self._iterators.remove(iterator)
-                else:
-                    await iterator(message, channel)
+            for message in messages:
+                await self._notify_iterators(message, channel)
+            return
+
+        for message in messages:
+            if self.cancelled:
+                return
+
+            reset_token = _current_context_var.set((message, channel))
+            try:
+                if self.callback:
+                    await self._invoke_callback(message, channel)
+
+                await self._notify_iterators(message, channel)
+            finally:
+                _current_context_var.reset(reset_token)
+
+    async def _invoke_callback(
+        self, message: Union[Message, List[Message]], channel: Channel
+    ) -> None:
+        # NOTE: Yield message or message, channel based on callable arity
+        arity, is_coroutine = self._inspect_callback()
+        if arity == 1:
+            if is_coroutine:
+                await self.callback(message)
+            else:
+                self.callback(message)
+        elif arity == 2:
+            if is_coroutine:
+                await self.callback(message, channel)
+            else:
+                self.callback(message, channel)
+        else:
+            raise TypeError(f"Incorrect callback")
+
+    def _replay(self, messages: List[Tuple[Message, Channel]]) -> None:
+        """Deliver retained Messages ahead of newly published Messages.
+
+        The replay is delivered in a new task to the callback and the async iterators
+        attached by the time it runs. Messages routed to the Subscriber in the meantime
+        are held and delivered after the replay in the order they were published.
+        """
+        if not messages:
+            return
+
+        self._replayed = collections.deque(
+            ([message], channel) for message, channel in messages
+        )
+
+        async def _deliver_replay() -> None:
+            try:
+                while self._replayed and not self.cancelled:
+                    messages, channel = self._replayed.popleft()
+                    with servo.logger.catch(message="Subscriber raised exception"):
+                        await self._receive(messages, channel)
+            finally:
+                # Release the replayed Messages and resume delivering directly
+                self._replayed = None
+
+        task = asyncio.create_task(_deliver_replay())
+        task.add_done_callback(_error_watcher)
+
+    async def _notify_iterators(self, message: Message, channel: Channel) -> None:
+        for _, iterator in enumerate(self._iterators):
+            if iterator.stopped:
+                self._iterators.remove(iterator)
+            else:
+                await iterator(message, channel)
 
     def __aiter__(self):  # noqa: D105
         iterator = _Iterator(self)
@@ -993,6 +1765,21 @@ class Transformer(abc.ABC, pydantic.BaseModel):
     async def __call__(self, message: Message, channel: Channel) -> Optional[Message]:
         """Transforms a published Message before delivery to Subscribers."""
 
+    async def transform_batch(
+        self, messages: List[Message], channel: Channel
+    ) -> List[Message]:
+        """Transforms a batch of published Messages before delivery to Subscribers.
+
+        The default implementation transforms each Message individually, dropping those
+        that are cancelled. Subclasses can override it to process the batch in one call.
+        """
+        transformed = []
+        for message in messages:
+            if (message_ := await self(message, channel)) is not None:
+                transformed.append(message_)
+
+        return transformed
+
 
 class Filter(Transformer):
     """A Filter intercepts Messages before delivery to Subscribers and cancels or
@@ -1,38 +1,92 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import datetime
 import functools
+import multiprocessing
 import os
+import pathlib
 import random
 import shutil
 import signal
-from typing import Any, Optional
+import time
+import traceback
+from typing import Any, Callable, Hashable, Optional, Tuple, Union
 
 import backoff
 import colorama
 import devtools
 import httpx
+import loguru
 import pydantic
 import pyfiglet
 import typer
+import yaml
 
 import servo
 import servo.api
+import servo.downsampling
+import servo.monitoring
+import servo.normalization
+import servo.spool
 import servo.telemetry
+import servo.tracing
 import servo.configuration
+import servo.utilities.executor
 import servo.utilities.key_paths
 import servo.utilities.strings
 from servo.servo import _set_current_servo
 from servo.types import Adjustment, Control, Description, Duration, Measurement
 
 
+API_CLIENT_LIMITS = httpx.Limits(
+    max_connections=10, max_keepalive_connections=5, keepalive_expiry=120.0
+)
+"""Connection pool limits for the long-lived API client owned by a servo runner.
+
+The keep-alive expiry outlasts the polling interval of the main loop so that connections
+to the optimizer are reused between commands rather than re-established.
+"""
+
+
+def _is_rejected(error: httpx.HTTPError) -> bool:
+    """Return True if an error is a response rejecting a request that is not worth retrying."""
+    if not isinstance(error, httpx.HTTPStatusError):
+        return False
+
+    status_code = error.response.status_code
+    return 400 <= status_code < 500 and status_code not in (
+        httpx.codes.REQUEST_TIMEOUT,
+        httpx.codes.TOO_MANY_REQUESTS,
+    )
+
+
+def _estimated_size_of_measurement(measurement: Measurement) -> int:
+    """Return the approximate size in bytes of a measurement serialized for the Opsani API."""
+    # Serialized data points are a timestamp and value pair of roughly 32 bytes
+    return 32 * sum(
+        len(reading) if isinstance(reading, servo.TimeSeries) else 1
+        for reading in measurement.readings
+    )
+
+
 class ServoRunner(pydantic.BaseModel, servo.logging.Mixin, servo.api.Mixin):
     interactive: bool = False
     _servo: servo.Servo = pydantic.PrivateAttr(None)
+    _api_client: Optional[httpx.AsyncClient] = pydantic.PrivateAttr(None)
+    _spool: Optional[servo.spool.Spool] = pydantic.PrivateAttr(None)
+    _description_cache: Optional[
+        Tuple[Hashable, float, Description]
+    ] = pydantic.PrivateAttr(None)
+    _description_subscriber: Optional[servo.pubsub.Subscriber] = pydantic.PrivateAttr(
+        None
+    )
     _connected: bool = pydantic.PrivateAttr(False)
     _running: bool = pydantic.PrivateAttr(False)
     _main_loop_task: Optional[asyncio.Task] = pydantic.PrivateAttr(None)
     _diagnostics_loop_task: Optional[asyncio.Task] = pydantic.PrivateAttr(None)
+    _loop_monitor: Optional[servo.monitoring.LoopMonitor] = pydantic.PrivateAttr(None)
 
     class Config:
         arbitrary_types_allowed = True
@@ -70,20 +124,140 @@ class ServoRunner(pydantic.BaseModel, servo.logging.Mixin, servo.api.Mixin):
         # Adopt the servo config for driving the API mixin
         return self.servo.api_client_options
 
+    @property
+    def api_compression(self) -> bool:
+        return self.servo.api_compression
+
+    @property
+    def shared_api_client(self) -> Optional[httpx.AsyncClient]:
+        return self._api_client
+
+    def _open_api_client(self) -> httpx.AsyncClient:
+        """Open the long-lived API client shared by the runner and its servo."""
+        http2 = bool(self.config.settings and self.config.settings.http2)
+        try:
+            client = self.api_client(limits=API_CLIENT_LIMITS, http2=http2)
+        except ImportError as error:
+            self.logger.warning(
+                f"HTTP/2 is unavailable, falling back to HTTP/1.1 for the Opsani API: {error}"
+            )
+            client = self.api_client(limits=API_CLIENT_LIMITS)
+
+        self.servo.use_api_client(client)
+        return client
+
+    async def _close_api_client(self) -> None:
+        """Close the long-lived API client, reverting to a client per request."""
+        client, self._api_client = self._api_client, None
+        if client is None:
+            return
+
+        if self.servo.shared_api_client is client:
+            self.servo.use_api_client(None)
+        await client.aclose()
+
+    def invalidate_description(self) -> None:
+        """Discard the cached description so that the next describe is dispatched to the connectors."""
+        self._description_cache = None
+
+    def _description_cache_key(self, control: Control) -> Hashable:
+        """Return a key identifying the control and configuration that a description applies to."""
+        return (
+            control.json(),
+            self.config.json(),
+            tuple(id(connector) for connector in self.servo.connectors),
+        )
+
+    def _subscribe_to_description_changes(self) -> None:
+        """Invalidate the cached description when a connector notifies of changes."""
+        if self._description_subscriber is not None:
+            return
+
+        def _description_changed(message: servo.pubsub.Message) -> None:
+            self.logger.debug(f"Invalidating cached description: {message.json()}")
+            self.invalidate_description()
+
+        self._description_subscriber = self.servo.pubsub_exchange.create_subscriber(
+            servo.connector.DESCRIPTION_CHANGED_CHANNEL, callback=_description_changed
+        )
+
+    def _unsubscribe_from_description_changes(self) -> None:
+        subscriber, self._description_subscriber = self._description_subscriber, None
+        if subscriber is None:
+            return
+
+        if not subscriber.cancelled:
+            subscriber.cancel()
+        try:
+            subscriber.exchange.remove_subscriber(subscriber)
+        except ValueError:
+            pass  # already removed by the exchange
+
     async def describe(self, control: Control) -> Description:
+        ttl = self.config.settings and self.config.settings.description_ttl
+        if ttl is not None:
+            key = self._description_cache_key(control)
+            if self._description_cache:
+                cached_key, expires_at, description = self._description_cache
+                if cached_key == key and time.monotonic() < expires_at:
+                    self.logger.info("Describing... (cached)")
+                    return description
+
         self.logger.info("Describing...")
 
         aggregate_description = Description.construct()
-        results: list[servo.EventResult] = await self.servo.dispatch_event(
-            servo.Events.describe, control=control
+        descriptions = await self._dispatch_as_completed(
+            servo.Events.describe, "DESCRIPTION", control=control
         )
-        for result in results:
-            description = result.value
+        for description in descriptions:
             aggregate_description.components.extend(description.components)
             aggregate_description.metrics.extend(description.metrics)
 
+        if ttl is not None:
+            self._description_cache = (
+                key,
+                time.monotonic() + ttl.total_seconds(),
+                aggregate_description,
+            )
+
         return aggregate_description
 
+    async def _dispatch_as_completed(
+        self,
+        event: servo.Events,
+        operation: str,
+        process: Optional[Callable[[servo.EventResult], Any]] = None,
+        **kwargs,
+    ) -> list[Any]:
+        """Dispatch an event to the servo and process each result as soon as its connector completes.
+
+        Progress is reported as connectors complete. The processed values are returned in the order
+        of the connectors rather than the order of completion so that aggregation is deterministic.
+        """
+        started_at = datetime.datetime.now()
+        handler_count = sum(
+            len(connector.get_event_handlers(event, servo.Preposition.on))
+            for connector in self.servo.__connectors__
+        )
+        processed: list[Tuple[servo.EventResult, Any]] = []
+        async for result in self.servo.dispatch_event_as_completed(event, **kwargs):
+            processed.append((result, process(result) if process else result.value))
+            if len(processed) < handler_count:
+                self.logger.info(
+                    f"{result.connector.name} completed {event} ({len(processed)}/{handler_count})",
+                    progress=100 * len(processed) / handler_count,
+                    connector=self.servo,
+                    operation=operation,
+                    started_at=started_at,
+                )
+
+        positions = {
+            connector: index
+            for index, connector in enumerate(self.servo.__connectors__)
+        }
+        processed.sort(key=lambda item: positions[item[0].connector])
+        return [value for _, value in processed]
+
     async def measure(self, param: servo.api.MeasureParams) -> Measurement:
         if isinstance(param, dict):
             # required parsing has failed in api.Mixin._post_event(), run parse_obj to surface the validation errors
@@ -92,14 +266,28 @@ class ServoRunner(pydantic.BaseModel, servo.logging.Mixin, servo.api.Mixin):
         servo.logger.trace(devtools.pformat(param))
 
         aggregate_measurement = Measurement.construct()
-        results: list[servo.EventResult] = await self.servo.dispatch_event(
-            servo.Events.measure, metrics=param.metrics, control=param.control
+        downsampling = self.config.settings and self.config.settings.downsampling
+
+        def _downsample(result: servo.EventResult) -> Measurement:
+            # Downsample each measurement as it arrives while slower connectors are still measuring
+            return servo.downsampling.downsample_measurement(result.value, downsampling)
+
+        measurements = await self._dispatch_as_completed(
+            servo.Events.measure,
+            "MEASUREMENT",
+            process=_downsample if downsampling else None,
+            metrics=param.metrics,
+            control=param.control,
         )
-        for result in results:
-            measurement = result.value
+        for measurement in measurements:
             aggregate_measurement.readings.extend(measurement.readings)
             aggregate_measurement.annotations.update(measurement.annotations)
 
+        if self.config.settings and self.config.settings.normalization:
+            aggregate_measurement = servo.normalization.normalize_measurement(
+                aggregate_measurement, self.config.settings.normalization
+            )
+
         return aggregate_measurement
 
     async def adjust(
@@ -111,9 +299,14 @@ class ServoRunner(pydantic.BaseModel, servo.logging.Mixin, servo.api.Mixin):
         self.logger.trace(devtools.pformat(control))
 
         aggregate_description = Description.construct()
-        results = await self.servo.dispatch_event(
-            servo.Events.adjust, adjustments=adjustments, control=control
-        )
+        try:
+            results = await self.servo.dispatch_event(
+                servo.Events.adjust, adjustments=adjustments, control=control
+            )
+        finally:
+            # Adjustments change the described state, even when they fail part way through
+            self.invalidate_description()
+
         for result in results:
             description = result.value
             aggregate_description.components.extend(description.components)
@@ -146,14 +339,17 @@ class ServoRunner(pydantic.BaseModel, servo.logging.Mixin, servo.api.Mixin):
                     f"Measured: {len(measurement.readings)} readings, {len(measurement.annotations)} annotations"
                 )
                 self.logger.trace(devtools.pformat(measurement))
-                param = measurement.__opsani_repr__()
+                param = await servo.utilities.executor.offload(
+                    measurement.__opsani_repr__,
+                    size=_estimated_size_of_measurement(measurement),
+                )
             except servo.errors.EventError as error:
                 self.logger.error(f"Measurement failed: {error}")
                 param = servo.api.Status.from_error(error).dict()
                 self.logger.error(f"Responding with {param}")
                 self.logger.opt(exception=error).debug("Measure failure details")
 
-            return await self._post_event(servo.api.Events.measure, param)
+            return await self._post_spooled_event(servo.api.Events.measure, param)
 
         elif cmd_response.command == servo.api.Commands.adjust:
             adjustments = servo.api.descriptor_to_adjustments(
@@ -198,6 +394,65 @@ class ServoRunner(pydantic.BaseModel, servo.logging.Mixin, servo.api.Mixin):
         else:
             raise ValueError(f"Unknown command '{cmd_response.command.value}'")
 
+    async def _post_spooled_event(
+        self, event: servo.api.Events, param
+    ) -> Union[servo.api.CommandResponse, servo.api.Status]:
+        """Post an event after durably spooling it, acknowledging it once the post succeeds."""
+        if self._spool is None:
+            return await self._post_event(event, param)
+
+        # NOTE: Spool writes are synced to disk so they are kept off the event loop
+        entry_id = await servo.utilities.executor.offload(
+            self._spool.append, self.optimizer.id, event, param
+        )
+        try:
+            response = await self._post_event(event, param)
+        except httpx.HTTPStatusError as error:
+            if _is_rejected(error):
+                # Posting again cannot succeed, so the event must not be replayed
+                await servo.utilities.executor.offload(
+                    self._spool.acknowledge, entry_id
+                )
+            raise
+
+        await servo.utilities.executor.offload(self._spool.acknowledge, entry_id)
+        return response
+
+    async def _replay_spool(self) -> None:
+        """Post the spooled results that have not been acknowledged by the optimizer."""
+        if self._spool is None:
+            return
+
+        pending = await servo.utilities.executor.offload(
+            self._spool.pending, self.optimizer.id
+        )
+        for entry in pending:
+            self.logger.info(
+                f'Replaying unacknowledged "{entry.event}" event spooled at {datetime.datetime.fromtimestamp(entry.created_at)}'
+            )
+            try:
+                status = await self._post_event(
+                    servo.api.Events(entry.event), entry.param
+                )
+            except httpx.HTTPError as error:
+                if not _is_rejected(error):
+                    self.logger.warning(
+                        f'Failed replaying "{entry.event}" event, will retry later: {error}'
+                    )
+                    return
+
+                # Discard the event so that it does not block replay of later events
+                self.logger.error(
+                    f'Discarding "{entry.event}" event spooled at {datetime.datetime.fromtimestamp(entry.created_at)} rejected by the optimizer: {error}'
+                )
+                await servo.utilities.executor.offload(
+                    self._spool.acknowledge, entry.id
+                )
+                continue
+
+            await servo.utilities.executor.offload(self._spool.acknowledge, entry.id)
+            self.logger.debug(f'Replayed "{entry.event}" event => {status}')
+
     # Main run loop for processing commands from the optimizer
     async def main_loop(self) -> None:
         # FIXME: We have seen exceptions from using `with self.servo.current()` crossing contexts
@@ -211,6 +466,7 @@ class ServoRunner(pydantic.BaseModel, servo.logging.Mixin, servo.api.Mixin):
                         await asyncio.sleep(60)
                         continue
 
+                await self._replay_spool()
                 status = await self.exec_command()
                 if status.status == servo.api.OptimizerStatuses.unexpected_event:
                     self.logger.warning(
@@ -260,7 +516,9 @@ class ServoRunner(pydantic.BaseModel, servo.logging.Mixin, servo.api.Mixin):
         self._main_loop_task.add_done_callback(_reraise_if_necessary)
 
         if not servo.current_servo().config.no_diagnostics:
-            diagnostics_handler = servo.telemetry.DiagnosticsHandler(self.servo)
+            diagnostics_handler = servo.telemetry.DiagnosticsHandler(
+                self.servo, monitor=self._loop_monitor
+            )
             self._diagnostics_loop_task = asyncio.create_task(
                 diagnostics_handler.diagnostics_check(),
                 name=f"diagnostics for servo {self.optimizer.id}",
@@ -272,9 +530,42 @@ class ServoRunner(pydantic.BaseModel, servo.logging.Mixin, servo.api.Mixin):
 
     async def run(self, *, poll: bool = True) -> None:
         self._running = True
+        if self._api_client is None or self._api_client.is_closed:
+            self._api_client = self._open_api_client()
+        if self.config.settings and self.config.settings.executor:
+            servo.utilities.executor.configure_executor(
+                max_workers=self.config.settings.executor.max_workers,
+                threshold=self.config.settings.executor.threshold,
+            )
+        if self.config.settings and self.config.settings.tracing:
+            servo.tracing.configure_tracer(
+                enabled=self.config.settings.tracing.enabled,
+                max_spans=self.config.settings.tracing.max_spans,
+            )
+        if (
+            self._loop_monitor is None
+            and self.config.settings
+            and self.config.settings.monitor
+        ):
+            monitor_config = self.config.settings.monitor
+            self._loop_monitor = servo.monitoring.LoopMonitor(
+                interval=monitor_config.interval.total_seconds(),
+                threshold=monitor_config.threshold.total_seconds(),
+                report_interval=monitor_config.report_interval.total_seconds(),
+                max_stalls=monitor_config.max_stalls,
+            )
+            self._loop_monitor.start()
+        if self._spool is None and self.config.settings and self.config.settings.spool:
+            self._spool = await servo.utilities.executor.offload(
+                servo.spool.Spool,
+                self.config.settings.spool.path,
+                max_entries=self.config.settings.spool.max_entries,
+                max_size=self.config.settings.spool.max_size,
+            )
 
         _set_current_servo(self.servo)
         await self.servo.startup()
+        self._subscribe_to_description_changes()
         self.logger.info(
             f"Servo started with {len(self.servo.connectors)} active connectors [{self.optimizer.id} @ {self.optimizer.url or self.optimizer.base_url}]"
         )
@@ -335,6 +626,113 @@ class ServoRunner(pydantic.BaseModel, servo.logging.Mixin, servo.api.Mixin):
                 await self._post_event(servo.api.Events.goodbye, dict(reason=reason))
         except Exception:
             self.logger.exception(f"Exception occurred during GOODBYE request")
+        finally:
+            self._unsubscribe_from_description_changes()
+            self.invalidate_description()
+            await self._close_api_client()
+            if self._loop_monitor:
+                await self._loop_monitor.stop()
+                self._loop_monitor = None
+            if self._spool:
+                await servo.utilities.executor.offload(self._spool.close)
+                self._spool = None
+
+
+WORKER_SHUTDOWN_TIMEOUT = Duration("30s")
+"""The duration to wait for a servo worker process to shut down before it is killed."""
+
+
+class _LogForwarder:
+    """A log sink that forwards the records of a servo worker process to the assembly runner."""
+
+    def __init__(
+        self, queue: multiprocessing.Queue, servo_id: str
+    ) -> None:  # noqa: D107
+        self.queue = queue
+        self.servo_id = servo_id
+
+    def __call__(self, message) -> None:
+        record = message.record
+        text = record["message"]
+        if record["exception"]:
+            text += "\n" + "".join(traceback.format_exception(*record["exception"]))
+
+        self.queue.put(
+            dict(
+                level=record["level"].name,
+                message=text,
+                component=f"{self.servo_id}({record['extra'].get('component', 'servo')})",
+                name=record["name"],
+                function=record["function"],
+                line=record["line"],
+                time=record["time"],
+            )
+        )
+
+
+def _run_servo_process(
+    config_file: pathlib.Path,
+    index: int,
+    optimizer: Optional[servo.Optimizer],
+    log_queue: multiprocessing.Queue,
+    log_level: str,
+    poll: bool,
+    debug: bool,
+) -> None:
+    """Run a servo of a multi-servo assembly in a worker process.
+
+    The servo is assembled from its document in the config file and run by a single servo
+    assembly runner. Log records are forwarded to the supervising assembly runner.
+    """
+    # Detach from the terminal process group: signals are forwarded by the supervisor
+    os.setsid()
+
+    with open(config_file) as f:
+        configs = list(yaml.load_all(f, Loader=yaml.FullLoader))
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    assembly = loop.run_until_complete(
+        servo.Assembly.assemble(
+            config_file=config_file, configs=[configs[index]], optimizer=optimizer
+        )
+    )
+
+    servo.logging.set_level(log_level)
+    loguru.logger.remove()
+    loguru.logger.add(
+        _LogForwarder(log_queue, assembly.servos[0].optimizer.id),
+        filter=servo.logging.DEFAULT_FILTER,
+        format=servo.logging.DEFAULT_FORMATTER,
+        level=0,
+    )
+    AssemblyRunner(assembly).run(poll=poll, debug=debug, banner=False)
+
+
+async def _wait_for_process(
+    process: multiprocessing.Process, timeout: Optional[float] = None
+) -> None:
+    """Wait for a process to exit without blocking a thread.
+
+    The process sentinel becomes readable when the process exits, so the wait is
+    performed by the event loop rather than by parking an executor thread in `join`.
+    """
+    loop = asyncio.get_event_loop()
+    exited = loop.create_future()
+
+    def _on_exit() -> None:
+        if not exited.done():
+            exited.set_result(None)
+
+    loop.add_reader(process.sentinel, _on_exit)
+    try:
+        await asyncio.wait_for(exited, timeout)
+    except asyncio.TimeoutError:
+        return
+    finally:
+        loop.remove_reader(process.sentinel)
+
+    # Reap the exited process (the sentinel closes just ahead of the exit status)
+    process.join()
 
 
 class AssemblyRunner(pydantic.BaseModel, servo.logging.Mixin):
@@ -343,6 +741,12 @@ class AssemblyRunner(pydantic.BaseModel, servo.logging.Mixin):
     progress_handler: Optional[servo.logging.ProgressHandler] = None
     progress_handler_id: Optional[int] = None
     _running: bool = pydantic.PrivateAttr(False)
+    _workers: dict[str, multiprocessing.Process] = pydantic.PrivateAttr({})
+    _worker_tasks: list[asyncio.Task] = pydantic.PrivateAttr([])
+    _log_queue: Optional[multiprocessing.Queue] = pydantic.PrivateAttr(None)
+    _log_executor: Optional[
+        concurrent.futures.ThreadPoolExecutor
+    ] = pydantic.PrivateAttr(None)
 
     class Config:
         arbitrary_types_allowed = True
@@ -362,15 +766,36 @@ class AssemblyRunner(pydantic.BaseModel, servo.logging.Mixin):
         return self._running
 
     def run(
-        self, *, poll: bool = True, interactive: bool = False, debug: bool = False
+        self,
+        *,
+        poll: bool = True,
+        interactive: bool = False,
+        debug: bool = False,
+        processes: bool = False,
+        banner: bool = True,
     ) -> None:
         """Asynchronously run all servos active within the assembly.
 
         Running the assembly takes over the current event loop and schedules a `ServoRunner` instance for each servo active in the assembly.
+
+        When `processes` is True and the assembly contains multiple servos, each servo is instead run in a
+        worker process supervised by the assembly runner so that servos are isolated from one another and
+        scale across cores. Log records are forwarded from the workers and signals are forwarded to them.
         """
         if self.running:
             raise RuntimeError("Cannot run an assembly that is already running")
 
+        processes = processes and len(self.assembly.servos) > 1
+        if processes:
+            if interactive:
+                raise ValueError(
+                    "interactive mode is not supported when running servos in worker processes"
+                )
+            if self.assembly.config_file is None:
+                raise ValueError(
+                    "running servos in worker processes requires an assembly loaded from a config file"
+                )
+
         self._running = True
         loop = asyncio.get_event_loop()
 
@@ -386,6 +811,17 @@ class AssemblyRunner(pydantic.BaseModel, servo.logging.Mixin):
         else:
             loop.set_exception_handler(None)
 
+        if banner:
+            self._display_banner()
+
+        if processes:
+            try:
+                self._start_workers(loop, poll=poll, debug=debug)
+                loop.run_forever()
+            finally:
+                loop.close()
+            return
+
         # Setup logging
         async def _report_progress(**kwargs) -> None:
             # Forward to the active servo...
@@ -439,13 +875,22 @@ class AssemblyRunner(pydantic.BaseModel, servo.logging.Mixin):
                     f"unrecognized exception passed to progress exception handler: {error}"
                 )
 
+        # The handler is shared by all servos so honor the most frequent interval configured.
+        # Progress is reported as logged unless an interval is configured
+        progress_intervals = [
+            servo_.config.settings.progress_interval
+            for servo_ in self.assembly.servos
+            if servo_.config.settings
+            and servo_.config.settings.progress_interval is not None
+        ]
         self.progress_handler = servo.logging.ProgressHandler(
-            _report_progress, self.logger.warning, handle_progress_exception
+            _report_progress,
+            self.logger.warning,
+            handle_progress_exception,
+            min_interval=min(progress_intervals, default=None),
         )
         self.progress_handler_id = self.logger.add(self.progress_handler.sink)
 
-        self._display_banner()
-
         try:
             for servo_ in self.assembly.servos:
                 servo_runner = ServoRunner(servo_, interactive=interactive)
@@ -457,6 +902,107 @@ class AssemblyRunner(pydantic.BaseModel, servo.logging.Mixin):
         finally:
             loop.close()
 
+    def _start_workers(
+        self, loop: asyncio.AbstractEventLoop, *, poll: bool, debug: bool
+    ) -> None:
+        """Start a worker process for each servo in the assembly and supervise them."""
+        context = multiprocessing.get_context("spawn")
+        self._log_queue = context.Queue()
+        # NOTE: The forwarder blocks a thread for its lifetime so it must not share the default executor
+        self._log_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="servo-worker-logs"
+        )
+        self._worker_tasks.append(loop.create_task(self._forward_worker_logs()))
+
+        for index, servo_ in enumerate(self.assembly.servos):
+            process = context.Process(
+                target=_run_servo_process,
+                args=(
+                    self.assembly.config_file,
+                    index,
+                    servo_.optimizer,
+                    self._log_queue,
+                    servo.logging.DEFAULT_FILTER.level,
+                    poll,
+                    debug,
+                ),
+                name=f"servo {servo_.optimizer.id}",
+                daemon=True,
+            )
+            process.start()
+            self.logger.info(
+                f"Started worker process {process.pid} for servo {servo_.optimizer.id}"
+            )
+            self._workers[servo_.optimizer.id] = process
+            self._worker_tasks.append(
+                loop.create_task(self._supervise_worker(servo_.optimizer.id, process))
+            )
+
+    async def _supervise_worker(
+        self, servo_id: str, process: multiprocessing.Process
+    ) -> None:
+        """Shut down the assembly if a worker process exits while it is running."""
+        await _wait_for_process(process)
+        self.logger.critical(
+            f"Worker process {process.pid} for servo {servo_id} exited unexpectedly with code {process.exitcode}: shutting down"
+        )
+        asyncio.create_task(self._shutdown(asyncio.get_event_loop()))
+
+    async def _forward_worker_logs(self) -> None:
+        """Log the records forwarded from worker processes until a None sentinel is received."""
+        loop = asyncio.get_event_loop()
+        while record := await loop.run_in_executor(
+            self._log_executor, self._log_queue.get
+        ):
+            self.logger.bind(component=record["component"]).patch(
+                lambda r, record=record: r.update(
+                    name=record["name"],
+                    function=record["function"],
+                    line=record["line"],
+                    time=record["time"],
+                )
+            ).log(record["level"], record["message"])
+
+    async def _shutdown_workers(
+        self, loop: asyncio.AbstractEventLoop, signal=None
+    ) -> None:
+        """Forward a shutdown signal to the worker processes and wait for them to exit."""
+        supervisors, forwarder = self._worker_tasks[1:], self._worker_tasks[0]
+        for task in supervisors:
+            task.cancel()
+
+        self.logger.info(
+            f"Shutting down {len(self._workers)} servo worker processes..."
+        )
+        for process in self._workers.values():
+            if process.is_alive():
+                if signal:
+                    os.kill(process.pid, signal)
+                else:
+                    process.terminate()
+
+        timeout = WORKER_SHUTDOWN_TIMEOUT.total_seconds()
+        await asyncio.gather(
+            *(_wait_for_process(process, timeout) for process in self._workers.values())
+        )
+        for servo_id, process in self._workers.items():
+            if process.is_alive():
+                self.logger.critical(
+                    f"Worker process {process.pid} for servo {servo_id} failed to shut down within {WORKER_SHUTDOWN_TIMEOUT}: killing"
+                )
+                process.kill()
+                process.join()
+
+        # Drain the logs of the exited workers
+        self._log_queue.put(None)
+        await asyncio.gather(forwarder, *supervisors, return_exceptions=True)
+        self._log_queue.close()
+        self._log_queue.join_thread()
+        self._log_executor.shutdown()
+        self._log_executor = None
+        self._workers.clear()
+        self._worker_tasks.clear()
+
     def _display_banner(self) -> None:
         fonts = [
             "slant",
@@ -577,6 +1123,14 @@ class AssemblyRunner(pydantic.BaseModel, servo.logging.Mixin):
 
         reason = signal.name if signal else "shutdown"
 
+        if self._workers:
+            await self._shutdown_workers(loop, signal=signal)
+            self.logger.info("Servo shutdown complete.")
+            await asyncio.gather(self.logger.complete(), return_exceptions=True)
+            self._running = False
+            loop.stop()
+            return
+
         # Shut down the servo runners, breaking active control loops
         if len(self.runners) == 1:
             self.logger.info(f"Shutting down servo...")
@@ -612,6 +1166,8 @@ class AssemblyRunner(pydantic.BaseModel, servo.logging.Mixin):
             self.logger.debug(f"Outstanding tasks: {devtools.pformat(tasks)}")
             await asyncio.gather(*tasks, return_exceptions=True)
 
+        servo.utilities.executor.shutdown_executor(wait=False)
+
         self.logger.info("Servo shutdown complete.")
         await asyncio.gather(self.logger.complete(), return_exceptions=True)
 
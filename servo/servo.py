@@ -7,7 +7,15 @@ import contextvars
 import enum
 import functools
 import json
-from typing import Any, Optional, Protocol, Sequence, Tuple, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import httpx
 import pydantic
@@ -198,12 +206,60 @@ class Servo(servo.connector.BaseConnector):
     """
 
     _running: bool = pydantic.PrivateAttr(False)
+    _shared_api_client: Optional[httpx.AsyncClient] = pydantic.PrivateAttr(None)
 
     async def dispatch_event(
-        self, *args, **kwargs
+        self, event: Union[servo.events.Event, str], *args, **kwargs
     ) -> Union[Optional[servo.events.EventResult], list[servo.events.EventResult]]:
+        self._apply_dispatch_settings(event, kwargs)
+        with self.current():
+            return await super().dispatch_event(event, *args, **kwargs)
+
+    async def dispatch_event_as_completed(
+        self, event: Union[servo.events.Event, str], *args, **kwargs
+    ) -> AsyncIterator[servo.events.EventResult]:
+        """Dispatch an event, yielding results in the order that connectors complete handling it.
+
+        See `servo.events.Mixin.dispatch_event` for the supported arguments.
+        """
+        self._apply_dispatch_settings(event, kwargs)
         with self.current():
-            return await super().dispatch_event(*args, **kwargs)
+            dispatch = super().dispatch_event(event, *args, **kwargs)
+
+        # NOTE: The servo is only made current while the dispatch runs so that it does not
+        # leak into the context of the caller while suspended at a yield
+        results = dispatch.as_completed()
+        try:
+            while True:
+                with self.current():
+                    try:
+                        result = await results.__anext__()
+                    except StopAsyncIteration:
+                        break
+                yield result
+        finally:
+            with self.current():
+                await results.aclose()
+
+    def _apply_dispatch_settings(
+        self, event: Union[servo.events.Event, str], kwargs: dict[str, Any]
+    ) -> None:
+        """Default the options of an event dispatch from the common settings."""
+        settings = self.config.settings
+        if not settings:
+            return
+
+        if settings.concurrent_before_handlers:
+            kwargs.setdefault("concurrent_before", True)
+
+        if settings.deadlines and kwargs.get("deadline") is None:
+            event_name = event if isinstance(event, str) else event.name
+            deadline = settings.deadlines.get(event_name)
+            control = kwargs.get("control")
+            if deadline is not None and event_name == Events.measure and control:
+                # The configured deadline is an allowance beyond the time the measurement is expected to take
+                deadline = deadline + control.warmup + control.duration + control.delay
+            kwargs["deadline"] = deadline
 
     def __init__(
         self, *args, connectors: list[servo.connector.BaseConnector], **kwargs
@@ -217,6 +273,9 @@ class Servo(servo.connector.BaseConnector):
         for connector in connectors + [self]:
             connector._global_config = self.config.settings
 
+            # Compile the event handler tables up front rather than on first dispatch
+            connector.event_handler_table()
+
     @pydantic.root_validator()
     def _initialize_name(cls, values: dict[str, Any]) -> dict[str, Any]:
         if values["name"] == "servo" and values.get("config"):
@@ -239,6 +298,19 @@ class Servo(servo.connector.BaseConnector):
         """Return True if the servo is running."""
         return self._running
 
+    @property
+    def shared_api_client(self) -> Optional[httpx.AsyncClient]:
+        """Return the long-lived API client shared by the servo or None if one is not in use."""
+        return self._shared_api_client
+
+    def use_api_client(self, client: Optional[httpx.AsyncClient]) -> None:
+        """Share a long-lived API client across requests made by the servo.
+
+        The caller retains ownership of the client and is responsible for closing it.
+        Passing None reverts to opening a client per request.
+        """
+        self._shared_api_client = client
+
     async def startup(self) -> None:
         """Notify all active connectors that the servo is starting up."""
         if self.is_running:
@@ -518,7 +590,7 @@ class Servo(servo.connector.BaseConnector):
             A list of check objects that describe the outcomes of the checks that were run.
         """
         try:
-            async with self.api_client() as client:
+            async with self.api_client_session() as client:
                 event_request = servo.api.Request(event=servo.api.Events.hello)
                 response = await client.post("servo", data=event_request.json())
                 success = response.status_code == httpx.codes.OK
@@ -0,0 +1,146 @@
+"""The `servo.spool` module provides durable local storage of results awaiting delivery
+to the Opsani API.
+
+Results are appended to a SQLite database before they are uploaded and removed once the
+API has acknowledged them. Results that could not be delivered, for example because the
+network was unavailable until backoff gave up or the servo was restarted, survive on disk
+and are replayed once connectivity is restored.
+"""
+from __future__ import annotations
+
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import orjson
+import pydantic.json
+
+import servo
+
+__all__ = (
+    "Spool",
+    "SpoolEntry",
+)
+
+
+class SpoolEntry(NamedTuple):
+    """A result stored in the spool awaiting acknowledgement."""
+
+    id: int
+    servo: str
+    event: str
+    param: Optional[Dict[str, Any]]
+    created_at: float
+
+
+class Spool:
+    """An append-only spool of results awaiting acknowledgement by the Opsani API.
+
+    Entries are keyed by the servo and command they belong to. The spool is bounded by
+    entry count and total size: the oldest entries are evicted when either bound is
+    exceeded.
+
+    Spools are safe to use from multiple threads so that the blocking database I/O can be
+    performed off the event loop.
+
+    Args:
+        path: The path of the SQLite database file backing the spool.
+        max_entries: The maximum number of entries to retain.
+        max_size: The maximum total size in bytes of the retained entries.
+    """
+
+    def __init__(
+        self, path: pathlib.Path, *, max_entries: int, max_size: int
+    ) -> None:  # noqa: D107
+        self.path = path
+        self.max_entries = max_entries
+        self.max_size = max_size
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # NOTE: Access to the connection is serialized by the lock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS spool ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "servo TEXT NOT NULL, "
+            "event TEXT NOT NULL, "
+            "param BLOB NOT NULL, "
+            "created_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS spool_servo ON spool (servo, id)"
+        )
+
+    def append(self, servo_: str, event: str, param: Optional[Dict[str, Any]]) -> int:
+        """Append a result to the spool, evicting the oldest entries if the spool is full.
+
+        Args:
+            servo_: The identifier of the servo that produced the result.
+            event: The event that the result is reported for.
+            param: The parameters of the event.
+
+        Returns:
+            The identifier of the spooled entry.
+        """
+        content = orjson.dumps(
+            param,
+            default=pydantic.json.pydantic_encoder,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO spool (servo, event, param, created_at) VALUES (?, ?, ?, ?)",
+                (servo_, getattr(event, "value", event), content, time.time()),
+            )
+            self._evict()
+
+        return cursor.lastrowid
+
+    def acknowledge(self, entry_id: int) -> None:
+        """Remove an entry that has been acknowledged by the Opsani API from the spool."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM spool WHERE id = ?", (entry_id,))
+
+    def pending(self, servo_: str) -> List[SpoolEntry]:
+        """Return the unacknowledged entries of a servo in the order they were appended."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, servo, event, param, created_at FROM spool WHERE servo = ? ORDER BY id",
+                (servo_,),
+            ).fetchall()
+
+        return [
+            SpoolEntry(id_, servo_name, event, orjson.loads(param), created_at)
+            for id_, servo_name, event, param, created_at in rows
+        ]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM spool").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database backing the spool."""
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self) -> None:
+        """Delete the oldest entries exceeding the entry count or total size bounds."""
+        retained_size, evicted = 0, []
+        for index, (id_, size) in enumerate(
+            self._connection.execute(
+                "SELECT id, length(param) FROM spool ORDER BY id DESC"
+            )
+        ):
+            retained_size += size
+            if index >= self.max_entries or retained_size > self.max_size:
+                evicted.append((id_,))
+
+        if evicted:
+            servo.logger.warning(
+                f"evicting {len(evicted)} unacknowledged entries from full spool at {self.path}"
+            )
+            self._connection.executemany("DELETE FROM spool WHERE id = ?", evicted)
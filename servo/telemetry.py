@@ -17,10 +17,13 @@ import pydantic
 
 import servo
 import servo.api
+import servo.monitoring
+import servo.tracing
 from servo.logging import InterceptHandler, logs_path
 
 ONE_MiB = 1048576
 DIAGNOSTICS_MAX_RETRIES = 20
+DIAGNOSTICS_MAX_SPANS = 256
 
 DIAGNOSTICS_CHECK_ENDPOINT = "assets/opsani.com/diagnostics-check"
 DIAGNOSTICS_OUTPUT_ENDPOINT = "assets/opsani.com/diagnostics-output"
@@ -39,6 +42,8 @@ class DiagnosticStates(str, enum.Enum):
 class Diagnostics(pydantic.BaseModel):
     configmap: Optional[dict[str, Any]]
     logs: Optional[dict[str, Any]]
+    loop: Optional[servo.monitoring.LoopMonitorSnapshot]
+    traces: Optional[dict[str, Any]]
 
 
 class Telemetry(pydantic.BaseModel):
@@ -74,16 +79,25 @@ class Telemetry(pydantic.BaseModel):
 class DiagnosticsHandler(servo.logging.Mixin, servo.api.Mixin):
 
     servo: servo.Servo = None
+    monitor: Optional[servo.monitoring.LoopMonitor] = None
     _running: bool = False
 
-    def __init__(self, servo: servo.Servo) -> None:  # noqa: D10
+    def __init__(
+        self, servo: servo.Servo, monitor: Optional[servo.monitoring.LoopMonitor] = None
+    ) -> None:  # noqa: D10
         self.servo = servo
+        self.monitor = monitor
 
     @property
     def api_client_options(self) -> dict[str, Any]:
         # Adopt the servo config for driving the API mixin
         return self.servo.api_client_options
 
+    @property
+    def shared_api_client(self) -> Optional[httpx.AsyncClient]:
+        # Reuse the connection pool of the servo
+        return self.servo.shared_api_client
+
     async def diagnostics_check(self) -> None:
 
         self._running = True
@@ -161,7 +175,14 @@ class DiagnosticsHandler(servo.logging.Mixin, servo.api.Mixin):
         config_dict = self.servo.config.json(exclude_unset=True, exclude_none=True)
         config_data = json.loads(config_dict)
 
-        return Diagnostics(configmap=config_data, logs=log_dict)
+        loop_data = self.monitor.snapshot() if self.monitor else None
+
+        # Most recent spans of event handling in Chrome trace format
+        trace_data = servo.tracing.tracer.export(limit=DIAGNOSTICS_MAX_SPANS)
+
+        return Diagnostics(
+            configmap=config_data, logs=log_dict, loop=loop_data, traces=trace_data
+        )
 
     @backoff.on_exception(
         backoff.expo,
@@ -180,7 +201,7 @@ class DiagnosticsHandler(servo.logging.Mixin, servo.api.Mixin):
         json: Optional[dict] = None,
     ) -> Union[DiagnosticStates, servo.api.Status]:
 
-        async with self.api_client() as client:
+        async with self.api_client_session() as client:
             self.logger.trace(f"{method} diagnostic request")
             try:
                 response = await client.request(
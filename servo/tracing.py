@@ -0,0 +1,318 @@
+"""The `servo.tracing` module records timing spans of event handling and connector I/O.
+
+Spans are recorded into a bounded ring buffer so that tracing can remain enabled in
+production. Spans opened while another span is active become its children, making
+Kubernetes API calls and Prometheus queries show up nested under the event handlers
+that issued them. The recorded spans can be exported as Chrome trace JSON (viewable in
+`chrome://tracing` or Perfetto) or as OTLP-compatible JSON.
+"""
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import contextvars
+import enum
+import functools
+import os
+import random
+import threading
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    TypeVar,
+)
+
+import servo.errors
+
+__all__ = (
+    "Span",
+    "TraceFormat",
+    "Tracer",
+    "configure_tracer",
+    "span",
+    "traced",
+    "tracer",
+)
+
+
+DEFAULT_MAX_SPANS = 4096
+
+T = TypeVar("T")
+
+
+class TraceFormat(str, enum.Enum):
+    chrome = "chrome"
+    otlp = "otlp"
+
+
+class Span(NamedTuple):
+    """A completed span of work."""
+
+    trace_id: int
+    span_id: int
+    parent_id: Optional[int]
+    name: str
+    category: str
+    start: float
+    """The wall clock time at which the span started, in seconds since the epoch."""
+
+    duration: float
+    """The duration of the span in seconds."""
+
+    outcome: str
+    """The outcome of the span: `ok`, `cancelled`, or `error`."""
+
+    attributes: Dict[str, Any]
+    lane: int
+    """An identifier of the task or thread that the span ran on."""
+
+
+# The trace and span identifiers of the active span
+_current_span_var = contextvars.ContextVar("servox.tracing.current_span", default=None)
+
+
+def _current_lane() -> int:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return id(task) % 2**31 if task else threading.get_ident() % 2**31
+
+
+def _outcome_of(error: Optional[BaseException]) -> str:
+    if error is None:
+        return "ok"
+    elif isinstance(error, (asyncio.CancelledError, servo.errors.EventCancelledError)):
+        return "cancelled"
+    else:
+        return "error"
+
+
+class Tracer:
+    """A recorder of spans into a ring buffer.
+
+    Args:
+        max_spans: The number of most recently completed spans to retain.
+    """
+
+    def __init__(self, max_spans: int = DEFAULT_MAX_SPANS) -> None:  # noqa: D107
+        self.enabled = True
+        self._spans: Deque[Span] = collections.deque(maxlen=max_spans)
+
+    @property
+    def max_spans(self) -> int:
+        """Return the number of most recently completed spans retained."""
+        return self._spans.maxlen
+
+    def configure(
+        self, *, enabled: bool = True, max_spans: int = DEFAULT_MAX_SPANS
+    ) -> None:
+        """Configure the tracer.
+
+        The most recently completed spans are kept when the ring buffer is resized.
+
+        Args:
+            enabled: Whether spans are recorded. When False, spans are not recorded.
+            max_spans: The number of most recently completed spans to retain.
+        """
+        self.enabled = enabled
+        if max_spans != self._spans.maxlen:
+            self._spans = collections.deque(self._spans, maxlen=max_spans)
+
+    @property
+    def spans(self) -> List[Span]:
+        """Return the retained spans, in order of completion."""
+        return list(self._spans)
+
+    def clear(self) -> None:
+        """Discard the retained spans."""
+        self._spans.clear()
+
+    @contextlib.contextmanager
+    def span(
+        self, name: str, category: str = "servo", **attributes: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """Record a span around the body of the context manager.
+
+        Yields the attributes of the span, which may be updated before the span completes.
+        """
+        if not self.enabled:
+            yield attributes
+            return
+
+        parent = _current_span_var.get()
+        trace_id = parent[0] if parent else random.getrandbits(128)
+        span_id = random.getrandbits(64)
+        token = _current_span_var.set((trace_id, span_id))
+        start, started_at = time.time(), time.perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            yield attributes
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _current_span_var.reset(token)
+            if error is not None and _outcome_of(error) == "error":
+                attributes.setdefault("error", f"{error.__class__.__name__}: {error}")
+            self._spans.append(
+                Span(
+                    trace_id=trace_id,
+                    span_id=span_id,
+                    parent_id=parent[1] if parent else None,
+                    name=name,
+                    category=category,
+                    start=start,
+                    duration=time.perf_counter() - started_at,
+                    outcome=_outcome_of(error),
+                    attributes=attributes,
+                    lane=_current_lane(),
+                )
+            )
+
+    def export(
+        self, format: TraceFormat = TraceFormat.chrome, *, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Export the retained spans in the given format.
+
+        Args:
+            format: The format to export.
+            limit: The maximum number of most recent spans to export. When None, all are exported.
+        """
+        spans = self.spans[-limit:] if limit else self.spans
+        if format == TraceFormat.chrome:
+            return _chrome_trace(spans)
+        elif format == TraceFormat.otlp:
+            return _otlp_trace(spans)
+        else:
+            raise ValueError(f"unsupported trace format '{format}'")
+
+
+def _chrome_trace(spans: List[Span]) -> Dict[str, Any]:
+    pid = os.getpid()
+    return {
+        "traceEvents": [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start * 1e6,
+                "dur": span.duration * 1e6,
+                "pid": pid,
+                "tid": span.lane,
+                "args": {**span.attributes, "outcome": span.outcome},
+            }
+            for span in spans
+        ],
+        "displayTimeUnit": "ms",
+    }
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    elif isinstance(value, int):
+        return {"intValue": str(value)}
+    elif isinstance(value, float):
+        return {"doubleValue": value}
+    else:
+        return {"stringValue": str(value)}
+
+
+def _otlp_trace(spans: List[Span]) -> Dict[str, Any]:
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": "servox"}},
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": __name__},
+                        "spans": [
+                            {
+                                "traceId": f"{span.trace_id:032x}",
+                                "spanId": f"{span.span_id:016x}",
+                                "parentSpanId": f"{span.parent_id:016x}"
+                                if span.parent_id
+                                else "",
+                                "name": span.name,
+                                "kind": 1,  # SPAN_KIND_INTERNAL
+                                "startTimeUnixNano": str(int(span.start * 1e9)),
+                                "endTimeUnixNano": str(
+                                    int((span.start + span.duration) * 1e9)
+                                ),
+                                "attributes": [
+                                    {
+                                        "key": "category",
+                                        "value": _otlp_value(span.category),
+                                    },
+                                    {
+                                        "key": "outcome",
+                                        "value": _otlp_value(span.outcome),
+                                    },
+                                    *(
+                                        {"key": key, "value": _otlp_value(value)}
+                                        for key, value in span.attributes.items()
+                                    ),
+                                ],
+                                # STATUS_CODE_OK = 1, STATUS_CODE_ERROR = 2
+                                "status": {"code": 2 if span.outcome == "error" else 1},
+                            }
+                            for span in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+tracer = Tracer()
+"""The tracer shared by the servo."""
+
+
+def configure_tracer(
+    *, enabled: bool = True, max_spans: int = DEFAULT_MAX_SPANS
+) -> None:
+    """Configure the shared tracer. See `Tracer.configure`."""
+    tracer.configure(enabled=enabled, max_spans=max_spans)
+
+
+def span(name: str, category: str = "servo", **attributes: Any):
+    """Record a span with the shared tracer. See `Tracer.span`."""
+    return tracer.span(name, category, **attributes)
+
+
+def traced(
+    category: str, name: Optional[str] = None
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Decorate a coroutine function to record a span with the shared tracer around each call.
+
+    Args:
+        category: The category of the spans.
+        name: The name of the spans. Defaults to the qualified name of the function.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs) -> T:
+            with tracer.span(span_name, category):
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -250,16 +250,23 @@ class Measurement(BaseModel):
 
         for reading in self.readings:
             if isinstance(reading, TimeSeries):
-                data = {
-                    "unit": reading.metric.unit.value,
-                    "values": [{"id": str(int(time.time())), "data": []}],
-                }
-
                 # Fill the values with arrays of [timestamp, value] sampled from the reports
-                for date, value in reading.data_points:
-                    data["values"][0]["data"].append([int(date.timestamp()), value])
+                values = {
+                    "id": reading.id or str(int(time.time())),
+                    "data": [
+                        [int(data_point.time.timestamp()), data_point.value]
+                        for data_point in reading.data_points
+                    ],
+                }
 
-                readings[reading.metric.name] = data
+                # Each series of a metric is reported as a set of values of the metric
+                if data := readings.get(reading.metric.name):
+                    data["values"].append(values)
+                else:
+                    readings[reading.metric.name] = {
+                        "unit": reading.metric.unit.value,
+                        "values": [values],
+                    }
             elif isinstance(reading, DataPoint):
                 data = {
                     "unit": reading.metric.unit.value,
@@ -710,6 +710,9 @@ class NormalizationPolicy(str, enum.Enum):
             time series data. Data points measured at times that do not have
             data points across all time series in the measurement are dropped.
         fill: Time series in the measurement are brought into alignment by
+            filling in data points at times measured by any time series in the
+            measurement, interpolating between the neighbouring data points of
+            each series and carrying the nearest value beyond its ends.
     """
 
     passthrough = "passthrough"
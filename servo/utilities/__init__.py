@@ -1,4 +1,5 @@
 from .duration_str import *
+from .executor import *
 from .hashing import *
 from .key_paths import *
 from .pydantic import *
@@ -0,0 +1,91 @@
+"""The `servo.utilities.executor` module provides a shared thread pool for offloading CPU
+heavy work such as parsing, validation, serialization, and hashing of large payloads from
+the event loop.
+
+Offloaded work runs in a copy of the current context so that context variables such as
+the current servo and connector remain available for logging.
+"""
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+from typing import Any, Callable, Optional, TypeVar
+
+__all__ = (
+    "DEFAULT_OFFLOAD_THRESHOLD",
+    "configure_executor",
+    "offload",
+    "shutdown_executor",
+)
+
+
+DEFAULT_OFFLOAD_THRESHOLD = 2**16  # 64 KiB
+
+T = TypeVar("T")
+
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_max_workers: Optional[int] = None
+_threshold: int = DEFAULT_OFFLOAD_THRESHOLD
+
+
+def configure_executor(
+    *, max_workers: Optional[int] = None, threshold: Optional[int] = None
+) -> None:
+    """Configure the shared executor.
+
+    A running executor is shut down without waiting and replaced when the number of
+    workers changes.
+
+    Args:
+        max_workers: The maximum number of worker threads. When None, the default of
+            `concurrent.futures.ThreadPoolExecutor` is used.
+        threshold: The payload size in bytes at or above which work is offloaded. When None,
+            `DEFAULT_OFFLOAD_THRESHOLD` is used.
+    """
+    global _max_workers, _threshold
+    _threshold = DEFAULT_OFFLOAD_THRESHOLD if threshold is None else threshold
+    if max_workers != _max_workers:
+        _max_workers = max_workers
+        shutdown_executor(wait=False)
+
+
+def shutdown_executor(*, wait: bool = True) -> None:
+    """Shut down the shared executor. It is recreated on the next offloaded call."""
+    global _executor
+    executor, _executor = _executor, None
+    if executor:
+        executor.shutdown(wait=wait)
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_max_workers, thread_name_prefix="servo-offload"
+        )
+    return _executor
+
+
+async def offload(
+    fn: Callable[..., T], *args: Any, size: Optional[int] = None, **kwargs: Any
+) -> T:
+    """Call a function in the shared executor, or inline when its payload is small.
+
+    Args:
+        fn: The function to call.
+        *args: Positional arguments for the function.
+        size: The approximate size in bytes of the payload processed by the function. Calls
+            with a size below the configured threshold run inline on the event loop. When None,
+            the call is always offloaded.
+        **kwargs: Keyword arguments for the function.
+
+    Returns:
+        The value returned by the function.
+    """
+    if size is not None and size < _threshold:
+        return fn(*args, **kwargs)
+
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        _get_executor(), functools.partial(context.run, fn, *args, **kwargs)
+    )
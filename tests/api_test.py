@@ -1,4 +1,9 @@
+import gzip
+import json
+
+import httpx
 import pytest
+import respx
 
 import servo
 import servo.api
@@ -152,3 +157,78 @@ def test_parse_command_response_including_units_control(payload, validator) -> N
 
     obj = parse_obj_as(Union[CommandResponse, Status], payload)
     validator(obj)
+
+
+class TestEncodeRequest:
+    def test_matches_request_model_json(self) -> None:
+        param = servo.api.Status.ok(
+            "done", descriptor={"application": {"components": {}}}
+        ).dict()
+        content, headers = servo.api.encode_request(servo.api.Events.describe, param)
+        assert headers == {}
+        assert json.loads(content) == json.loads(
+            servo.api.Request(event=servo.api.Events.describe, param=param).json()
+        )
+
+    def test_small_bodies_are_not_compressed(self) -> None:
+        content, headers = servo.api.encode_request(
+            servo.api.Events.hello, {"agent": "servox"}, compress=True
+        )
+        assert headers == {}
+        assert json.loads(content)["event"] == "HELLO"
+
+    def test_large_bodies_are_compressed(self) -> None:
+        param = {"metrics": {"throughput": {"data": [[i, 1.0] for i in range(5000)]}}}
+        content, headers = servo.api.encode_request(
+            servo.api.Events.measure, param, compress=True
+        )
+        assert headers == {"Content-Encoding": "gzip"}
+        assert json.loads(gzip.decompress(content)) == {
+            "event": "MEASUREMENT",
+            "param": param,
+        }
+
+
+class TestPostEvent:
+    @pytest.fixture
+    def servo_(self, optimizer: servo.Optimizer) -> servo.Servo:
+        return servo.Servo(
+            config=servo.BaseServoConfiguration(
+                optimizer=optimizer,
+                settings=servo.CommonConfiguration(compression=True),
+            ),
+            connectors=[],
+        )
+
+    @pytest.fixture
+    def param(self) -> dict:
+        return {"metrics": {"throughput": {"data": [[i, 1.0] for i in range(5000)]}}}
+
+    @respx.mock
+    async def test_posts_compressed_body(self, servo_: servo.Servo, param) -> None:
+        request = respx.post(f"{servo_.optimizer.url}servo").mock(
+            return_value=httpx.Response(200, json={"status": "ok"})
+        )
+        status = await servo_._post_event(servo.api.Events.measure, param)
+        assert status.status == "ok"
+        assert request.calls.last.request.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(request.calls.last.request.content)) == {
+            "event": "MEASUREMENT",
+            "param": param,
+        }
+
+    @respx.mock
+    async def test_retries_uncompressed_when_unsupported(
+        self, servo_: servo.Servo, param
+    ) -> None:
+        request = respx.post(f"{servo_.optimizer.url}servo").mock(
+            side_effect=[
+                httpx.Response(415),
+                httpx.Response(200, json={"status": "ok"}),
+            ]
+        )
+        status = await servo_._post_event(servo.api.Events.measure, param)
+        assert status.status == "ok"
+        assert request.call_count == 2
+        assert "Content-Encoding" not in request.calls.last.request.headers
+        assert json.loads(request.calls.last.request.content)["param"] == param
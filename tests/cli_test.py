@@ -1314,6 +1314,29 @@ def test_describe(
     assert re.search("adjust\\s+main.cpu=3", result.stdout)
 
 
+def test_trace(
+    cli_runner: CliRunner, servo_cli: Typer, optimizer_env: None, stub_servo_yaml: Path
+) -> None:
+    result = cli_runner.invoke(servo_cli, "trace describe", catch_exceptions=False)
+    assert (
+        result.exit_code == 0
+    ), f"failed with non-zero exit code (stdout={result.stdout}, stderr={result.stderr})"
+    assert "traceEvents" in json.loads(result.stdout)
+
+
+@pytest.mark.parametrize("event", ["measure", "adjust", "promote"])
+def test_trace_rejects_operational_events(
+    cli_runner: CliRunner,
+    servo_cli: Typer,
+    optimizer_env: None,
+    stub_servo_yaml: Path,
+    event: str,
+) -> None:
+    result = cli_runner.invoke(servo_cli, f"trace {event}")
+    assert result.exit_code == 2
+    assert "Invalid value" in result.stderr
+
+
 def test_describe_connector(
     cli_runner: CliRunner, servo_cli: Typer, optimizer_env: None, stub_servo_yaml: Path
 ) -> None:
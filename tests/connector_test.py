@@ -511,6 +511,141 @@ class TestVegetaConnector:
     async def test_vegeta_measure(self, vegeta_connector: VegetaConnector) -> None:
         await vegeta_connector.measure()
 
+    def test_fast_fail_input_filters_conditions(
+        self, vegeta_connector: VegetaConnector
+    ) -> None:
+        control = servox.Control(
+            userdata=servox.UserData(
+                slo=servox.SloInput(
+                    conditions=[
+                        servox.SloCondition(metric="latency_99th", threshold=100),
+                        servox.SloCondition(metric="main_p50_latency", threshold=100),
+                    ]
+                )
+            )
+        )
+        slo_input = vegeta_connector._fast_fail_input(control)
+        assert list(map(lambda c: c.metric, slo_input.conditions)) == ["latency_99th"]
+
+        vegeta_connector.config.fast_fail.disabled = 1
+        assert vegeta_connector._fast_fail_input(control) is None
+
+
+async def test_readings_from_vegeta_message() -> None:
+    report = servox.connectors.vegeta.VegetaReport(
+        latencies={
+            "total": 100000000,
+            "mean": 2000000,
+            "50th": 1000000,
+            "90th": 3000000,
+            "95th": 4000000,
+            "99th": 5000000,
+            "max": 6000000,
+            "min": 500000,
+        },
+        bytes_in={"total": 0, "mean": 0.0},
+        bytes_out={"total": 0, "mean": 0.0},
+        earliest="2020-01-01T00:00:00",
+        latest="2020-01-01T00:00:15",
+        end="2020-01-01T00:00:15",
+        duration=15,
+        wait=0,
+        requests=750,
+        rate=50.0,
+        throughput=50.0,
+        success=0.99,
+        status_codes={"200": 742, "500": 8},
+        errors=[],
+    )
+    readings = await servox.connectors.vegeta._readings_from_vegeta_message(
+        servox.Message(json=report)
+    )
+    assert set(readings.keys()) == set(
+        map(lambda m: m.name, servox.connectors.vegeta.METRICS)
+    )
+    assert readings["throughput"][0].value == 3000.0
+    assert readings["latency_99th"][0].value == 5.0
+    assert readings["latency_99th"][0].time.isoformat() == "2020-01-01T00:00:15"
+    assert round(readings["error_rate"][0].value, 2) == 1.0
+
+
+def _cumulative_vegeta_report(
+    seconds: int, requests: int, successes: int, total_latency_ms: int
+) -> servox.connectors.vegeta.VegetaReport:
+    mean = total_latency_ms * 1000000 // requests
+    return servox.connectors.vegeta.VegetaReport(
+        latencies={
+            "total": total_latency_ms * 1000000,
+            "mean": mean,
+            "50th": mean,
+            "90th": mean,
+            "95th": mean,
+            "99th": mean,
+            "max": mean,
+            "min": mean,
+        },
+        bytes_in={"total": 0, "mean": 0.0},
+        bytes_out={"total": 0, "mean": 0.0},
+        earliest="2020-01-01T00:00:00",
+        latest=f"2020-01-01T00:00:{seconds:02d}",
+        end=f"2020-01-01T00:00:{seconds:02d}",
+        duration=seconds,
+        wait=0,
+        requests=requests,
+        rate=requests / seconds,
+        throughput=successes / seconds,
+        success=successes / requests,
+        status_codes={"200": successes, "500": requests - successes},
+        errors=[],
+    )
+
+
+async def test_interval_readings_are_differenced_from_cumulative_reports() -> None:
+    decoder = servox.connectors.vegeta._interval_readings_decoder()
+    first = await decoder(
+        servox.Message(json=_cumulative_vegeta_report(10, 100, 100, 1000))
+    )
+    assert first["throughput"][0].value == 600.0
+    assert first["error_rate"][0].value == 0.0
+    assert first["latency_mean"][0].value == 10.0
+    assert set(first.keys()) == set(servox.connectors.vegeta.INTERVAL_METRICS)
+
+    # The second interval serves 300 requests at 20ms with 30 errors
+    second = await decoder(
+        servox.Message(json=_cumulative_vegeta_report(20, 400, 370, 7000))
+    )
+    assert second["throughput"][0].value == pytest.approx(1620.0)
+    assert second["error_rate"][0].value == pytest.approx(10.0)
+    assert second["latency_mean"][0].value == pytest.approx(20.0)
+    assert second["throughput"][0].time.isoformat() == "2020-01-01T00:00:20"
+
+    stale = await decoder(
+        servox.Message(json=_cumulative_vegeta_report(20, 400, 370, 7000))
+    )
+    assert stale == {}
+
+
+async def test_alternating_load_does_not_converge_on_cumulative_reports() -> None:
+    observer = servox.convergence.ConvergenceObserver(
+        config=servox.configuration.ConvergenceConfiguration(
+            enabled=True, metrics=["throughput"], stable_for="0s"
+        )
+    )
+    decoder = servox.connectors.vegeta._interval_readings_decoder()
+    requests, converged = 0, False
+    for interval in range(1, 31):
+        requests += 40 if interval % 2 else 60
+        readings = await decoder(
+            servox.Message(
+                json=_cumulative_vegeta_report(interval, requests, requests, requests)
+            )
+        )
+        converged = observer.observe_readings(
+            readings, received_at=datetime.datetime.now()
+        )
+
+    assert not converged
+
 
 def test_init_vegeta_connector() -> None:
     config = VegetaConfiguration(rate="50/1s", target="GET http://localhost:8080")
@@ -821,6 +956,18 @@ def test_vegeta_cli_schema_json(
                     "72h3m0.5s",
                 ],
             },
+            "fast_fail": {
+                "title": "Fast Fail",
+                "description": "Configuration of fast fail behavior. SLOs are evaluated against each Vegeta report as it is published.",
+                "env_names": ["VEGETA_FAST_FAIL"],
+                "allOf": [{"$ref": "#/definitions/FastFailConfiguration"}],
+            },
+            "convergence": {
+                "title": "Convergence",
+                "description": "Configuration of early completion behavior. Load generation is stopped once the metrics of the published Vegeta reports have converged.",
+                "env_names": ["VEGETA_CONVERGENCE"],
+                "allOf": [{"$ref": "#/definitions/ConvergenceConfiguration"}],
+            },
         },
         "required": ["rate"],
         "additionalProperties": False,
@@ -834,6 +981,126 @@ def test_vegeta_cli_schema_json(
                 ],
                 "type": "string",
             },
+            "FastFailMode": {
+                "title": "FastFailMode",
+                "description": "An enumeration of strategies for gathering SLO metrics during fast fail observation.",
+                "enum": ["poll", "push"],
+                "type": "string",
+            },
+            "FastFailConfiguration": {
+                "title": "FastFailConfiguration",
+                "description": "Configuration providing support for fast fail behavior which returns early\nfrom long running connector operations when SLO violations are observed",
+                "type": "object",
+                "properties": {
+                    "disabled": {
+                        "title": "Disabled",
+                        "default": 0,
+                        "env_names": ["disabled"],
+                        "minimum": 0,
+                        "maximum": 1,
+                        "multipleOf": 1,
+                        "type": "integer",
+                    },
+                    "mode": {
+                        "default": "poll",
+                        "env_names": ["mode"],
+                        "allOf": [{"$ref": "#/definitions/FastFailMode"}],
+                    },
+                    "period": {
+                        "title": "Period",
+                        "default": "60s",
+                        "env_names": ["period"],
+                        "type": "string",
+                        "format": "duration",
+                        "pattern": "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)?([\\d\\.]+us)?([\\d\\.]+ns)?",
+                        "examples": ["300ms", "5m", "2h45m", "72h3m0.5s"],
+                    },
+                    "span": {
+                        "title": "Span",
+                        "env_names": ["span"],
+                        "type": "string",
+                        "format": "duration",
+                        "pattern": "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)?([\\d\\.]+us)?([\\d\\.]+ns)?",
+                        "examples": ["300ms", "5m", "2h45m", "72h3m0.5s"],
+                    },
+                    "skip": {
+                        "title": "Skip",
+                        "default": 0,
+                        "env_names": ["skip"],
+                        "type": "string",
+                        "format": "duration",
+                        "pattern": "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)?([\\d\\.]+us)?([\\d\\.]+ns)?",
+                        "examples": ["300ms", "5m", "2h45m", "72h3m0.5s"],
+                    },
+                    "treat_zero_as_missing": {
+                        "title": "Treat Zero As Missing",
+                        "default": False,
+                        "env_names": ["treat_zero_as_missing"],
+                        "type": "boolean",
+                    },
+                },
+                "additionalProperties": False,
+            },
+            "ConvergenceConfiguration": {
+                "title": "ConvergenceConfiguration",
+                "description": "Configuration providing support for completing measurements early once the\nmeasured metrics have converged to a steady state",
+                "type": "object",
+                "properties": {
+                    "enabled": {
+                        "title": "Enabled",
+                        "default": False,
+                        "env_names": ["enabled"],
+                        "type": "boolean",
+                    },
+                    "metrics": {
+                        "title": "Metrics",
+                        "env_names": ["metrics"],
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                    "confidence": {
+                        "title": "Confidence",
+                        "default": 0.95,
+                        "env_names": ["confidence"],
+                        "exclusiveMinimum": 0,
+                        "exclusiveMaximum": 1,
+                        "type": "number",
+                    },
+                    "relative_width": {
+                        "title": "Relative Width",
+                        "default": 0.05,
+                        "env_names": ["relative_width"],
+                        "exclusiveMinimum": 0,
+                        "type": "number",
+                    },
+                    "min_samples": {
+                        "title": "Min Samples",
+                        "default": 10,
+                        "env_names": ["min_samples"],
+                        "minimum": 2,
+                        "type": "integer",
+                    },
+                    "stable_for": {
+                        "title": "Stable For",
+                        "default": "1m",
+                        "env_names": ["stable_for"],
+                        "type": "string",
+                        "format": "duration",
+                        "pattern": "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)?([\\d\\.]+us)?([\\d\\.]+ns)?",
+                        "examples": ["300ms", "5m", "2h45m", "72h3m0.5s"],
+                    },
+                    "period": {
+                        "title": "Period",
+                        "default": "15s",
+                        "env_names": ["period"],
+                        "type": "string",
+                        "format": "duration",
+                        "pattern": "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)?([\\d\\.]+us)?([\\d\\.]+ns)?",
+                        "examples": ["300ms", "5m", "2h45m", "72h3m0.5s"],
+                    },
+                },
+                "additionalProperties": False,
+            },
         },
     }
 
@@ -1011,6 +1278,22 @@ def test_vegeta_cli_generate_with_defaults(
             "max_body": -1,
             "rate": "50/1s",
             "reporting_interval": "15s",
+            "fast_fail": {
+                "disabled": 0,
+                "mode": "poll",
+                "period": "1m",
+                "span": "1m",
+                "skip": "0",
+                "treat_zero_as_missing": False,
+            },
+            "convergence": {
+                "enabled": False,
+                "confidence": 0.95,
+                "relative_width": 0.05,
+                "min_samples": 10,
+                "stable_for": "1m",
+                "period": "15s",
+            },
             "target": "GET https://example.com/",
             "workers": 10,
         },
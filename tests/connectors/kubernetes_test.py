@@ -429,7 +429,24 @@ class TestKubernetesConfiguration:
 
 
 class TestKubernetesConnector:
-    pass
+    @pytest.mark.parametrize("error", [None, AdjustmentRejectedError("boom")])
+    async def test_adjust_notifies_description_changed(
+        self, config: KubernetesConfiguration, mocker, error: Optional[Exception]
+    ) -> None:
+        connector = KubernetesConnector(config=config)
+        mocker.patch.object(
+            KubernetesConnector,
+            "_adjust",
+            side_effect=error,
+            return_value=Description(),
+        )
+        notify = mocker.patch.object(KubernetesConnector, "notify_description_changed")
+        if error:
+            with pytest.raises(AdjustmentRejectedError):
+                await connector.adjust([])
+        else:
+            await connector.adjust([])
+        notify.assert_awaited_once_with("adjusted")
 
 
 class TestContainerConfiguration:
@@ -576,6 +593,16 @@ class TestCanaryOptimization:
         assert optimization.tuning_name == "tuning"
 
 
+def test_estimated_size_of_object_scales_with_containers() -> None:
+    estimate = servo.connectors.kubernetes._estimated_size_of_object
+    container = {"name": "main", "image": "opsani/fiber-http:latest"}
+    assert estimate({"spec": {"workloadRef": {"name": "fiber-http"}}}) == 4096
+    assert (
+        estimate({"spec": {"template": {"spec": {"containers": [container] * 3}}}})
+        == 4 * 4096
+    )
+
+
 def test_compare_strategy() -> None:
     config = CanaryOptimizationStrategyConfiguration(
         type=OptimizationStrategy.canary, alias="tuning"
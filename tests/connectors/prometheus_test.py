@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import devtools
 import json
@@ -62,6 +63,31 @@ class TestPrometheusMetric:
                 "type": "type_error.none.not_allowed",
             } in error.errors()
 
+    def test_build_summary_query(self):
+        metric = PrometheusMetric(
+            name="throughput",
+            unit=Unit.requests_per_minute,
+            query="sum(rate(http_requests_total[1m]))",
+            step="30s",
+            summary="avg",
+        )
+        assert (
+            metric.build_summary_query(Duration("5m"))
+            == "avg_over_time((sum(rate(http_requests_total[1m])))[300s:30s])"
+        )
+        assert (
+            metric.build_summary_query(
+                Duration("5m"), servo.connectors.prometheus.SummaryFunction.max
+            )
+            == "max_over_time((sum(rate(http_requests_total[1m])))[300s:30s])"
+        )
+
+        metric.absent = servo.connectors.prometheus.AbsentMetricPolicy.zero
+        assert (
+            metric.build_summary_query(Duration("5m"))
+            == "avg_over_time((sum(rate(http_requests_total[1m])))[300s:30s]) or on() vector(0)"
+        )
+
     # NOTE: Floating point values may come back as strings?
     def test_conversion_of_floats_from_strings(self):
         pass
@@ -125,6 +151,8 @@ class TestPrometheusConfiguration:
         assert config.yaml() == (
             "description: Update the base_url and metrics to match your Prometheus configuration\n"
             "base_url: http://prometheus:9090\n"
+            "endpoints: []\n"
+            "hedge_percentile: 95.0\n"
             "streaming_interval: null\n"
             "metrics:\n"
             "- name: throughput\n"
@@ -132,18 +160,30 @@ class TestPrometheusConfiguration:
             "  query: rate(http_requests_total[5m])\n"
             "  step: 1m\n"
             "  absent: ignore\n"
+            "  summary: null\n"
             "- name: error_rate\n"
             "  unit: '%'\n"
             "  query: rate(errors[5m])\n"
             "  step: 1m\n"
             "  absent: ignore\n"
+            "  summary: null\n"
             "targets: null\n"
+            "summary: null\n"
             "fast_fail:\n"
             "  disabled: 0\n"
+            "  mode: poll\n"
             "  period: 1m\n"
             "  span: 1m\n"
             "  skip: '0'\n"
             "  treat_zero_as_missing: false\n"
+            "convergence:\n"
+            "  enabled: false\n"
+            "  metrics: null\n"
+            "  confidence: 0.95\n"
+            "  relative_width: 0.05\n"
+            "  min_samples: 10\n"
+            "  stable_for: 1m\n"
+            "  period: 15s\n"
         )
 
     def test_generate_override_metrics(self):
@@ -166,6 +206,75 @@ class TestPrometheusConfiguration:
             ],
         )
 
+    def test_summary_must_apply_to_all_metrics(self):
+        metrics = [
+            PrometheusMetric(
+                "throughput", Unit.requests_per_minute, query="a", summary="avg"
+            ),
+            PrometheusMetric("error_rate", Unit.percentage, query="b"),
+        ]
+        with pytest.raises(pydantic.ValidationError) as error:
+            PrometheusConfiguration(metrics=metrics)
+        assert "summary must be configured for all metrics or none" in str(error.value)
+
+        config = PrometheusConfiguration(metrics=metrics, summary="max")
+        assert config.summary == servo.connectors.prometheus.SummaryFunction.max
+
+    def test_push_fast_fail_requires_streaming_interval(self):
+        with pytest.raises(pydantic.ValidationError) as error:
+            PrometheusConfiguration(metrics=[], fast_fail={"mode": "push"})
+        assert (
+            "fast_fail mode 'push' requires a streaming_interval to be configured"
+            in str(error.value)
+        )
+
+        config = PrometheusConfiguration(
+            metrics=[], streaming_interval="5s", fast_fail={"mode": "push"}
+        )
+        assert config.fast_fail.mode == servo.configuration.FastFailMode.push
+
+
+async def test_readings_from_stream_message() -> None:
+    metric = PrometheusMetric("throughput", servo.Unit.requests_per_second, query="")
+    message = servo.pubsub.Message(
+        json=[
+            ("throughput", "2020-01-01T00:00:00", 31337.0),
+            ("unknown", "2020-01-01T00:00:00", 1.0),
+        ]
+    )
+    readings = await servo.connectors.prometheus._readings_from_stream_message(
+        [metric], message
+    )
+    assert readings == {
+        "throughput": [
+            servo.DataPoint(metric, datetime.datetime(2020, 1, 1), 31337.0),
+        ]
+    }
+
+
+async def test_watch_progress_cancels_watchers_when_progress_finishes() -> None:
+    progress = servo.EventProgress(timeout="10s")
+    auxiliary_watcher = asyncio.Event()
+
+    async def _complete_progress(progress: servo.EventProgress) -> None:
+        progress.complete()
+
+    async def _watch_forever() -> None:
+        try:
+            await asyncio.sleep(60)
+        finally:
+            auxiliary_watcher.set()
+
+    await asyncio.wait_for(
+        servo.connectors.prometheus._watch_progress(
+            progress.watch(_complete_progress, every=servo.Duration("10ms")),
+            _watch_forever(),
+        ),
+        timeout=1,
+    )
+    assert progress.completed
+    assert auxiliary_watcher.is_set()
+
 
 class TestPrometheusRequest:
     @freezegun.freeze_time("2020-01-01")
@@ -1003,6 +1112,86 @@ class TestConnector:
         measurement = await connector.measure(control=servo.Control(duration="0.0001s"))
         assert measurement is not None
 
+    @respx.mock
+    async def test_measure_summary(self, connector) -> None:
+        connector.config.summary = servo.connectors.prometheus.SummaryFunction.avg
+        request = respx.mock.get(re.compile(r"/api/v1/query\?.+"), name="query").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "status": "success",
+                    "data": {
+                        "resultType": "vector",
+                        "result": [
+                            {
+                                "metric": {"instance": "localhost:9090"},
+                                "value": [1577836800.0, "31337"],
+                            }
+                        ],
+                    },
+                },
+            )
+        )
+        measurement = await connector.measure(control=servo.Control(duration="0.0001s"))
+        assert request.called
+        params = httpx.QueryParams(request.calls.last.request.url.query)
+        assert params["query"].startswith("avg_over_time((throughput)[")
+        assert "time" in params
+        assert len(measurement) == 1
+        assert isinstance(measurement[0], servo.TimeSeries)
+        assert measurement[0].id == "{instance=localhost:9090,job=None}"
+        assert [data_point.value for data_point in measurement[0]] == [31337.0]
+
+    @respx.mock
+    async def test_measure_summary_of_several_series(self, connector) -> None:
+        connector.config.summary = servo.connectors.prometheus.SummaryFunction.avg
+        connector.config.metrics.append(
+            PrometheusMetric("latency", servo.Unit.milliseconds, query="latency")
+        )
+
+        def _vector(request: httpx.Request) -> httpx.Response:
+            params = httpx.QueryParams(request.url.query)
+            if "throughput" in params["query"]:
+                values = {"a:9090": "31337", "b:9090": "1234"}
+            else:
+                values = {"a:9090": "5"}
+            return httpx.Response(
+                200,
+                json={
+                    "status": "success",
+                    "data": {
+                        "resultType": "vector",
+                        "result": [
+                            {
+                                "metric": {"instance": instance, "job": "app"},
+                                "value": [1577836800.0, value],
+                            }
+                            for instance, value in values.items()
+                        ],
+                    },
+                },
+            )
+
+        respx.mock.get(re.compile(r"/api/v1/query\?.+"), name="query").mock(
+            side_effect=_vector
+        )
+        measurement = await connector.measure(control=servo.Control(duration="0.0001s"))
+        assert [(reading.metric.name, reading.id) for reading in measurement] == [
+            ("test", "{instance=a:9090,job=app}"),
+            ("test", "{instance=b:9090,job=app}"),
+            ("latency", "{instance=a:9090,job=app}"),
+        ]
+
+        # Every series is reported
+        metrics = measurement.__opsani_repr__()["metrics"]
+        assert metrics["test"]["values"] == [
+            {"id": "{instance=a:9090,job=app}", "data": [[1577836800, 31337.0]]},
+            {"id": "{instance=b:9090,job=app}", "data": [[1577836800, 1234.0]]},
+        ]
+        assert metrics["latency"]["values"] == [
+            {"id": "{instance=a:9090,job=app}", "data": [[1577836800, 5.0]]}
+        ]
+
     async def test_metrics(self, connector) -> None:
         metrics = connector.metrics()
         assert metrics == [
@@ -1705,6 +1894,149 @@ class TestClient:
         client = Client(base_url="http://prometheus.default.svc.cluster.local:9090")
         assert client.url == "http://prometheus.default.svc.cluster.local:9090/api/v1"
 
+    def test_endpoints_are_deduplicated(self):
+        client = Client(
+            base_url="http://prometheus-0:9090",
+            endpoints=["http://prometheus-0:9090/", "http://prometheus-1:9090"],
+        )
+        assert list(map(lambda e: e.url, client._endpoints)) == [
+            "http://prometheus-0:9090/api/v1",
+            "http://prometheus-1:9090/api/v1",
+        ]
+
+    def test_endpoint_latency_percentile(self):
+        endpoint = servo.connectors.prometheus._Endpoint("http://prometheus:9090")
+        endpoint.latencies.extend([0.1] * 5)
+        assert endpoint.latency_percentile(95) is None
+
+        endpoint.latencies.extend([0.1] * 14 + [1.0])
+        assert endpoint.latency_percentile(50) == 0.1
+        assert endpoint.latency_percentile(95) == 1.0
+
+    def test_endpoint_latency_percentile_accounts_for_cancelled_requests(self):
+        endpoint = servo.connectors.prometheus._Endpoint("http://prometheus:9090")
+        endpoint.latencies.extend([0.1] * 10)
+        assert endpoint.latency_percentile(90) == 0.1
+
+        # Requests cancelled after 0.5s took longer than every completed request
+        endpoint.cancelled_latencies.extend([0.5] * 10)
+        assert endpoint.latency_percentile(50) == 0.5
+        assert endpoint.latency_percentile(90) == 0.5
+
+        endpoint.latencies.extend([1.0] * 10)
+        assert endpoint.latency_percentile(25) == 0.1
+        assert endpoint.latency_percentile(90) == 1.0
+
+    async def test_hedged_out_requests_record_their_latency(self, mocker):
+        async def _send(self, request, **kwargs):
+            if request.url.host == "prometheus-0":
+                await asyncio.sleep(5)
+            return httpx.Response(200, json=targets_response_(), request=request)
+
+        mocker.patch.object(httpx.AsyncClient, "send", new=_send)
+        client = Client(
+            base_url="http://prometheus-0:9090",
+            endpoints=["http://prometheus-1:9090"],
+            hedge_percentile=95,
+        )
+        slow, fast = client._endpoints
+        slow.latencies.extend([0.01] * 10)
+        client._rotation = len(client._endpoints) - 1
+
+        await asyncio.wait_for(client.list_targets(), timeout=1)
+        assert len(fast.latencies) == 1
+        assert len(slow.latencies) == 10
+        assert len(slow.cancelled_latencies) == 1
+        assert slow.cancelled_latencies[0] >= 0.01
+
+    @respx.mock
+    async def test_requests_are_distributed_across_endpoints(self):
+        routes = [
+            respx.get(f"http://prometheus-{i}:9090/api/v1/targets").mock(
+                return_value=httpx.Response(200, json=targets_response_())
+            )
+            for i in range(2)
+        ]
+        client = Client(
+            base_url="http://prometheus-0:9090", endpoints=["http://prometheus-1:9090"]
+        )
+        await client.list_targets()
+        await client.list_targets()
+        assert routes[0].call_count == 1
+        assert routes[1].call_count == 1
+
+    @respx.mock
+    async def test_failover_on_server_error(self):
+        failing = respx.get("http://prometheus-0:9090/api/v1/targets").mock(
+            return_value=httpx.Response(503)
+        )
+        healthy = respx.get("http://prometheus-1:9090/api/v1/targets").mock(
+            return_value=httpx.Response(200, json=targets_response_())
+        )
+        client = Client(
+            base_url="http://prometheus-0:9090", endpoints=["http://prometheus-1:9090"]
+        )
+        for _ in range(3):
+            response = await client.list_targets()
+            assert len(response.active) == 1
+
+        # The failing endpoint is avoided while cooling down
+        assert failing.call_count == 1
+        assert healthy.call_count == 3
+        assert not client._endpoints[0].healthy
+
+    @respx.mock
+    async def test_client_errors_are_not_retried(self):
+        failing = respx.get("http://prometheus-0:9090/api/v1/targets").mock(
+            return_value=httpx.Response(400)
+        )
+        other = respx.get("http://prometheus-1:9090/api/v1/targets").mock(
+            return_value=httpx.Response(400)
+        )
+        client = Client(
+            base_url="http://prometheus-0:9090", endpoints=["http://prometheus-1:9090"]
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.list_targets()
+        assert failing.call_count + other.call_count == 1
+
+    async def test_slow_requests_are_hedged(self, mocker):
+        client = Client(
+            base_url="http://prometheus-0:9090",
+            endpoints=["http://prometheus-1:9090"],
+            hedge_percentile=95,
+        )
+        for endpoint in client._endpoints:
+            endpoint.latencies.extend([0.01] * 10)
+
+        requested, cancelled = [], []
+
+        async def _send_request_to_endpoint(
+            self, endpoint, method, request, response_type
+        ):
+            requested.append(endpoint.url)
+            if len(requested) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    # Clean up asynchronously, as closing a connection would
+                    await asyncio.sleep(0.01)
+                    cancelled.append(endpoint.url)
+                    raise
+            return endpoint.url
+
+        mocker.patch.object(
+            Client, "_send_request_to_endpoint", new=_send_request_to_endpoint
+        )
+        response = await asyncio.wait_for(
+            client.send_request("GET", servo.connectors.prometheus.TargetsRequest()),
+            timeout=1,
+        )
+        # The losing request has finished cancelling by the time the response is returned
+        assert len(requested) == 2
+        assert response == requested[1]
+        assert cancelled == requested[:1]
+
 
 class TestInstantQuery:
     @pytest.fixture
@@ -0,0 +1,223 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+import pytest
+
+import servo
+import servo.configuration
+import servo.pubsub
+from servo.convergence import ConvergenceObserver
+from servo.types import DataPoint, Metric, Reading, TimeSeries, Unit
+
+
+@pytest.fixture
+def metric() -> Metric:
+    return Metric("throughput", Unit.requests_per_minute)
+
+
+@pytest.fixture
+def config() -> servo.configuration.ConvergenceConfiguration:
+    return servo.configuration.ConvergenceConfiguration(
+        enabled=True, min_samples=5, stable_for="30s"
+    )
+
+
+def test_defaults_to_disabled() -> None:
+    assert not servo.configuration.ConvergenceConfiguration().enabled
+
+
+def test_insufficient_samples_do_not_converge(
+    config: servo.configuration.ConvergenceConfiguration,
+) -> None:
+    observer = ConvergenceObserver(config=config)
+    checked_at = datetime(2020, 1, 21, 12, 0, 0)
+    assert not observer.check_samples(
+        {"throughput": [[100.0] * 4]}, checked_at=checked_at
+    )
+    assert not observer.check_samples(
+        {"throughput": [[100.0] * 4]}, checked_at=checked_at + timedelta(minutes=5)
+    )
+
+
+def test_converges_after_stable_for(
+    config: servo.configuration.ConvergenceConfiguration,
+) -> None:
+    observer = ConvergenceObserver(config=config)
+    samples = {"throughput": [[100.0, 101.0, 99.0, 100.0, 100.5, 99.5]]}
+    checked_at = datetime(2020, 1, 21, 12, 0, 0)
+
+    assert not observer.check_samples(samples, checked_at=checked_at)
+    assert not observer.check_samples(
+        samples, checked_at=checked_at + timedelta(seconds=15)
+    )
+    assert observer.check_samples(
+        samples, checked_at=checked_at + timedelta(seconds=30)
+    )
+    assert observer.converged_at == checked_at + timedelta(seconds=30)
+
+
+def test_divergence_resets_stability(
+    config: servo.configuration.ConvergenceConfiguration,
+) -> None:
+    observer = ConvergenceObserver(config=config)
+    converged = {"throughput": [[100.0, 101.0, 99.0, 100.0, 100.5, 99.5]]}
+    diverged = {"throughput": [[10.0, 300.0, 50.0, 100.0, 200.0, 1.0]]}
+    checked_at = datetime(2020, 1, 21, 12, 0, 0)
+
+    assert not observer.check_samples(converged, checked_at=checked_at)
+    assert not observer.check_samples(
+        diverged, checked_at=checked_at + timedelta(seconds=15)
+    )
+    assert not observer.check_samples(
+        converged, checked_at=checked_at + timedelta(seconds=30)
+    )
+    assert observer.check_samples(
+        converged, checked_at=checked_at + timedelta(seconds=60)
+    )
+
+
+def test_all_series_must_converge(
+    config: servo.configuration.ConvergenceConfiguration,
+) -> None:
+    observer = ConvergenceObserver(config=config)
+    samples = {
+        "throughput": [
+            [100.0, 101.0, 99.0, 100.0, 100.5, 99.5],
+            [10.0, 300.0, 50.0, 100.0, 200.0, 1.0],
+        ]
+    }
+    checked_at = datetime(2020, 1, 21, 12, 0, 0)
+    observer.check_samples(samples, checked_at=checked_at)
+    assert not observer.check_samples(
+        samples, checked_at=checked_at + timedelta(minutes=5)
+    )
+
+
+def test_configured_metrics_must_be_present() -> None:
+    config = servo.configuration.ConvergenceConfiguration(
+        min_samples=5, stable_for="30s", metrics=["throughput", "error_rate"]
+    )
+    observer = ConvergenceObserver(config=config)
+    samples = {"throughput": [[100.0, 101.0, 99.0, 100.0, 100.5, 99.5]]}
+    checked_at = datetime(2020, 1, 21, 12, 0, 0)
+    observer.check_samples(samples, checked_at=checked_at)
+    assert not observer.check_samples(
+        samples, checked_at=checked_at + timedelta(minutes=5)
+    )
+
+
+def test_constant_zero_samples_converge() -> None:
+    config = servo.configuration.ConvergenceConfiguration(min_samples=5, stable_for=0)
+    observer = ConvergenceObserver(config=config)
+    assert observer.check_samples(
+        {"error_rate": [[0.0] * 5]}, checked_at=datetime(2020, 1, 21, 12, 0, 0)
+    )
+
+
+def test_observe_readings_accumulates_samples(metric: Metric) -> None:
+    config = servo.configuration.ConvergenceConfiguration(min_samples=5, stable_for=0)
+    observer = ConvergenceObserver(config=config)
+    received_at = datetime(2020, 1, 21, 12, 0, 0)
+    for index, value in enumerate([100.0, 101.0, 99.0, 100.0]):
+        assert not observer.observe_readings(
+            {metric.name: [DataPoint(metric, received_at, value)]},
+            received_at=received_at + timedelta(seconds=index),
+        )
+
+    assert observer.observe_readings(
+        {metric.name: [DataPoint(metric, received_at, 100.5)]},
+        received_at=received_at + timedelta(seconds=5),
+    )
+
+
+async def test_observe_completes_progress(metric: Metric) -> None:
+    config = servo.configuration.ConvergenceConfiguration(min_samples=5, stable_for=0)
+    measurement_start = datetime.now() - timedelta(minutes=1)
+
+    async def _metrics_getter(start, end) -> Dict[str, List[Reading]]:
+        assert start == measurement_start
+        return {
+            metric.name: [
+                TimeSeries(
+                    metric,
+                    [
+                        DataPoint(metric, start + timedelta(seconds=i), value)
+                        for i, value in enumerate([100.0, 101.0, 99.0, 100.0, 100.5])
+                    ],
+                )
+            ]
+        }
+
+    observer = ConvergenceObserver(
+        config=config,
+        measurement_start=measurement_start,
+        metrics_getter=_metrics_getter,
+    )
+    progress = servo.EventProgress(timeout="1m")
+    progress.start()
+    await observer.observe(progress)
+    assert progress.completed
+    assert observer.converged_at is not None
+
+
+async def test_observe_waits_for_measurement_start(
+    config: servo.configuration.ConvergenceConfiguration,
+) -> None:
+    async def _metrics_getter(start, end) -> Dict[str, List[Reading]]:
+        raise AssertionError("metrics should not be queried during warmup")
+
+    observer = ConvergenceObserver(
+        config=config,
+        measurement_start=datetime.now() + timedelta(minutes=1),
+        metrics_getter=_metrics_getter,
+    )
+    progress = servo.EventProgress(timeout="1m")
+    progress.start()
+    await observer.observe(progress)
+    assert not progress.completed
+
+
+async def test_subscribe_completes_progress_on_pushed_convergence(
+    metric: Metric,
+) -> None:
+    config = servo.configuration.ConvergenceConfiguration(min_samples=5, stable_for=0)
+    exchange = servo.pubsub.Exchange()
+    exchange.start()
+    exchange.create_channel("metrics")
+    observer = ConvergenceObserver(config=config)
+    progress = servo.EventProgress()
+
+    def _decoder(message, channel) -> Dict[str, List[Reading]]:
+        return {
+            metric.name: [DataPoint(metric, datetime.now(), message.json()["value"])]
+        }
+
+    try:
+        with observer.subscribe(
+            progress, exchange=exchange, selector="metrics", decoder=_decoder
+        ):
+            for value in [100.0, 101.0, 99.0, 100.0, 100.5]:
+                await exchange.publish(
+                    servo.pubsub.Message(json={"value": value}), "metrics"
+                )
+            await asyncio.wait_for(progress.wait(), timeout=2)
+
+        assert progress.completed
+        assert not exchange._subscribers
+    finally:
+        await exchange.shutdown()
+
+
+def test_annotations_report_measurement_window(
+    config: servo.configuration.ConvergenceConfiguration,
+) -> None:
+    observer = ConvergenceObserver(config=config)
+    annotations = observer.annotations(
+        datetime(2020, 1, 21, 12, 0, 0), datetime(2020, 1, 21, 12, 2, 30)
+    )
+    assert annotations == {
+        "convergence": "not converged",
+        "measurement_window": "2020-01-21T12:00:00/2020-01-21T12:02:30",
+        "measurement_duration": "2m30s",
+    }
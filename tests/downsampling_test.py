@@ -0,0 +1,128 @@
+import math
+from datetime import datetime, timedelta
+from typing import List
+
+import numpy
+import pytest
+
+import servo.downsampling
+from servo.configuration import DownsamplingConfiguration, DownsamplingMode
+from servo.types import DataPoint, Measurement, Metric, TimeSeries, Unit
+
+START = datetime(2020, 1, 21, 12, 0, 0)
+
+
+@pytest.fixture
+def metric() -> Metric:
+    return Metric("throughput", Unit.requests_per_minute)
+
+
+def _time_series(metric: Metric, values: List[float]) -> TimeSeries:
+    return TimeSeries(
+        metric,
+        [
+            DataPoint(metric, START + timedelta(seconds=offset), value)
+            for offset, value in enumerate(values)
+        ],
+    )
+
+
+def test_time_series_within_target_are_not_downsampled(metric: Metric) -> None:
+    time_series = _time_series(metric, [1.0, 2.0, 3.0])
+    assert (
+        servo.downsampling.downsample_time_series(time_series, DownsamplingMode.lttb, 3)
+        is time_series
+    )
+
+
+def test_mean(metric: Metric) -> None:
+    time_series = _time_series(metric, [1.0, 3.0, 5.0, 7.0, 9.0, 11.0])
+    downsampled = servo.downsampling.downsample_time_series(
+        time_series, DownsamplingMode.mean, 3
+    )
+    assert [data_point.value for data_point in downsampled] == [2.0, 6.0, 10.0]
+    assert [data_point.time for data_point in downsampled] == [
+        START + timedelta(seconds=0.5),
+        START + timedelta(seconds=2.5),
+        START + timedelta(seconds=4.5),
+    ]
+    assert all(data_point.metric == metric for data_point in downsampled)
+
+
+def test_max_retains_peaks(metric: Metric) -> None:
+    time_series = _time_series(metric, [1.0, 9.0, 5.0, 2.0, 2.0, 30.0, 4.0, 8.0, 1.0])
+    downsampled = servo.downsampling.downsample_time_series(
+        time_series, DownsamplingMode.max, 3
+    )
+    assert [data_point.value for data_point in downsampled] == [9.0, 30.0, 8.0]
+    assert [data_point.time for data_point in downsampled] == [
+        START + timedelta(seconds=1),
+        START + timedelta(seconds=5),
+        START + timedelta(seconds=7),
+    ]
+
+
+def test_lttb_retains_endpoints_and_peaks(metric: Metric) -> None:
+    values = [math.sin(offset / 10) for offset in range(1000)]
+    values[500] = 100.0
+    time_series = _time_series(metric, values)
+    downsampled = servo.downsampling.downsample_time_series(
+        time_series, DownsamplingMode.lttb, 50
+    )
+    assert len(downsampled) == 50
+    assert downsampled[0] == time_series[0]
+    assert downsampled[-1] == time_series[-1]
+    assert time_series[500] in downsampled.data_points
+    times = [data_point.time for data_point in downsampled]
+    assert times == sorted(times)
+
+
+def test_lttb_indices_are_unique_and_ascending() -> None:
+    timestamps = numpy.arange(100, dtype=float)
+    values = numpy.random.default_rng(42).random(100)
+    indices = servo.downsampling.lttb_indices(timestamps, values, 10)
+    assert len(indices) == 10
+    assert list(indices) == sorted(set(indices))
+
+
+def test_downsample_measurement_by_metric(metric: Metric) -> None:
+    other = Metric("error_rate", Unit.percentage)
+    measurement = Measurement(
+        readings=[
+            _time_series(metric, list(range(10))),
+            _time_series(other, list(range(10))),
+        ],
+        annotations={"foo": "bar"},
+    )
+    downsampled = servo.downsampling.downsample_measurement(
+        measurement,
+        [
+            DownsamplingConfiguration(
+                mode="max", target_points=5, metrics=["error_rate"]
+            ),
+            DownsamplingConfiguration(mode="mean", target_points=4),
+        ],
+    )
+    assert downsampled.annotations == {"foo": "bar"}
+    assert [len(series) for series in downsampled] == [4, 5]
+    assert [data_point.value for data_point in downsampled[1]] == [
+        1.0,
+        3.0,
+        5.0,
+        7.0,
+        9.0,
+    ]
+
+    # the original measurement is left untouched
+    assert [len(series) for series in measurement] == [10, 10]
+
+
+def test_downsample_measurement_without_configuration(metric: Metric) -> None:
+    measurement = Measurement(readings=[_time_series(metric, list(range(10)))])
+    assert servo.downsampling.downsample_measurement(measurement, None) is measurement
+    assert (
+        servo.downsampling.downsample_measurement(
+            measurement, [DownsamplingConfiguration(metrics=["error_rate"])]
+        )
+        is measurement
+    )
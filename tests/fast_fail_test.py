@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 import freezegun
 import pydantic
@@ -6,6 +7,8 @@ from typing import Callable, Dict, List
 
 import servo
 import servo.configuration
+import servo.fast_fail
+import servo.pubsub
 from servo.fast_fail import FastFailObserver
 from servo.types import (
     DataPoint,
@@ -444,3 +447,149 @@ def test_data_point_slos_fail(
         observer.check_readings(slo_check_readings, checked_at)
 
     assert str(err_info.value) == error_str
+
+
+def test_trigger_window_evicts_old_failures(
+    config: servo.configuration.FastFailConfiguration,
+    metrics_getter,
+    metric: Metric,
+) -> None:
+    observer = FastFailObserver(
+        config=config,
+        input=SloInput(
+            conditions=[
+                SloCondition(
+                    metric=metric.name,
+                    threshold=10,
+                    trigger_count=2,
+                    trigger_window=2,
+                )
+            ]
+        ),
+        metrics_getter=metrics_getter,
+    )
+    checked_at = datetime(2020, 1, 21, 12, 0, 1)
+    failing = {metric.name: _make_data_point_list(metric, [20.0])}
+    passing = {metric.name: _make_data_point_list(metric, [5.0])}
+
+    # A single failure followed by a pass never fills the trigger count
+    observer.check_readings(failing, checked_at)
+    observer.check_readings(passing, checked_at)
+    # The earlier failure has been evicted from the window by now
+    observer.check_readings(failing, checked_at)
+
+    with pytest.raises(servo.EventAbortedError) as err_info:
+        observer.check_readings(failing, checked_at)
+
+    assert str(err_info.value) == (
+        "SLO violation(s) observed: (throughput below 10)[2020-01-21 12:00:01 SLO failed metric value 20 was"
+        " not below threshold value 10, 2020-01-21 12:00:01 SLO failed metric value 20 was not below threshold"
+        " value 10]"
+    )
+
+
+async def test_guard_aborts_operation_on_pushed_violation(
+    config: servo.configuration.FastFailConfiguration,
+    metric: Metric,
+) -> None:
+    exchange = servo.pubsub.Exchange()
+    exchange.start()
+    observer = FastFailObserver(
+        config=config,
+        input=SloInput(conditions=[SloCondition(metric=metric.name, threshold=10)]),
+    )
+
+    def _decoder(message, channel) -> Dict[str, List[Reading]]:
+        return {
+            metric.name: [DataPoint(metric, datetime.now(), message.json()["value"])]
+        }
+
+    async def _operation() -> None:
+        await exchange.publish(servo.pubsub.Message(json={"value": 5}), "metrics")
+        await exchange.publish(servo.pubsub.Message(json={"value": 20}), "metrics")
+        await asyncio.sleep(5)
+
+    exchange.create_channel("metrics")
+    try:
+        with pytest.raises(servo.EventAbortedError) as err_info:
+            await asyncio.wait_for(
+                observer.guard(
+                    _operation(),
+                    exchange=exchange,
+                    selector="metrics",
+                    decoder=_decoder,
+                ),
+                timeout=2,
+            )
+
+        assert "(throughput below 10)" in str(err_info.value)
+        assert err_info.value.reason == servo.fast_fail.SLO_FAILED_REASON
+        assert not exchange._subscribers
+    finally:
+        await exchange.shutdown()
+
+
+async def test_guard_returns_operation_result(
+    config: servo.configuration.FastFailConfiguration,
+    metric: Metric,
+) -> None:
+    exchange = servo.pubsub.Exchange()
+    observer = FastFailObserver(
+        config=config,
+        input=SloInput(conditions=[SloCondition(metric=metric.name, threshold=10)]),
+    )
+
+    async def _operation() -> int:
+        return 31337
+
+    result = await observer.guard(
+        _operation(), exchange=exchange, selector="metrics", decoder=lambda m, c: {}
+    )
+    assert result == 31337
+
+
+def test_observe_readings_evicts_readings_outside_span(
+    metrics_getter,
+    metric: Metric,
+) -> None:
+    observer = FastFailObserver(
+        config=servo.configuration.FastFailConfiguration(period="10s"),
+        input=SloInput(conditions=[SloCondition(metric=metric.name, threshold=10)]),
+    )
+    with pytest.raises(servo.EventAbortedError):
+        observer.observe_readings(
+            {metric.name: _make_data_point_list(metric, [100.0])},
+            received_at=datetime(2020, 1, 21, 12, 0, 0),
+        )
+
+    # The failing reading is still within the span
+    with pytest.raises(servo.EventAbortedError):
+        observer.observe_readings({}, received_at=datetime(2020, 1, 21, 12, 0, 5))
+
+    # The failing reading has aged out of the span
+    observer.observe_readings(
+        {metric.name: _make_data_point_list(metric, [1.0])},
+        received_at=datetime(2020, 1, 21, 12, 0, 15),
+    )
+
+
+def test_outcomes_reference_checked_readings(
+    observer: FastFailObserver, metric: Metric, tuning_metric: Metric
+) -> None:
+    readings = {
+        metric.name: _make_data_point_list(metric, [100.0]),
+        tuning_metric.name: _make_data_point_list(tuning_metric, [200.0]),
+    }
+    observer.check_readings(readings, datetime(2020, 1, 21, 12, 0, 1))
+
+    threshold_window, threshold_metric_window = observer._windows
+    (outcome,) = threshold_window.outcomes()
+    assert outcome.metric_readings == readings[metric.name]
+    assert outcome.threshold_readings is None
+
+    (outcome,) = threshold_metric_window.outcomes()
+    assert outcome.metric_readings == readings[metric.name]
+    assert outcome.threshold_readings == readings[tuning_metric.name]
+
+    observer.check_readings({}, datetime(2020, 1, 21, 12, 0, 2))
+    assert threshold_window.outcomes()[-1].metric_readings is None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 
 import loguru
@@ -221,6 +222,104 @@ class TestProgressHandler:
             error_reporter.assert_not_called()
 
 
+class TestCoalescingProgressHandler:
+    @pytest.fixture()
+    def progress_reporter(self, mocker: pytest_mock.MockFixture):
+        return mocker.Mock(name="progress reporter")
+
+    @pytest.fixture()
+    async def handler(self, progress_reporter, event_loop) -> ProgressHandler:
+        handler = ProgressHandler(progress_reporter, min_interval=0.2)
+        yield handler
+        await handler.shutdown()
+
+    @pytest.fixture()
+    def logger(self, handler: ProgressHandler) -> loguru.Logger:
+        logger = loguru.logger.bind(
+            connector="progress", operation="hacking", started_at=datetime.now()
+        )
+        logger.add(handler.sink)
+        return logger
+
+    async def _drain(self, handler: ProgressHandler) -> None:
+        # NOTE: Awaiting `logger.complete()` holds the sink lock and deadlocks if the
+        # queue processor logs, so yield to the sink tasks instead
+        await asyncio.sleep(0.01)
+        await handler._queue.join()
+
+    def _reported_progress(self, progress_reporter) -> list[float]:
+        return [call.kwargs["progress"] for call in progress_reporter.call_args_list]
+
+    async def test_coalesces_to_latest_progress(
+        self, logger, handler, progress_reporter
+    ):
+        for progress in [10, 20, 30, 40]:
+            logger.info("Test...", progress=progress)
+            await self._drain(handler)
+        assert self._reported_progress(progress_reporter) == [10]
+
+        await asyncio.sleep(0.3)
+        await self._drain(handler)
+        assert self._reported_progress(progress_reporter) == [10, 40]
+
+    async def test_coalesces_per_operation_and_connector(
+        self, logger, handler, progress_reporter
+    ):
+        logger.info("Test...", progress=10)
+        logger.info("Test...", progress=10, connector="other")
+        logger.info("Test...", progress=10, operation="other")
+        await self._drain(handler)
+        assert progress_reporter.call_count == 3
+
+    async def test_coalesces_per_servo(
+        self, logger, handler, progress_reporter, mocker: pytest_mock.MockFixture
+    ):
+        servos = [
+            mocker.Mock(config=mocker.Mock(optimizer=mocker.Mock(id=id)))
+            for id in ("dev.opsani.com/first", "dev.opsani.com/second")
+        ]
+        current_servo = mocker.patch("servo.current_servo")
+        for servo_ in servos:
+            current_servo.return_value = servo_
+            logger.info("Test...", progress=10)
+            logger.info("Test...", progress=20)
+            await self._drain(handler)
+
+        assert self._reported_progress(progress_reporter) == [10, 10]
+
+    async def test_failed_progress_is_reported_immediately(
+        self, logger, handler, progress_reporter
+    ):
+        logger.info("Test...", progress=10)
+        logger.info("Test...", progress=20)
+        logger.error("Failed...", progress=30)
+        await self._drain(handler)
+        assert self._reported_progress(progress_reporter) == [10, 30]
+
+        await asyncio.sleep(0.3)
+        assert self._reported_progress(progress_reporter) == [10, 30]
+
+    async def test_completed_progress_discards_pending(
+        self, logger, handler, progress_reporter
+    ):
+        logger.info("Test...", progress=10)
+        logger.info("Test...", progress=20)
+        logger.info("Done", progress=100)
+        await self._drain(handler)
+        await asyncio.sleep(0.3)
+        # 100% progress is elided by the reporter
+        assert self._reported_progress(progress_reporter) == [10]
+
+    async def test_shutdown_flushes_pending_progress(
+        self, logger, handler, progress_reporter
+    ):
+        logger.info("Test...", progress=10)
+        logger.info("Test...", progress=20)
+        await asyncio.sleep(0.01)
+        await handler.shutdown()
+        assert self._reported_progress(progress_reporter) == [10, 20]
+
+
 def test_log_execution() -> None:
     @log_execution
     def log_me():
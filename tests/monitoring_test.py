@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+import servo.monitoring
+
+
+async def test_records_stall_with_blocking_stack() -> None:
+    monitor = servo.monitoring.LoopMonitor(interval=0.01, threshold=0.05)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        time.sleep(0.2)  # Block the event loop
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    snapshot = monitor.snapshot()
+    assert snapshot.heartbeats > 0
+    assert snapshot.max_lag >= 0.1
+    assert snapshot.stalls
+    stall = snapshot.stalls[0]
+    assert stall.lag == snapshot.max_lag
+    assert stall.stack
+    assert "test_records_stall_with_blocking_stack" in "".join(stall.stack)
+
+
+async def test_retains_slowest_stalls() -> None:
+    monitor = servo.monitoring.LoopMonitor(threshold=0.1, max_stalls=2)
+    for lag in (0.2, 0.5, 0.3, 0.01):
+        monitor._record_lag(lag)
+
+    snapshot = monitor.snapshot()
+    assert snapshot.heartbeats == 4
+    assert [stall.lag for stall in snapshot.stalls] == [0.5, 0.3]
+
+
+async def test_sample_tasks_groups_by_name() -> None:
+    monitor = servo.monitoring.LoopMonitor()
+    monitor._loop = asyncio.get_running_loop()
+    tasks = [
+        asyncio.create_task(asyncio.sleep(1), name=f"worker-{i}") for i in range(3)
+    ]
+    try:
+        sample = monitor.sample_tasks()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert sample.counts["worker"] == 3
+    assert sample.total >= 4
+
+
+async def test_growing_tasks() -> None:
+    monitor = servo.monitoring.LoopMonitor()
+    for count in range(1, 4):
+        monitor._task_samples.append(
+            servo.monitoring.TaskSample(at=count, counts={"leaky": count, "steady": 1})
+        )
+
+    assert monitor.growing_tasks() == ["leaky"]
@@ -0,0 +1,144 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import pytest
+
+import servo.normalization
+from servo.types import (
+    DataPoint,
+    Measurement,
+    Metric,
+    NormalizationPolicy,
+    TimeSeries,
+    Unit,
+)
+
+START = datetime(2020, 1, 21, 12, 0, 0)
+
+
+@pytest.fixture
+def metric() -> Metric:
+    return Metric("throughput", Unit.requests_per_minute)
+
+
+def _time_series(
+    metric: Metric, points: List[tuple], id: Optional[str] = None
+) -> TimeSeries:
+    return TimeSeries(
+        metric,
+        [
+            DataPoint(metric, START + timedelta(seconds=offset), value)
+            for offset, value in points
+        ],
+        id=id,
+    )
+
+
+def _points(time_series: TimeSeries) -> List[tuple]:
+    return [
+        ((data_point.time - START).total_seconds(), data_point.value)
+        for data_point in time_series
+    ]
+
+
+@pytest.fixture
+def measurement(metric: Metric) -> Measurement:
+    return Measurement(
+        readings=[
+            _time_series(metric, [(0, 1.0), (10, 2.0), (20, 3.0), (30, 4.0)], id="a"),
+            _time_series(metric, [(10, 20.0), (20, 30.0), (40, 50.0)], id="b"),
+        ],
+        annotations={"foo": "bar"},
+    )
+
+
+def test_passthrough_returns_measurement(measurement: Measurement) -> None:
+    assert (
+        servo.normalization.normalize_measurement(
+            measurement, NormalizationPolicy.passthrough
+        )
+        is measurement
+    )
+
+
+def test_data_points_are_not_normalized(metric: Metric) -> None:
+    measurement = Measurement(
+        readings=[DataPoint(metric, START, 1.0), DataPoint(metric, START, 2.0)]
+    )
+    assert (
+        servo.normalization.normalize_measurement(
+            measurement, NormalizationPolicy.intersect
+        )
+        is measurement
+    )
+
+
+def test_intersect(measurement: Measurement) -> None:
+    normalized = servo.normalization.normalize_measurement(
+        measurement, NormalizationPolicy.intersect
+    )
+    assert normalized is not measurement
+    assert normalized.annotations == {"foo": "bar"}
+    assert [series.id for series in normalized] == ["a", "b"]
+    assert _points(normalized[0]) == [(10, 2.0), (20, 3.0)]
+    assert _points(normalized[1]) == [(10, 20.0), (20, 30.0)]
+
+    # the original measurement is left untouched
+    assert len(measurement[0]) == 4
+
+
+def test_intersect_without_common_times(metric: Metric) -> None:
+    intersected = servo.normalization.intersect_time_series(
+        [
+            _time_series(metric, [(0, 1.0), (10, 2.0)]),
+            _time_series(metric, [(5, 1.0), (15, 2.0)]),
+        ]
+    )
+    assert [len(series) for series in intersected] == [0, 0]
+
+
+def test_fill(measurement: Measurement) -> None:
+    normalized = servo.normalization.normalize_measurement(
+        measurement, NormalizationPolicy.fill
+    )
+    assert _points(normalized[0]) == [
+        (0, 1.0),
+        (10, 2.0),
+        (20, 3.0),
+        (30, 4.0),
+        (40, 4.0),
+    ]
+    assert _points(normalized[1]) == [
+        (0, 20.0),
+        (10, 20.0),
+        (20, 30.0),
+        (30, 40.0),
+        (40, 50.0),
+    ]
+    assert all(
+        data_point.metric == series.metric
+        for series in normalized
+        for data_point in series
+    )
+
+
+def test_fill_leaves_empty_series(metric: Metric) -> None:
+    filled = servo.normalization.fill_time_series(
+        [_time_series(metric, [(0, 1.0), (10, 2.0)]), _time_series(metric, [])]
+    )
+    assert _points(filled[0]) == [(0, 1.0), (10, 2.0)]
+    assert len(filled[1]) == 0
+
+
+def test_normalizes_many_series(metric: Metric) -> None:
+    time_series = [
+        _time_series(
+            metric, [(offset, float(index)) for offset in range(index % 3, 60)]
+        )
+        for index in range(1000)
+    ]
+    intersected = servo.normalization.intersect_time_series(time_series)
+    assert {len(series) for series in intersected} == {58}
+
+    filled = servo.normalization.fill_time_series(time_series)
+    assert {len(series) for series in filled} == {60}
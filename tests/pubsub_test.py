@@ -1,8 +1,10 @@
 import asyncio
 import datetime
 import itertools
+import json
 import operator
 import re
+import time
 import weakref
 from typing import Callable, List, Optional
 
@@ -67,6 +69,14 @@ class TestMessage:
         assert message.content_type == "application/x-yaml"
         assert message.content == b"key: value\n"
 
+    async def test_decode_json_and_yaml(self) -> None:
+        assert await servo.pubsub.Message(json={"key": "value"}).decode_json() == {
+            "key": "value"
+        }
+        assert await servo.pubsub.Message(yaml={"key": "value"}).decode_yaml() == {
+            "key": "value"
+        }
+
     def test_content_message(self) -> None:
         message = servo.pubsub.Message(
             content=b"This is the message", content_type="foo/bar"
@@ -75,6 +85,49 @@ class TestMessage:
         assert message.content_type == "foo/bar"
         assert message.content == b"This is the message"
 
+    def test_json_message_is_serialized_at_construction(self) -> None:
+        report = {"latencies": [1, 2], "throughput": 31337}
+        message = servo.pubsub.Message(json=report)
+        report["latencies"].append(3)
+        assert message.content == b'{"latencies": [1, 2], "throughput": 31337}'
+        assert message.json() == {"latencies": [1, 2], "throughput": 31337}
+
+    def test_json_message_must_be_serializable(self) -> None:
+        with pytest.raises(TypeError, match="is not JSON serializable"):
+            servo.pubsub.Message(json={"when": object()})
+
+    def test_decoded_content_is_not_shared(self) -> None:
+        message = servo.pubsub.Message(json={"latencies": [1, 2]})
+        decoded = message.json()
+        decoded["latencies"].append(3)
+        assert message.json() == {"latencies": [1, 2]}
+        assert message.json() is not message.json()
+        assert message.content == b'{"latencies": [1, 2]}'
+
+    def test_dict_includes_content(self) -> None:
+        message = servo.pubsub.Message(text="hello")
+        assert message.dict()["content"] == b"hello"
+        assert "content" not in message.dict(exclude={"content"})
+        assert message.dict(include={"content"}) == {"content": b"hello"}
+
+    def test_memoryview_content_is_not_copied(self) -> None:
+        view = memoryview(b'{"key": "value"}')
+        message = servo.pubsub.Message(content=view, content_type="application/json")
+        assert message.content is view
+        assert message.json() == {"key": "value"}
+        assert message.text == '{"key": "value"}'
+
+    def test_msgpack_message(self) -> None:
+        msgpack = pytest.importorskip("msgpack")
+        message = servo.pubsub.Message(msgpack={"key": "value"})
+        assert message.content_type == "application/msgpack"
+        assert msgpack.unpackb(message.content) == {"key": "value"}
+
+        decoded = servo.pubsub.Message(
+            content=message.content, content_type="application/msgpack"
+        )
+        assert decoded.msgpack() == {"key": "value"}
+
     def test_created_at(self) -> None:
         message = servo.pubsub.Message(
             content=b"This is the message", content_type="foo/bar"
@@ -508,6 +561,25 @@ class TestSubscriber:
             timeout=1.0,
         )
 
+    async def test_cancellation_yields_delivered_messages(
+        self, channel, subscriber: servo.pubsub.Subscriber
+    ) -> None:
+        messages = []
+        event = asyncio.Event()
+
+        async def _processor() -> None:
+            event.set()
+            async for message_, channel_ in subscriber:
+                messages.append(message_.text)
+
+        task = asyncio.create_task(_processor())
+        await event.wait()
+        for i in range(3):
+            await subscriber(servo.pubsub.Message(text=f"Message {i}"), channel)
+        subscriber.cancel()
+        await asyncio.wait_for(task, timeout=1.0)
+        assert messages == ["Message 0", "Message 1", "Message 2"]
+
     async def test_cannot_stop_nested_iterator(
         self,
         subscriber: servo.pubsub.Subscriber,
@@ -1262,6 +1334,326 @@ class TestExchange:
         exchange.remove_subscriber(subscriber)
         assert subscriber not in exchange._subscribers
 
+    async def test_routes_only_matching_subscribers(
+        self, exchange: servo.pubsub.Exchange
+    ) -> None:
+        channel = exchange.create_channel("metrics.http")
+        exact = exchange.create_subscriber("metrics.http")
+        glob = exchange.create_subscriber("metrics.*")
+        regex = exchange.create_subscriber("/metrics.(http|dns)/")
+        exchange.create_subscriber("metrics.dns")
+        exchange.create_subscriber("logs.*")
+
+        assert exchange._route(channel) == [exact, glob, regex]
+        assert exchange._route(channel) is exchange._route(channel)
+
+    async def test_routes_are_invalidated_by_subscriber_changes(
+        self, exchange: servo.pubsub.Exchange
+    ) -> None:
+        channel = exchange.create_channel("metrics")
+        first = exchange.create_subscriber("metrics")
+        assert exchange._route(channel) == [first]
+
+        second = exchange.create_subscriber("metrics*")
+        assert exchange._route(channel) == [first, second]
+
+        first.cancel()
+        assert exchange._route(channel) == [second]
+
+        exchange.remove_subscriber(second)
+        assert exchange._route(channel) == []
+
+    async def test_callback_arity_is_resolved_on_subscribe(
+        self, exchange: servo.pubsub.Exchange
+    ) -> None:
+        async def _callback(message: servo.pubsub.Message) -> None:
+            ...
+
+        subscriber = exchange.create_subscriber("metrics", callback=_callback)
+        assert subscriber._callback_spec == (_callback, 1, True)
+
+    async def test_start_runs_fixed_pool_of_workers(self) -> None:
+        exchange = servo.pubsub.Exchange(workers=2)
+        exchange.start()
+        assert len(exchange._queue_processors) == 2
+        await exchange.shutdown()
+        assert not exchange.running
+
+    async def test_publish_blocks_when_queue_is_full(self) -> None:
+        exchange = servo.pubsub.Exchange(max_queue_size=1)
+        channel = exchange.create_channel("metrics")
+        await exchange.publish(servo.pubsub.Message(text="one"), channel)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                exchange.publish(servo.pubsub.Message(text="two"), channel), 0.01
+            )
+
+    async def test_aggregator_publishes_into_full_queue(self) -> None:
+        exchange = servo.pubsub.Exchange(workers=1, max_queue_size=1)
+        prometheus_metrics = exchange.create_channel("prometheus")
+        cloudwatch_metrics = exchange.create_channel("cloudwatch")
+        scaling_metrics = exchange.create_channel("scaling")
+
+        async def _aggregate_metrics(
+            aggregator: servo.pubsub.Aggregator,
+            message: servo.pubsub.Message,
+            channel: servo.pubsub.Channel,
+        ) -> None:
+            # Let the publisher refill the queue while the worker is aggregating
+            await asyncio.sleep(0)
+            aggregator.message = message.copy()
+
+        exchange.add_transformer(
+            servo.pubsub.Aggregator(
+                from_channels=[prometheus_metrics, cloudwatch_metrics],
+                to_channel=scaling_metrics,
+                callback=_aggregate_metrics,
+            )
+        )
+        aggregates = []
+        exchange.create_subscriber(
+            "scaling", callback=lambda message: aggregates.append(message.text)
+        )
+        exchange.start()
+
+        async def _publish() -> None:
+            for i in range(5):
+                await prometheus_metrics.publish(servo.pubsub.Message(text=f"p{i}"))
+                await cloudwatch_metrics.publish(servo.pubsub.Message(text=f"c{i}"))
+
+        await asyncio.wait_for(_publish(), 1)
+        await asyncio.wait_for(exchange.shutdown(), 1)
+        assert aggregates == [f"c{i}" for i in range(5)]
+
+    async def test_callback_republishes_into_full_queue(self) -> None:
+        exchange = servo.pubsub.Exchange(workers=1, max_queue_size=1)
+        src = exchange.create_channel("src")
+        dst = exchange.create_channel("dst")
+
+        async def _republish(message: servo.pubsub.Message) -> None:
+            await dst.publish(servo.pubsub.Message(text=f"{message.text}-a"))
+            await dst.publish(servo.pubsub.Message(text=f"{message.text}-b"))
+
+        exchange.create_subscriber("src", callback=_republish)
+        republished = []
+        exchange.create_subscriber(
+            "dst", callback=lambda message: republished.append(message.text)
+        )
+        exchange.start()
+
+        await asyncio.wait_for(src.publish(servo.pubsub.Message(text="m")), 1)
+        await asyncio.wait_for(exchange.shutdown(), 1)
+        assert republished == ["m-a", "m-b"]
+
+    async def test_iterator_buffer_is_lossless_by_default(
+        self, exchange: servo.pubsub.Exchange
+    ) -> None:
+        exchange.start()
+        channel = exchange.create_channel("metrics")
+        async with exchange.subscribe("metrics", buffer_size=2) as subscriber:
+            iterator = subscriber.__aiter__()
+            for text in ("one", "two", "three"):
+                await exchange.publish(servo.pubsub.Message(text=text), channel)
+
+            texts = [
+                (await asyncio.wait_for(iterator.__anext__(), 1))[0].text
+                for _ in range(3)
+            ]
+            assert texts == ["one", "two", "three"]
+            assert iterator._buffer.dropped == 0
+
+    async def test_iterator_buffer_drops_oldest_when_configured(
+        self, exchange: servo.pubsub.Exchange
+    ) -> None:
+        exchange.start()
+        channel = exchange.create_channel("metrics")
+        async with exchange.subscribe(
+            "metrics", buffer_size=2, overflow=servo.pubsub.OverflowPolicy.drop_oldest
+        ) as subscriber:
+            iterator = subscriber.__aiter__()
+            for text in ("one", "two", "three"):
+                await exchange.publish(servo.pubsub.Message(text=text), channel)
+            await exchange._queue.join()
+
+            assert iterator._buffer.dropped == 1
+            assert [(await iterator.__anext__())[0].text for _ in range(2)] == [
+                "two",
+                "three",
+            ]
+
+    async def test_batched_channel_delivers_batches_by_size(
+        self, exchange: servo.pubsub.Exchange
+    ) -> None:
+        exchange.start()
+        channel = exchange.create_channel("metrics", batch_size=3, batch_interval="1h")
+        batches = []
+        exchange.create_subscriber(
+            "metrics", callback=lambda messages: batches.append(messages), batched=True
+        )
+        for i in range(4):
+            await channel.publish(servo.pubsub.Message(text=str(i)))
+        await exchange._queue.join()
+
+        assert [[m.text for m in batch] for batch in batches] == [["0", "1", "2"]]
+        assert len(exchange._batches[channel]) == 1
+
+    async def test_batched_channel_delivers_batches_by_interval(
+        self, exchange: servo.pubsub.Exchange
+    ) -> None:
+        exchange.start()
+        channel = exchange.create_channel("metrics", batch_interval="10ms")
+        event = asyncio.Event()
+        batches = []
+
+        def _callback(messages: List[servo.pubsub.Message]) -> None:
+            batches.append([m.text for m in messages])
+            event.set()
+
+        exchange.create_subscriber("metrics", callback=_callback, batched=True)
+        await channel.publish(servo.pubsub.Message(text="one"))
+        await channel.publish(servo.pubsub.Message(text="two"))
+        await asyncio.wait_for(event.wait(), 1)
+        assert batches == [["one", "two"]]
+
+    async def test_batches_are_unrolled_for_unbatched_subscribers(
+        self, exchange: servo.pubsub.Exchange
+    ) -> None:
+        exchange.start()
+        channel = exchange.create_channel("metrics")
+        texts = []
+        exchange.create_subscriber(
+            "metrics", callback=lambda message: texts.append(message.text)
+        )
+        await channel.publish_batch(
+            [servo.pubsub.Message(text="one"), servo.pubsub.Message(text="two")]
+        )
+        await exchange._queue.join()
+        assert texts == ["one", "two"]
+
+    async def test_transformers_process_batches(
+        self, exchange: servo.pubsub.Exchange
+    ) -> None:
+        exchange.start()
+        channel = exchange.create_channel("metrics")
+        exchange.add_transformer(
+            servo.pubsub.Filter(lambda m, c: m if m.text != "skip" else None)
+        )
+        batches = []
+        exchange.create_subscriber(
+            "metrics", callback=lambda messages: batches.append(messages), batched=True
+        )
+        await exchange.publish_batch(
+            [servo.pubsub.Message(text="skip"), servo.pubsub.Message(text="keep")],
+            channel,
+        )
+        await exchange._queue.join()
+        assert [[m.text for m in batch] for batch in batches] == [["keep"]]
+
+    async def test_late_subscriber_replays_retained_messages(
+        self, exchange: servo.pubsub.Exchange
+    ) -> None:
+        exchange.start()
+        channel = exchange.create_channel(
+            "metrics", retention=servo.pubsub.Retention(size=2)
+        )
+        for text in ("one", "two", "three"):
+            await channel.publish(servo.pubsub.Message(text=text))
+        await exchange._queue.join()
+
+        async with exchange.subscribe("metrics", replay="1m") as subscriber:
+            iterator = subscriber.__aiter__()
+            await channel.publish(servo.pubsub.Message(text="four"))
+            texts = [(await iterator.__anext__())[0].text for _ in range(3)]
+
+        assert texts == ["two", "three", "four"]
+
+    async def test_replay_merges_channels_in_order(
+        self, exchange: servo.pubsub.Exchange
+    ) -> None:
+        exchange.start()
+        retention = servo.pubsub.Retention(period="1m")
+        http = exchange.create_channel("metrics.http", retention=retention)
+        dns = exchange.create_channel("metrics.dns", retention=retention)
+        exchange.create_channel("logs", retention=retention)
+        for channel, text in ((http, "one"), (dns, "two"), (http, "three")):
+            await channel.publish(servo.pubsub.Message(text=text))
+            await exchange._queue.join()
+
+        replayed = exchange.replay("metrics.*", "1m")
+        assert [(m.text, c.name) for m, c in replayed] == [
+            ("one", "metrics.http"),
+            ("two", "metrics.dns"),
+            ("three", "metrics.http"),
+        ]
+        assert exchange.replay("metrics.*", 0) == []
+
+    async def test_replay_to_callback(self, exchange: servo.pubsub.Exchange) -> None:
+        exchange.start()
+        channel = exchange.create_channel(
+            "metrics", retention=servo.pubsub.Retention(size=10)
+        )
+        await channel.publish(servo.pubsub.Message(json={"value": 1}))
+        await exchange._queue.join()
+
+        event = asyncio.Event()
+        values = []
+
+        def _callback(message: servo.pubsub.Message) -> None:
+            values.append(message.json()["value"])
+            event.set()
+
+        exchange.create_subscriber("metrics", callback=_callback, replay="1m")
+        await asyncio.wait_for(event.wait(), 1)
+        assert values == [1]
+
+    async def test_replay_is_delivered_ahead_of_live_messages(
+        self, exchange: servo.pubsub.Exchange
+    ) -> None:
+        exchange.start()
+        channel = exchange.create_channel(
+            "metrics", retention=servo.pubsub.Retention(size=10)
+        )
+        for value in range(3):
+            await channel.publish(servo.pubsub.Message(json={"value": value}))
+        await exchange._queue.join()
+
+        values = []
+
+        async def _callback(message: servo.pubsub.Message) -> None:
+            await asyncio.sleep(0.01)
+            values.append(message.json()["value"])
+
+        subscriber = exchange.create_subscriber(
+            "metrics", callback=_callback, replay="1m"
+        )
+        await channel.publish(servo.pubsub.Message(json={"value": 3}))
+        await exchange._queue.join()
+        while subscriber._replayed is not None:
+            await asyncio.sleep(0.01)
+
+        assert values == [0, 1, 2, 3]
+
+    async def test_replay_is_delivered_once(
+        self, exchange: servo.pubsub.Exchange
+    ) -> None:
+        exchange.start()
+        channel = exchange.create_channel(
+            "metrics", retention=servo.pubsub.Retention(size=10)
+        )
+        await channel.publish(servo.pubsub.Message(text="one"))
+        await exchange._queue.join()
+
+        async with exchange.subscribe("metrics", replay="1m") as subscriber:
+            iterator = subscriber.__aiter__()
+            message, _ = await iterator.__anext__()
+            assert message.text == "one"
+            assert subscriber._replayed is None
+
+            late_iterator = subscriber.__aiter__()
+            await channel.publish(servo.pubsub.Message(text="two"))
+            message, _ = await late_iterator.__anext__()
+            assert message.text == "two"
+
     async def test_add_transformer(self, exchange: servo.pubsub.Exchange) -> None:
         transformer = servo.pubsub.Filter(lambda m, c: None)
         exchange.add_transformer(transformer)
@@ -1750,6 +2142,105 @@ class TestMixin:
         await asyncio.sleep(0.001)
 
 
+class TestBuffer:
+    @pytest.fixture
+    def channels(self, exchange: servo.pubsub.Exchange) -> List[servo.pubsub.Channel]:
+        return [
+            servo.pubsub.Channel(name=name, exchange=exchange)
+            for name in ("metrics", "logs")
+        ]
+
+    async def _fill(self, buffer, channels, *texts: str) -> None:
+        for index, text in enumerate(texts):
+            await buffer.put(
+                (servo.pubsub.Message(text=text), channels[index % len(channels)])
+            )
+
+    async def _drain(self, buffer) -> List[str]:
+        texts = []
+        while len(buffer):
+            message, _ = await buffer.get()
+            texts.append(message.text)
+        return texts
+
+    @pytest.mark.parametrize(
+        "overflow, expected",
+        [
+            (servo.pubsub.OverflowPolicy.drop_oldest, ["two", "three"]),
+            (servo.pubsub.OverflowPolicy.drop_newest, ["one", "two"]),
+            (servo.pubsub.OverflowPolicy.coalesce, ["two", "three"]),
+        ],
+    )
+    async def test_overflow(
+        self, channels, overflow: servo.pubsub.OverflowPolicy, expected: List[str]
+    ) -> None:
+        buffer = servo.pubsub._Buffer(2, overflow)
+        await self._fill(buffer, channels, "one", "two", "three")
+        assert buffer.dropped == 1
+        assert await self._drain(buffer) == expected
+
+    async def test_block_waits_for_space(self, channels) -> None:
+        buffer = servo.pubsub._Buffer(1, servo.pubsub.OverflowPolicy.block)
+        await self._fill(buffer, channels, "one")
+        put = asyncio.create_task(self._fill(buffer, channels, "two"))
+        await asyncio.sleep(0.01)
+        assert not put.done()
+
+        message, _ = await buffer.get()
+        assert message.text == "one"
+        await put
+        assert buffer.dropped == 0
+        assert await self._drain(buffer) == ["two"]
+
+    async def test_coalesce_preserves_order_across_channels(self, channels) -> None:
+        buffer = servo.pubsub._Buffer(3, servo.pubsub.OverflowPolicy.coalesce)
+        await self._fill(buffer, channels, "m1", "l1", "m2", "l2")
+        assert await self._drain(buffer) == ["m1", "m2", "l2"]
+
+    async def test_close_releases_readers(self) -> None:
+        buffer = servo.pubsub._Buffer()
+        get = asyncio.create_task(buffer.get())
+        await asyncio.sleep(0)
+        buffer.close()
+        assert await get is None
+
+
+class TestRetention:
+    def test_must_be_bounded(self) -> None:
+        with pytest.raises(
+            pydantic.ValidationError,
+            match="retention must be bounded by a size, period, or path",
+        ):
+            servo.pubsub.Retention()
+
+    def test_period_expires_messages(self) -> None:
+        buffer = servo.pubsub._RetentionBuffer(servo.pubsub.Retention(period="10s"))
+        now = time.time()
+        buffer.append(servo.pubsub.Message(text="old"), now - 60)
+        buffer.append(servo.pubsub.Message(text="new"), now)
+        assert [m.text for _, m in buffer.since(0)] == ["new"]
+
+    def test_mapped_buffer_wraps_and_evicts_oldest(self, tmp_path) -> None:
+        buffer = servo.pubsub._MappedRetentionBuffer(
+            servo.pubsub.Retention(path=tmp_path / "metrics.ring", capacity=512)
+        )
+        try:
+            for i in range(20):
+                buffer.append(
+                    servo.pubsub.Message(json={"value": i}, metadata={"i": str(i)}),
+                    float(i),
+                )
+
+            replayed = buffer.since(0)
+            values = [message.json()["value"] for _, message in replayed]
+            assert 0 < len(values) < 20
+            assert values == list(range(20 - len(values), 20))
+            assert replayed[-1][1].metadata == {"i": "19"}
+            assert replayed[-1][1].content_type == "application/json"
+        finally:
+            buffer.close()
+
+
 class CountDownLatch:
     def __init__(self, count=1):
         self._count = count
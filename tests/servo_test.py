@@ -1,10 +1,13 @@
 import asyncio
+import datetime
+import contextvars
 import json
 import os
+import queue
 import ssl
 from inspect import Signature
 from pathlib import Path
-from typing import List
+from typing import Any, List
 
 import httpx
 import pytest
@@ -32,6 +35,7 @@ from servo.connectors.vegeta import VegetaConnector
 from servo.errors import *
 from servo.events import (
     EventResult,
+    deadline_timeout,
     Preposition,
     _events,
     after_event,
@@ -42,7 +46,7 @@ from servo.events import (
 )
 from servo.servo import Events, Servo
 from servo.types import Control, Description, Measurement
-from tests.helpers import MeasureConnector, environment_overrides
+from tests.helpers import AdjustConnector, MeasureConnector, environment_overrides
 
 
 def test_version():
@@ -110,6 +114,57 @@ class SecondTestServoConnector(BaseConnector):
         pass
 
 
+_promotion_log: List[Any] = []
+
+
+class SlowPromotionConnector(BaseConnector):
+    @before_event(Events.promote)
+    async def prepare_promotion(self) -> None:
+        _promotion_log.append(f"{self.name} started")
+        await asyncio.sleep(0.1)
+        _promotion_log.append(f"{self.name} finished")
+
+
+class DependentPromotionConnector(BaseConnector):
+    @before_event(Events.promote, depends_on=["first"])
+    async def prepare_promotion(self) -> None:
+        _promotion_log.append(f"{self.name} started")
+
+
+class SlowPromoterConnector(BaseConnector):
+    @on_event(Events.promote)
+    async def promote(self) -> None:
+        await asyncio.sleep(0.1)
+
+
+class FastPromoterConnector(BaseConnector):
+    @on_event(Events.promote)
+    async def promote(self) -> None:
+        pass
+
+
+class DeadlineRecordingConnector(BaseConnector):
+    @on_event(Events.promote)
+    async def promote(self) -> None:
+        _promotion_log.append(deadline_timeout())
+
+
+class DeadlineRecordingMeasureConnector(BaseConnector):
+    @on_event(Events.measure)
+    async def measure(
+        self, *, metrics: List[str] = None, control: Control = Control()
+    ) -> Measurement:
+        _promotion_log.append(deadline_timeout())
+        return Measurement()
+
+
+class CancellingPromotionConnector(BaseConnector):
+    @before_event(Events.promote)
+    async def prepare_promotion(self) -> None:
+        await asyncio.sleep(0.01)
+        raise EventCancelledError("not today")
+
+
 @pytest.fixture()
 async def assembly(servo_yaml: Path) -> Assembly:
     config = {
@@ -210,6 +265,50 @@ def test_get_event_handlers_all(servo: servo) -> None:
     ]
 
 
+def test_event_handler_table(servo: servo) -> None:
+    connector = servo.get_connector("first_test_servo")
+    table = connector.event_handler_table()
+    assert [
+        handler.handler.__name__ for handler in table[("promote", Preposition.before)]
+    ] == ["run_before_promotion"]
+    assert connector.has_event_handlers(get_event("promote"), Preposition.after)
+    assert not connector.has_event_handlers(get_event("adjust"), Preposition.before)
+
+
+def test_event_handler_table_is_recompiled_on_added_handlers(servo: servo) -> None:
+    class TableConnector(BaseConnector):
+        pass
+
+    event = get_event("promote")
+    assert not TableConnector.has_event_handlers(event, Preposition.before)
+
+    async def fn(self) -> None:
+        pass
+
+    TableConnector.add_event_handler(event, Preposition.before, fn)
+    assert TableConnector.has_event_handlers(event, Preposition.before)
+
+
+_handler_context_var = contextvars.ContextVar("handler_context", default=None)
+
+
+class ContextMutatingConnector(BaseConnector):
+    @before_event(Events.promote)
+    async def prepare_promotion(self) -> None:
+        _promotion_log.append(_handler_context_var.get())
+        _handler_context_var.set(self.name)
+
+
+async def test_event_handlers_do_not_leak_context_variables() -> None:
+    servo_ = _promotion_servo(
+        ContextMutatingConnector(name="first", config=BaseConfiguration()),
+        ContextMutatingConnector(name="second", config=BaseConfiguration()),
+    )
+    await servo_.dispatch_event("promote")
+    assert _promotion_log == [None, None]
+    assert _handler_context_var.get() is None
+
+
 from servo.events import get_event
 
 
@@ -283,6 +382,148 @@ async def test_cancellation_of_event_from_before_handler(mocker, servo: servo):
     )
 
 
+def _promotion_servo(*connectors: BaseConnector) -> Servo:
+    _promotion_log.clear()
+    connectors = list(connectors)
+    return Servo(
+        config={"optimizer": Optimizer(id="dev.opsani.com/servox", token="1234556789")},
+        connectors=connectors,
+        __connectors__=connectors,
+    )
+
+
+async def test_before_handlers_run_sequentially_by_default() -> None:
+    servo_ = _promotion_servo(
+        SlowPromotionConnector(name="first", config=BaseConfiguration()),
+        SlowPromotionConnector(name="second", config=BaseConfiguration()),
+    )
+    await servo_.dispatch_event("promote")
+    assert _promotion_log == [
+        "first started",
+        "first finished",
+        "second started",
+        "second finished",
+    ]
+
+
+async def test_concurrent_before_handlers_respect_dependencies() -> None:
+    servo_ = _promotion_servo(
+        DependentPromotionConnector(name="dependent", config=BaseConfiguration()),
+        SlowPromotionConnector(name="first", config=BaseConfiguration()),
+        SlowPromotionConnector(name="second", config=BaseConfiguration()),
+    )
+    await servo_.dispatch_event("promote", concurrent_before=True)
+    assert _promotion_log[:2] == ["first started", "second started"]
+    assert _promotion_log.index("dependent started") > _promotion_log.index(
+        "first finished"
+    )
+
+
+async def test_concurrent_before_handlers_cancellation() -> None:
+    servo_ = _promotion_servo(
+        SlowPromotionConnector(name="first", config=BaseConfiguration()),
+        CancellingPromotionConnector(name="cancelling", config=BaseConfiguration()),
+    )
+    results = await servo_.dispatch_event("promote", concurrent_before=True)
+    assert results == []
+    assert _promotion_log == ["first started"]
+
+
+async def test_concurrent_before_handlers_circular_dependency() -> None:
+    servo_ = _promotion_servo(
+        DependentPromotionConnector(name="first", config=BaseConfiguration()),
+    )
+    with pytest.raises(ValueError, match="cycle"):
+        await servo_.dispatch_event("promote", concurrent_before=True)
+
+
+async def test_dispatch_event_as_completed() -> None:
+    servo_ = _promotion_servo(
+        SlowPromoterConnector(name="slow", config=BaseConfiguration()),
+        FastPromoterConnector(name="fast", config=BaseConfiguration()),
+    )
+    names = [
+        result.connector.name
+        async for result in servo_.dispatch_event_as_completed("promote")
+    ]
+    assert names == ["fast", "slow"]
+
+
+async def test_dispatch_event_as_completed_does_not_leak_current_servo() -> None:
+    servo_ = _promotion_servo(
+        SlowPromoterConnector(name="slow", config=BaseConfiguration()),
+        FastPromoterConnector(name="fast", config=BaseConfiguration()),
+    )
+    async for _ in servo_.dispatch_event_as_completed("promote"):
+        assert servox.current_servo() is None
+
+    assert servox.current_servo() is None
+
+
+async def test_dispatch_as_completed_cannot_run_twice() -> None:
+    connector = FastPromoterConnector(name="fast", config=BaseConfiguration())
+    _promotion_servo(connector)
+    dispatch = connector.dispatch_event("promote")
+    await dispatch
+    with pytest.raises(RuntimeError, match="Event dispatch has already run"):
+        async for _ in dispatch.as_completed():
+            pass
+
+
+async def test_handlers_are_cancelled_at_deadline() -> None:
+    servo_ = _promotion_servo(
+        SlowPromoterConnector(name="slow", config=BaseConfiguration()),
+        FastPromoterConnector(name="fast", config=BaseConfiguration()),
+    )
+    results = await servo_.dispatch_event(
+        "promote", deadline=datetime.timedelta(milliseconds=20), return_exceptions=True
+    )
+    outcomes = {result.connector.name: result.value for result in results}
+    assert outcomes["fast"] is None
+    assert isinstance(outcomes["slow"], EventDeadlineExceededError)
+
+
+async def test_deadline_is_exposed_to_handlers() -> None:
+    servo_ = _promotion_servo(
+        DeadlineRecordingConnector(name="recording", config=BaseConfiguration()),
+    )
+    await servo_.dispatch_event("promote")
+    await servo_.dispatch_event("promote", deadline=datetime.timedelta(seconds=10))
+    no_deadline, remaining = _promotion_log
+    assert no_deadline is None
+    assert 9 < remaining <= 10
+    assert deadline_timeout() is None
+
+
+async def test_deadlines_configured_per_event() -> None:
+    connector = DeadlineRecordingConnector(name="recording", config=BaseConfiguration())
+    servo_ = _promotion_servo(connector)
+    servo_.config.settings.deadlines = {"promote": Duration("30s")}
+    await servo_.dispatch_event("promote")
+    (remaining,) = _promotion_log
+    assert 29 < remaining <= 30
+
+
+async def test_measure_deadline_is_extended_by_control() -> None:
+    connector = DeadlineRecordingMeasureConnector(
+        name="recording", config=BaseConfiguration()
+    )
+    servo_ = _promotion_servo(connector)
+    servo_.config.settings.deadlines = {"measure": Duration("30s")}
+    await servo_.dispatch_event(
+        Events.measure, control=Control(warmup="10s", duration="1m", delay="5s")
+    )
+    (remaining,) = _promotion_log
+    assert 104 < remaining <= 105
+
+
+def test_dependencies_only_for_before_handlers() -> None:
+    with pytest.raises(
+        ValueError, match="dependencies can only be declared by before event handlers"
+    ):
+        on_event(Events.promote, depends_on=["first"])
+
+
 async def test_cannot_cancel_from_on_handlers_warning(mocker, servo: servo):
     connector = servo.get_connector("first_test_servo")
     event_handler = connector.get_event_handlers("promote", Preposition.on)[0]
@@ -1147,9 +1388,392 @@ class TestAssembly:
                                 },
                             ],
                         },
+                        "http2": {
+                            "title": "Http2",
+                            "env_names": [
+                                "COMMON_HTTP2",
+                            ],
+                            "type": "boolean",
+                        },
+                        "compression": {
+                            "title": "Compression",
+                            "env_names": [
+                                "COMMON_COMPRESSION",
+                            ],
+                            "type": "boolean",
+                        },
+                        "downsampling": {
+                            "title": "Downsampling",
+                            "env_names": [
+                                "COMMON_DOWNSAMPLING",
+                            ],
+                            "type": "array",
+                            "items": {
+                                "$ref": "#/definitions/DownsamplingConfiguration",
+                            },
+                        },
+                        "spool": {
+                            "title": "Spool",
+                            "env_names": [
+                                "COMMON_SPOOL",
+                            ],
+                            "allOf": [
+                                {
+                                    "$ref": "#/definitions/SpoolConfiguration",
+                                },
+                            ],
+                        },
+                        "normalization": {
+                            "env_names": [
+                                "COMMON_NORMALIZATION",
+                            ],
+                            "allOf": [
+                                {
+                                    "$ref": "#/definitions/NormalizationPolicy",
+                                },
+                            ],
+                        },
+                        "concurrent_before_handlers": {
+                            "title": "Concurrent Before Handlers",
+                            "env_names": [
+                                "COMMON_CONCURRENT_BEFORE_HANDLERS",
+                            ],
+                            "type": "boolean",
+                        },
+                        "deadlines": {
+                            "title": "Deadlines",
+                            "env_names": [
+                                "COMMON_DEADLINES",
+                            ],
+                            "type": "object",
+                            "additionalProperties": {
+                                "type": "string",
+                                "format": "duration",
+                                "pattern": (
+                                    "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)"
+                                    "?([\\d\\.]+us)?([\\d\\.]+ns)?"
+                                ),
+                                "examples": [
+                                    "300ms",
+                                    "5m",
+                                    "2h45m",
+                                    "72h3m0.5s",
+                                ],
+                            },
+                        },
+                        "progress_interval": {
+                            "title": "Progress Interval",
+                            "env_names": [
+                                "COMMON_PROGRESS_INTERVAL",
+                            ],
+                            "type": "string",
+                            "format": "duration",
+                            "pattern": (
+                                "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)"
+                                "?([\\d\\.]+us)?([\\d\\.]+ns)?"
+                            ),
+                            "examples": [
+                                "300ms",
+                                "5m",
+                                "2h45m",
+                                "72h3m0.5s",
+                            ],
+                        },
+                        "executor": {
+                            "title": "Executor",
+                            "env_names": [
+                                "COMMON_EXECUTOR",
+                            ],
+                            "allOf": [
+                                {
+                                    "$ref": "#/definitions/ExecutorConfiguration",
+                                },
+                            ],
+                        },
+                        "monitor": {
+                            "title": "Monitor",
+                            "env_names": [
+                                "COMMON_MONITOR",
+                            ],
+                            "allOf": [
+                                {
+                                    "$ref": "#/definitions/MonitorConfiguration",
+                                },
+                            ],
+                        },
+                        "tracing": {
+                            "title": "Tracing",
+                            "env_names": [
+                                "COMMON_TRACING",
+                            ],
+                            "allOf": [
+                                {
+                                    "$ref": "#/definitions/TracingConfiguration",
+                                },
+                            ],
+                        },
+                        "description_ttl": {
+                            "title": "Description Ttl",
+                            "env_names": [
+                                "COMMON_DESCRIPTION_TTL",
+                            ],
+                            "type": "string",
+                            "format": "duration",
+                            "pattern": (
+                                "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)"
+                                "?([\\d\\.]+us)?([\\d\\.]+ns)?"
+                            ),
+                            "examples": [
+                                "300ms",
+                                "5m",
+                                "2h45m",
+                                "72h3m0.5s",
+                            ],
+                        },
+                    },
+                    "additionalProperties": False,
+                },
+                "DownsamplingMode": {
+                    "title": "DownsamplingMode",
+                    "description": (
+                        "DownsamplingMode is an enumeration of the methods for reducing the number of data points\n"
+                        "in a time series.\n\n"
+                        "Members:\n"
+                        "    lttb: Data points are selected with the Largest-Triangle-Three-Buckets algorithm, preserving\n"
+                        "        the visual shape of the series including its peaks and troughs.\n"
+                        "    mean: Data points are aggregated into evenly sized buckets reported as the mean value at the\n"
+                        "        mean time of each bucket.\n"
+                        "    max: Data points are aggregated into evenly sized buckets reported as the maximum data point\n"
+                        "        of each bucket."
+                    ),
+                    "enum": ["lttb", "mean", "max"],
+                    "type": "string",
+                },
+                "DownsamplingConfiguration": {
+                    "title": "Downsampling Connector Configuration Schema",
+                    "description": (
+                        "DownsamplingConfiguration objects model the reduction of time series measured by connectors\n"
+                        "to a target number of data points before they are reported to the optimizer."
+                    ),
+                    "type": "object",
+                    "properties": {
+                        "mode": {
+                            "env_names": [
+                                "DOWNSAMPLING_MODE",
+                            ],
+                            "default": "lttb",
+                            "allOf": [
+                                {
+                                    "$ref": "#/definitions/DownsamplingMode",
+                                },
+                            ],
+                        },
+                        "target_points": {
+                            "title": "Target Points",
+                            "env_names": [
+                                "DOWNSAMPLING_TARGET_POINTS",
+                            ],
+                            "default": 500,
+                            "minimum": 3,
+                            "type": "integer",
+                        },
+                        "metrics": {
+                            "title": "Metrics",
+                            "env_names": [
+                                "DOWNSAMPLING_METRICS",
+                            ],
+                            "type": "array",
+                            "items": {
+                                "type": "string",
+                            },
+                        },
+                    },
+                    "additionalProperties": False,
+                },
+                "SpoolConfiguration": {
+                    "title": "Spool Connector Configuration Schema",
+                    "description": (
+                        "SpoolConfiguration objects model the durable local storage of measurement results until they have\n"
+                        "been acknowledged by the Opsani API."
+                    ),
+                    "type": "object",
+                    "properties": {
+                        "path": {
+                            "title": "Path",
+                            "env_names": [
+                                "SPOOL_PATH",
+                            ],
+                            "type": "string",
+                            "format": "path",
+                        },
+                        "max_entries": {
+                            "title": "Max Entries",
+                            "env_names": [
+                                "SPOOL_MAX_ENTRIES",
+                            ],
+                            "default": 100,
+                            "minimum": 1,
+                            "type": "integer",
+                        },
+                        "max_size": {
+                            "title": "Max Size",
+                            "env_names": [
+                                "SPOOL_MAX_SIZE",
+                            ],
+                            "default": 268435456,
+                            "type": "integer",
+                        },
+                    },
+                    "required": [
+                        "path",
+                    ],
+                    "additionalProperties": False,
+                },
+                "ExecutorConfiguration": {
+                    "title": "Executor Connector Configuration Schema",
+                    "description": (
+                        "ExecutorConfiguration objects model the shared thread pool that CPU heavy work on large payloads\n"
+                        "is offloaded to from the event loop."
+                    ),
+                    "type": "object",
+                    "properties": {
+                        "max_workers": {
+                            "title": "Max Workers",
+                            "env_names": [
+                                "EXECUTOR_MAX_WORKERS",
+                            ],
+                            "minimum": 1,
+                            "type": "integer",
+                        },
+                        "threshold": {
+                            "title": "Threshold",
+                            "default": "64.0KiB",
+                            "env_names": [
+                                "EXECUTOR_THRESHOLD",
+                            ],
+                            "type": "integer",
+                        },
+                    },
+                    "additionalProperties": False,
+                },
+                "MonitorConfiguration": {
+                    "title": "Monitor Connector Configuration Schema",
+                    "description": "MonitorConfiguration objects model the monitoring of the event loop for stalls and leaked tasks.",
+                    "type": "object",
+                    "properties": {
+                        "interval": {
+                            "title": "Interval",
+                            "default": "100ms",
+                            "env_names": [
+                                "MONITOR_INTERVAL",
+                            ],
+                            "type": "string",
+                            "format": "duration",
+                            "pattern": (
+                                "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)"
+                                "?([\\d\\.]+us)?([\\d\\.]+ns)?"
+                            ),
+                            "examples": [
+                                "300ms",
+                                "5m",
+                                "2h45m",
+                                "72h3m0.5s",
+                            ],
+                        },
+                        "threshold": {
+                            "title": "Threshold",
+                            "default": "100ms",
+                            "env_names": [
+                                "MONITOR_THRESHOLD",
+                            ],
+                            "type": "string",
+                            "format": "duration",
+                            "pattern": (
+                                "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)"
+                                "?([\\d\\.]+us)?([\\d\\.]+ns)?"
+                            ),
+                            "examples": [
+                                "300ms",
+                                "5m",
+                                "2h45m",
+                                "72h3m0.5s",
+                            ],
+                        },
+                        "report_interval": {
+                            "title": "Report Interval",
+                            "default": "1m",
+                            "env_names": [
+                                "MONITOR_REPORT_INTERVAL",
+                            ],
+                            "type": "string",
+                            "format": "duration",
+                            "pattern": (
+                                "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)"
+                                "?([\\d\\.]+us)?([\\d\\.]+ns)?"
+                            ),
+                            "examples": [
+                                "300ms",
+                                "5m",
+                                "2h45m",
+                                "72h3m0.5s",
+                            ],
+                        },
+                        "max_stalls": {
+                            "title": "Max Stalls",
+                            "default": 10,
+                            "env_names": [
+                                "MONITOR_MAX_STALLS",
+                            ],
+                            "minimum": 1,
+                            "type": "integer",
+                        },
                     },
                     "additionalProperties": False,
                 },
+                "TracingConfiguration": {
+                    "title": "Tracing Connector Configuration Schema",
+                    "description": "TracingConfiguration objects model the recording of timing spans of event handling and connector I/O.",
+                    "type": "object",
+                    "properties": {
+                        "enabled": {
+                            "title": "Enabled",
+                            "default": True,
+                            "env_names": [
+                                "TRACING_ENABLED",
+                            ],
+                            "type": "boolean",
+                        },
+                        "max_spans": {
+                            "title": "Max Spans",
+                            "default": 4096,
+                            "env_names": [
+                                "TRACING_MAX_SPANS",
+                            ],
+                            "minimum": 1,
+                            "type": "integer",
+                        },
+                    },
+                    "additionalProperties": False,
+                },
+                "NormalizationPolicy": {
+                    "title": "NormalizationPolicy",
+                    "description": (
+                        "NormalizationPolicy is an enumeration that describes how measurements\n"
+                        "are normalized before being reported to the optimizer.\n\n"
+                        "Members:\n"
+                        "    passthrough: Measurements are reported as is returned by the connectors\n"
+                        "        without applying any normalization routines.\n"
+                        "    intersect: Measurements are reduced to a common set of interesecting\n"
+                        "        time series data. Data points measured at times that do not have\n"
+                        "        data points across all time series in the measurement are dropped.\n"
+                        "    fill: Time series in the measurement are brought into alignment by\n"
+                        "        filling in data points at times measured by any time series in the\n"
+                        "        measurement, interpolating between the neighbouring data points of\n"
+                        "        each series and carrying the nearest value beyond its ends."
+                    ),
+                    "enum": ["passthrough", "intersect", "fill"],
+                    "type": "string",
+                },
                 "ErrorSeverity": {
                     "description": "ErrorSeverity is an enumeration the describes the severity of an error\nand establishes semantics about how it should be handled.",
                     "enum": ["warning", "common", "critical"],
@@ -1165,6 +1789,126 @@ class TestAssembly:
                     ],
                     "type": "string",
                 },
+                "FastFailMode": {
+                    "title": "FastFailMode",
+                    "description": "An enumeration of strategies for gathering SLO metrics during fast fail observation.",
+                    "enum": ["poll", "push"],
+                    "type": "string",
+                },
+                "FastFailConfiguration": {
+                    "title": "FastFailConfiguration",
+                    "description": "Configuration providing support for fast fail behavior which returns early\nfrom long running connector operations when SLO violations are observed",
+                    "type": "object",
+                    "properties": {
+                        "disabled": {
+                            "title": "Disabled",
+                            "default": 0,
+                            "env_names": ["disabled"],
+                            "minimum": 0,
+                            "maximum": 1,
+                            "multipleOf": 1,
+                            "type": "integer",
+                        },
+                        "mode": {
+                            "default": "poll",
+                            "env_names": ["mode"],
+                            "allOf": [{"$ref": "#/definitions/FastFailMode"}],
+                        },
+                        "period": {
+                            "title": "Period",
+                            "default": "60s",
+                            "env_names": ["period"],
+                            "type": "string",
+                            "format": "duration",
+                            "pattern": "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)?([\\d\\.]+us)?([\\d\\.]+ns)?",
+                            "examples": ["300ms", "5m", "2h45m", "72h3m0.5s"],
+                        },
+                        "span": {
+                            "title": "Span",
+                            "env_names": ["span"],
+                            "type": "string",
+                            "format": "duration",
+                            "pattern": "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)?([\\d\\.]+us)?([\\d\\.]+ns)?",
+                            "examples": ["300ms", "5m", "2h45m", "72h3m0.5s"],
+                        },
+                        "skip": {
+                            "title": "Skip",
+                            "default": 0,
+                            "env_names": ["skip"],
+                            "type": "string",
+                            "format": "duration",
+                            "pattern": "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)?([\\d\\.]+us)?([\\d\\.]+ns)?",
+                            "examples": ["300ms", "5m", "2h45m", "72h3m0.5s"],
+                        },
+                        "treat_zero_as_missing": {
+                            "title": "Treat Zero As Missing",
+                            "default": False,
+                            "env_names": ["treat_zero_as_missing"],
+                            "type": "boolean",
+                        },
+                    },
+                    "additionalProperties": False,
+                },
+                "ConvergenceConfiguration": {
+                    "title": "ConvergenceConfiguration",
+                    "description": "Configuration providing support for completing measurements early once the\nmeasured metrics have converged to a steady state",
+                    "type": "object",
+                    "properties": {
+                        "enabled": {
+                            "title": "Enabled",
+                            "default": False,
+                            "env_names": ["enabled"],
+                            "type": "boolean",
+                        },
+                        "metrics": {
+                            "title": "Metrics",
+                            "env_names": ["metrics"],
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "confidence": {
+                            "title": "Confidence",
+                            "default": 0.95,
+                            "env_names": ["confidence"],
+                            "exclusiveMinimum": 0,
+                            "exclusiveMaximum": 1,
+                            "type": "number",
+                        },
+                        "relative_width": {
+                            "title": "Relative Width",
+                            "default": 0.05,
+                            "env_names": ["relative_width"],
+                            "exclusiveMinimum": 0,
+                            "type": "number",
+                        },
+                        "min_samples": {
+                            "title": "Min Samples",
+                            "default": 10,
+                            "env_names": ["min_samples"],
+                            "minimum": 2,
+                            "type": "integer",
+                        },
+                        "stable_for": {
+                            "title": "Stable For",
+                            "default": "1m",
+                            "env_names": ["stable_for"],
+                            "type": "string",
+                            "format": "duration",
+                            "pattern": "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)?([\\d\\.]+us)?([\\d\\.]+ns)?",
+                            "examples": ["300ms", "5m", "2h45m", "72h3m0.5s"],
+                        },
+                        "period": {
+                            "title": "Period",
+                            "default": "15s",
+                            "env_names": ["period"],
+                            "type": "string",
+                            "format": "duration",
+                            "pattern": "([\\d\\.]+y)?([\\d\\.]+mm)?(([\\d\\.]+w)?[\\d\\.]+d)?([\\d\\.]+h)?([\\d\\.]+m)?([\\d\\.]+s)?([\\d\\.]+ms)?([\\d\\.]+us)?([\\d\\.]+ns)?",
+                            "examples": ["300ms", "5m", "2h45m", "72h3m0.5s"],
+                        },
+                    },
+                    "additionalProperties": False,
+                },
                 "VegetaConfiguration__other": {
                     "title": "Vegeta Connector Settings (named other)",
                     "description": "Configuration of the Vegeta connector",
@@ -1320,6 +2064,20 @@ class TestAssembly:
                                 "72h3m0.5s",
                             ],
                         },
+                        "fast_fail": {
+                            "title": "Fast Fail",
+                            "description": "Configuration of fast fail behavior. SLOs are evaluated against each Vegeta report as it is published.",
+                            "env_names": ["SERVO_OTHER_FAST_FAIL"],
+                            "allOf": [{"$ref": "#/definitions/FastFailConfiguration"}],
+                        },
+                        "convergence": {
+                            "title": "Convergence",
+                            "description": "Configuration of early completion behavior. Load generation is stopped once the metrics of the published Vegeta reports have converged.",
+                            "env_names": ["SERVO_OTHER_CONVERGENCE"],
+                            "allOf": [
+                                {"$ref": "#/definitions/ConvergenceConfiguration"}
+                            ],
+                        },
                     },
                     "required": ["rate"],
                     "additionalProperties": False,
@@ -1479,6 +2237,20 @@ class TestAssembly:
                                 "72h3m0.5s",
                             ],
                         },
+                        "fast_fail": {
+                            "title": "Fast Fail",
+                            "description": "Configuration of fast fail behavior. SLOs are evaluated against each Vegeta report as it is published.",
+                            "env_names": ["SERVO_VEGETA_FAST_FAIL"],
+                            "allOf": [{"$ref": "#/definitions/FastFailConfiguration"}],
+                        },
+                        "convergence": {
+                            "title": "Convergence",
+                            "description": "Configuration of early completion behavior. Load generation is stopped once the metrics of the published Vegeta reports have converged.",
+                            "env_names": ["SERVO_VEGETA_CONVERGENCE"],
+                            "allOf": [
+                                {"$ref": "#/definitions/ConvergenceConfiguration"}
+                            ],
+                        },
                     },
                     "required": ["rate"],
                     "additionalProperties": False,
@@ -1948,6 +2720,194 @@ async def test_proxy_utilization(proxies) -> None:
         assert transport._pool.proxy_origin == (b"http", b"localhost", 1234)
 
 
+async def test_runner_shares_api_client_with_servo() -> None:
+    optimizer = Optimizer(id="test.com/foo", token="12345")
+    servo = Servo(
+        config={"settings": CommonConfiguration(), "optimizer": optimizer},
+        connectors=[],
+    )
+    runner = servox.runner.ServoRunner(servo)
+    client = runner._open_api_client()
+    runner._api_client = client
+    assert servo.shared_api_client is client
+    assert runner.shared_api_client is client
+
+    for mixin in [runner, servo, servox.telemetry.DiagnosticsHandler(servo)]:
+        async with mixin.api_client_session() as session:
+            assert session is client
+        assert not client.is_closed
+
+    await runner._close_api_client()
+    assert client.is_closed
+    assert servo.shared_api_client is None
+    async with servo.api_client_session() as session:
+        assert session is not client
+
+
+async def test_runner_api_client_falls_back_without_http2(mocker) -> None:
+    optimizer = Optimizer(id="test.com/foo", token="12345")
+    servo = Servo(
+        config={"settings": CommonConfiguration(http2=True), "optimizer": optimizer},
+        connectors=[],
+    )
+    runner = servox.runner.ServoRunner(servo)
+    api_client = runner.api_client
+
+    def _api_client(self, **kwargs) -> httpx.AsyncClient:
+        if kwargs.get("http2"):
+            raise ImportError(
+                "Using http2=True, but the 'h2' package is not installed."
+            )
+        return api_client(**kwargs)
+
+    mocker.patch.object(servox.runner.ServoRunner, "api_client", new=_api_client)
+    client = runner._open_api_client()
+    try:
+        assert servo.shared_api_client is client
+    finally:
+        await client.aclose()
+
+
+class TestWorkerProcesses:
+    @pytest.fixture
+    def assembly(self) -> Assembly:
+        servos = [
+            Servo(
+                config={
+                    "optimizer": Optimizer(id=f"test.com/{name}", token="12345"),
+                },
+                connectors=[],
+            )
+            for name in ("foo", "bar")
+        ]
+        return Assembly(config_file=None, servos=servos)
+
+    def test_interactive_is_not_supported(self, assembly: Assembly) -> None:
+        with pytest.raises(ValueError, match="interactive mode is not supported"):
+            servox.runner.AssemblyRunner(assembly).run(interactive=True, processes=True)
+
+    def test_config_file_is_required(self, assembly: Assembly) -> None:
+        with pytest.raises(
+            ValueError, match="requires an assembly loaded from a config file"
+        ):
+            servox.runner.AssemblyRunner(assembly).run(processes=True)
+
+    def test_log_records_are_forwarded(self) -> None:
+        records = queue.Queue()
+        handler_id = servox.logger.add(
+            servox.runner._LogForwarder(records, "test.com/foo"),
+            format=servox.logging.DEFAULT_FORMATTER,
+        )
+        try:
+            servox.logger.info("Measuring... {curly}")
+            try:
+                raise RuntimeError("boom")
+            except RuntimeError:
+                servox.logger.exception("failed")
+        finally:
+            servox.logger.remove(handler_id)
+
+        record = records.get_nowait()
+        assert record["level"] == "INFO"
+        assert record["message"] == "Measuring... {curly}"
+        assert record["component"] == "test.com/foo(servo)"
+        assert record["function"] == "test_log_records_are_forwarded"
+
+        record = records.get_nowait()
+        assert record["level"] == "ERROR"
+        assert record["message"].startswith("failed\nTraceback")
+        assert "RuntimeError: boom" in record["message"]
+
+
+class TestDescriptionCache:
+    @pytest.fixture
+    async def runner(self) -> servox.runner.ServoRunner:
+        servo = Servo(
+            config={
+                "settings": CommonConfiguration(description_ttl="5m"),
+                "optimizer": Optimizer(id="test.com/foo", token="12345"),
+            },
+            connectors=[],
+        )
+        await servo.add_connector("adjust", AdjustConnector(config=BaseConfiguration()))
+        return servox.runner.ServoRunner(servo)
+
+    async def test_repeated_describe_is_cached(
+        self, runner: servox.runner.ServoRunner, mocker
+    ) -> None:
+        spy = mocker.spy(Servo, "dispatch_event_as_completed")
+        description = await runner.describe(Control())
+        assert await runner.describe(Control()) is description
+        assert spy.call_count == 1
+
+        # a different control is described anew
+        await runner.describe(Control(delay="1s"))
+        assert spy.call_count == 2
+
+    async def test_not_cached_without_ttl(
+        self, runner: servox.runner.ServoRunner, mocker
+    ) -> None:
+        runner.config.settings.description_ttl = None
+        spy = mocker.spy(Servo, "dispatch_event_as_completed")
+        await runner.describe(Control())
+        await runner.describe(Control())
+        assert spy.call_count == 2
+
+    async def test_expires_after_ttl(
+        self, runner: servox.runner.ServoRunner, mocker
+    ) -> None:
+        runner.config.settings.description_ttl = Duration(0)
+        spy = mocker.spy(Servo, "dispatch_event_as_completed")
+        await runner.describe(Control())
+        await runner.describe(Control())
+        assert spy.call_count == 2
+
+    async def test_invalidated_by_adjust(
+        self, runner: servox.runner.ServoRunner
+    ) -> None:
+        await runner.describe(Control())
+        await runner.adjust([], Control())
+        assert runner._description_cache is None
+
+    async def test_invalidated_by_config_change(
+        self, runner: servox.runner.ServoRunner, mocker
+    ) -> None:
+        spy = mocker.spy(Servo, "dispatch_event_as_completed")
+        await runner.describe(Control())
+        runner.config.settings.timeouts = Timeouts("30s")
+        await runner.describe(Control())
+        assert spy.call_count == 2
+
+    async def test_invalidated_by_connector_notification(
+        self, runner: servox.runner.ServoRunner
+    ) -> None:
+        runner.servo.pubsub_exchange.start()
+        runner._subscribe_to_description_changes()
+        try:
+            await runner.describe(Control())
+            assert runner._description_cache is not None
+
+            connector = runner.servo.get_connector("adjust")
+            await connector.notify_description_changed("deployment spec changed")
+
+            async def _wait_for_invalidation() -> None:
+                while runner._description_cache is not None:
+                    await asyncio.sleep(0.001)
+
+            await asyncio.wait_for(_wait_for_invalidation(), timeout=1)
+        finally:
+            runner._unsubscribe_from_description_changes()
+            await runner.servo.pubsub_exchange.shutdown()
+
+    async def test_notification_is_skipped_while_exchange_is_stopped(
+        self, runner: servox.runner.ServoRunner, mocker
+    ) -> None:
+        publish = mocker.spy(servox.pubsub.Exchange, "publish")
+        connector = runner.servo.get_connector("adjust")
+        await connector.notify_description_changed("adjusted")
+        publish.assert_not_called()
+
+
 def test_codename() -> None:
     assert __cryptonym__
 
@@ -0,0 +1,180 @@
+import pathlib
+
+import httpx
+import pytest
+import respx
+
+import servo
+import servo.api
+import servo.runner
+import servo.spool
+
+
+@pytest.fixture
+def spool_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    return tmp_path / "spool" / "measurements.db"
+
+
+@pytest.fixture
+def spool(spool_path: pathlib.Path) -> servo.spool.Spool:
+    spool = servo.spool.Spool(spool_path, max_entries=3, max_size=1024)
+    yield spool
+    spool.close()
+
+
+def test_append_and_acknowledge(spool: servo.spool.Spool) -> None:
+    first = spool.append("dev.opsani.com/servox", "MEASUREMENT", {"metrics": {}})
+    second = spool.append("dev.opsani.com/servox", "MEASUREMENT", {"metrics": {"a": 1}})
+    spool.append("dev.opsani.com/other", "MEASUREMENT", None)
+
+    pending = spool.pending("dev.opsani.com/servox")
+    assert [entry.id for entry in pending] == [first, second]
+    assert pending[1].event == "MEASUREMENT"
+    assert pending[1].param == {"metrics": {"a": 1}}
+
+    spool.acknowledge(first)
+    assert [entry.id for entry in spool.pending("dev.opsani.com/servox")] == [second]
+    assert len(spool) == 2
+
+
+def test_entries_survive_reopening(
+    spool: servo.spool.Spool, spool_path: pathlib.Path
+) -> None:
+    spool.append("dev.opsani.com/servox", "MEASUREMENT", {"metrics": {}})
+    spool.close()
+
+    reopened = servo.spool.Spool(spool_path, max_entries=3, max_size=1024)
+    try:
+        assert [entry.param for entry in reopened.pending("dev.opsani.com/servox")] == [
+            {"metrics": {}}
+        ]
+    finally:
+        reopened.close()
+
+
+def test_evicts_oldest_entries_beyond_max_entries(spool: servo.spool.Spool) -> None:
+    for index in range(5):
+        spool.append("dev.opsani.com/servox", "MEASUREMENT", {"index": index})
+
+    assert [
+        entry.param["index"] for entry in spool.pending("dev.opsani.com/servox")
+    ] == [
+        2,
+        3,
+        4,
+    ]
+
+
+def test_evicts_oldest_entries_beyond_max_size(spool: servo.spool.Spool) -> None:
+    for index in range(3):
+        spool.append("dev.opsani.com/servox", "MEASUREMENT", {"data": "x" * 400})
+
+    assert len(spool) == 2
+
+
+class TestServoRunnerSpooling:
+    @pytest.fixture
+    def servo_runner(
+        self, optimizer: servo.Optimizer, spool: servo.spool.Spool
+    ) -> servo.runner.ServoRunner:
+        runner = servo.runner.ServoRunner(
+            servo.Servo(
+                config=servo.BaseServoConfiguration(optimizer=optimizer),
+                connectors=[],
+            )
+        )
+        runner._spool = spool
+        return runner
+
+    @respx.mock
+    async def test_acknowledges_posted_event(
+        self, servo_runner: servo.runner.ServoRunner, spool: servo.spool.Spool
+    ) -> None:
+        respx.post(f"{servo_runner.optimizer.url}servo").mock(
+            return_value=httpx.Response(200, json={"status": "ok"})
+        )
+        await servo_runner._post_spooled_event(
+            servo.api.Events.measure, {"metrics": {}}
+        )
+        assert len(spool) == 0
+
+    @pytest.fixture
+    def responses(self, mocker) -> list:
+        # Stub posting events to the optimizer with a queue of responses or errors
+        responses = []
+
+        async def _post_event(self, event, param):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        mocker.patch.object(servo.runner.ServoRunner, "_post_event", _post_event)
+        return responses
+
+    @staticmethod
+    def _status_error(status_code: int) -> httpx.HTTPStatusError:
+        request = httpx.Request("POST", "https://api.opsani.com/servo")
+        return httpx.HTTPStatusError(
+            "error",
+            request=request,
+            response=httpx.Response(status_code, request=request),
+        )
+
+    async def test_replays_unacknowledged_events(
+        self,
+        servo_runner: servo.runner.ServoRunner,
+        spool: servo.spool.Spool,
+        responses: list,
+    ) -> None:
+        responses.extend(
+            [
+                self._status_error(503),
+                httpx.ConnectError(
+                    "unreachable",
+                    request=httpx.Request("POST", "https://api.opsani.com/servo"),
+                ),
+                servo.api.Status.ok(),
+            ]
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            await servo_runner._post_spooled_event(
+                servo.api.Events.measure, {"metrics": {"throughput": {"value": 1.0}}}
+            )
+        assert len(spool) == 1
+
+        # Transport errors stop the replay until the next attempt
+        await servo_runner._replay_spool()
+        assert len(spool) == 1
+
+        await servo_runner._replay_spool()
+        assert len(spool) == 0
+        assert not responses
+
+    async def test_discards_rejected_events(
+        self,
+        servo_runner: servo.runner.ServoRunner,
+        spool: servo.spool.Spool,
+        responses: list,
+    ) -> None:
+        optimizer_id = servo_runner.optimizer.id
+        spool.append(optimizer_id, "MEASUREMENT", {"index": 0})
+        spool.append(optimizer_id, "MEASUREMENT", {"index": 1})
+        spool.append(optimizer_id, "MEASUREMENT", {"index": 2})
+        responses.extend(
+            [
+                self._status_error(422),
+                self._status_error(429),
+            ]
+        )
+
+        # A rejected event is discarded while throttling stops the replay
+        await servo_runner._replay_spool()
+        assert [entry.param["index"] for entry in spool.pending(optimizer_id)] == [1, 2]
+
+        responses.append(self._status_error(400))
+        with pytest.raises(httpx.HTTPStatusError):
+            await servo_runner._post_spooled_event(
+                servo.api.Events.measure, {"index": 3}
+            )
+        assert [entry.param["index"] for entry in spool.pending(optimizer_id)] == [1, 2]
@@ -1,4 +1,5 @@
 import httpx
+import json
 import platform
 import respx
 
@@ -14,7 +15,11 @@ import servo.telemetry
 async def test_telemetry_hello(
     monkeypatch, optimizer: servo.configuration.Optimizer
 ) -> None:
-    expected = f'"telemetry": {{"servox.version": "{servo.__version__}", "servox.platform": "{platform.platform()}", "servox.namespace": "test-namespace"}}'
+    expected = {
+        "servox.version": servo.__version__,
+        "servox.platform": platform.platform(),
+        "servox.namespace": "test-namespace",
+    }
 
     # Simulate running as a k8s pod
     monkeypatch.setenv("POD_NAMESPACE", "test-namespace")
@@ -42,7 +47,9 @@ async def test_telemetry_hello(
     )
 
     assert request.called
-    assert expected in request.calls.last.request.content.decode()
+    assert json.loads(request.calls.last.request.content)["param"]["telemetry"] == (
+        expected
+    )
 
 
 class TestDiagnosticStates:
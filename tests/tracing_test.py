@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+import servo
+import servo.tracing
+import tests.helpers
+
+
+@pytest.fixture
+def tracer() -> servo.tracing.Tracer:
+    return servo.tracing.Tracer(max_spans=3)
+
+
+def test_nested_spans(tracer: servo.tracing.Tracer) -> None:
+    with tracer.span("parent", "test"):
+        with tracer.span("child", "test", key="value"):
+            pass
+
+    child, parent = tracer.spans
+    assert child.name == "child"
+    assert child.attributes == {"key": "value"}
+    assert child.parent_id == parent.span_id
+    assert child.trace_id == parent.trace_id
+    assert parent.parent_id is None
+    assert parent.duration >= child.duration
+
+
+def test_span_outcomes(tracer: servo.tracing.Tracer) -> None:
+    with pytest.raises(ValueError):
+        with tracer.span("failing"):
+            raise ValueError("boom")
+    with pytest.raises(servo.errors.EventCancelledError):
+        with tracer.span("cancelled"):
+            raise servo.errors.EventCancelledError()
+
+    failing, cancelled = tracer.spans
+    assert failing.outcome == "error"
+    assert failing.attributes["error"] == "ValueError: boom"
+    assert cancelled.outcome == "cancelled"
+
+
+def test_ring_buffer(tracer: servo.tracing.Tracer) -> None:
+    for i in range(5):
+        with tracer.span(f"span-{i}"):
+            pass
+
+    assert [span.name for span in tracer.spans] == ["span-2", "span-3", "span-4"]
+    assert len(tracer.export(limit=2)["traceEvents"]) == 2
+
+
+def test_configure(tracer: servo.tracing.Tracer) -> None:
+    for i in range(3):
+        with tracer.span(f"span-{i}"):
+            pass
+
+    tracer.configure(max_spans=2)
+    assert tracer.max_spans == 2
+    assert [span.name for span in tracer.spans] == ["span-1", "span-2"]
+
+    tracer.configure(enabled=False, max_spans=2)
+    with tracer.span("ignored") as attributes:
+        attributes["key"] = "value"
+    assert [span.name for span in tracer.spans] == ["span-1", "span-2"]
+
+
+def test_chrome_export(tracer: servo.tracing.Tracer) -> None:
+    with tracer.span("work", "test", connector="measure"):
+        pass
+
+    (event,) = tracer.export(servo.tracing.TraceFormat.chrome)["traceEvents"]
+    assert event["name"] == "work"
+    assert event["cat"] == "test"
+    assert event["ph"] == "X"
+    assert event["args"] == {"connector": "measure", "outcome": "ok"}
+
+
+def test_otlp_export(tracer: servo.tracing.Tracer) -> None:
+    with tracer.span("parent"):
+        with tracer.span("child", count=3):
+            pass
+
+    export = tracer.export(servo.tracing.TraceFormat.otlp)
+    child, parent = export["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert len(child["traceId"]) == 32
+    assert child["parentSpanId"] == parent["spanId"]
+    assert parent["parentSpanId"] == ""
+    assert {"key": "count", "value": {"intValue": "3"}} in child["attributes"]
+    assert child["status"] == {"code": 1}
+
+
+async def test_traced_decorator() -> None:
+    @servo.tracing.traced("test")
+    async def work() -> int:
+        await asyncio.sleep(0)
+        return 42
+
+    servo.tracing.tracer.clear()
+    assert await work() == 42
+    (span,) = servo.tracing.tracer.spans
+    assert span.category == "test"
+    assert span.name.endswith("work")
+
+
+async def test_event_dispatch_is_traced() -> None:
+    connector = tests.helpers.MeasureConnector(config=servo.BaseConfiguration())
+    servo.tracing.tracer.clear()
+    await connector.dispatch_event(servo.Events.measure)
+
+    spans = {span.name: span for span in servo.tracing.tracer.spans}
+    dispatch = spans["dispatch:measure"]
+    assert spans["before:measure"].parent_id == dispatch.span_id
+    assert spans["on:measure"].parent_id == dispatch.span_id
+    assert dispatch.attributes == {"event": "measure", "connectors": 1}
+    assert spans["on:measure"].attributes == {
+        "connector": connector.name,
+        "event": "measure",
+        "preposition": "on",
+    }
@@ -0,0 +1,40 @@
+import threading
+
+import pytest
+
+import servo.utilities.executor
+
+
+@pytest.fixture(autouse=True)
+def reset_executor():
+    yield
+    servo.utilities.executor.configure_executor()
+    servo.utilities.executor.shutdown_executor()
+
+
+async def test_offload_runs_in_worker_thread():
+    name = await servo.utilities.executor.offload(
+        lambda: threading.current_thread().name
+    )
+    assert name.startswith("servo-offload")
+
+
+async def test_offload_runs_small_payloads_inline():
+    name = await servo.utilities.executor.offload(
+        lambda: threading.current_thread().name, size=1
+    )
+    assert name == threading.current_thread().name
+
+
+async def test_offload_threshold_is_configurable():
+    servo.utilities.executor.configure_executor(max_workers=1, threshold=0)
+    name = await servo.utilities.executor.offload(
+        lambda: threading.current_thread().name, size=1
+    )
+    assert name.startswith("servo-offload")
+
+
+async def test_offload_passes_arguments_and_raises():
+    assert await servo.utilities.executor.offload(divmod, 7, 2) == (3, 1)
+    with pytest.raises(ZeroDivisionError):
+        await servo.utilities.executor.offload(divmod, 1, 0)